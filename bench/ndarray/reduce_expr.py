@@ -25,6 +25,8 @@ atol = 1e-5 if dtype == np.float32 else 1e-16
 
 # Axis to reduce
 laxis = (None, 0, 1, 2, (0, 2))
+# Number of threads for the chunk-parallel reduction
+lnworkers = (1, 2, 4, 8)
 
 # cparams defaults
 blosc2.cparams_dflts["codec"] = blosc2.Codec.LZ4
@@ -66,6 +68,18 @@ for axis in laxis:
     print("LazyExpr+eval took %.3f s" % (time() - t0))
     # Check
     np.testing.assert_allclose(d[()], npres, rtol=rtol, atol=atol)
+
+    # Reduce with Blosc2 in a single step, using different number of threads
+    res0 = None
+    for nworkers in lnworkers:
+        t0 = time()
+        d = c.sum(axis=axis, nworkers=nworkers)
+        print(f"LazyExpr+sum (nworkers={nworkers}) took {time() - t0:.3f} s")
+        # Check (results must not depend on the number of threads)
+        np.testing.assert_allclose(d[()], npres, rtol=rtol, atol=atol)
+        if res0 is None:
+            res0 = d
+        np.testing.assert_array_equal(d, res0)
     # t0 = time()
     # d = c[:]
     # print("LazyExpr+getitem took %.3f s" % (time() - t0))
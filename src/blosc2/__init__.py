@@ -227,13 +227,22 @@ from .ndarray import (
 from .c2array import c2context, C2Array, URLPath
 
 from .lazyexpr import (
+    GroupBy,
     LazyExpr,
     lazyudf,
     lazyexpr,
+    compute_many,
     LazyArray,
     _open_lazyarray,
     get_expr_operands,
     validate_expr,
+    bcast_dflts,
+    ne_cache_dflts,
+    overlap_dflts,
+    prefetch_dflts,
+    result_cache_dflts,
+    sort_dflts,
+    stage_dflts,
 )
 from .proxy import Proxy, ProxySource, ProxyNDSource, ProxyNDField
 
@@ -276,6 +285,7 @@ Disable the overloaded equal operator.
 # Delayed imports for avoiding overwriting of python builtins
 from .ndarray import (
     abs,
+    aggregate,
     all,
     any,
     arccos,
@@ -285,12 +295,22 @@ from .ndarray import (
     arctan,
     arctan2,
     arctanh,
+    argmax,
+    argmin,
+    argsort,
+    bincount,
     conj,
     contains,
     cos,
     cosh,
+    cummax,
+    cummin,
+    cumprod,
+    cumsum,
+    describe,
     exp,
     expm1,
+    histogram,
     imag,
     lazywhere,
     log,
@@ -303,11 +323,13 @@ from .ndarray import (
     real,
     sin,
     sinh,
+    sort,
     sqrt,
     std,
     sum,
     tan,
     tanh,
+    topk,
     var,
     where,
 )
@@ -324,11 +346,13 @@ __all__ = [
     "SChunk",
     "Storage",
     "__version__",
+    "bcast_dflts",
     "clib_info",
     "compress",
     "compress2",
     "compressor_list",
     "compute_chunks_blocks",
+    "compute_many",
     "cparams_dflts",
     "cpu_info",
     "decompress",
@@ -344,18 +368,24 @@ __all__ = [
     "lazyudf",
     "lazywhere",
     "load_array",
+    "ne_cache_dflts",
     "nthreads",
     "open",
+    "overlap_dflts",
     "pack",
     "pack_array",
     "pack_array2",
+    "prefetch_dflts",
     "print_versions",
     "remove_urlpath",
+    "result_cache_dflts",
     "save_array",
     "set_blocksize",
     "set_compressor",
     "set_nthreads",
     "set_releasegil",
+    "sort_dflts",
+    "stage_dflts",
     "storage_dflts",
     "unpack",
     "unpack_array",
@@ -366,7 +366,7 @@ cdef extern from "blosc2.h":
     int64_t blosc2_schunk_fill_special(blosc2_schunk *schunk, int64_t nitems, int special_value,
                                        int32_t chunksize);
 
-    int64_t blosc2_schunk_append_buffer(blosc2_schunk *schunk, void *src, int32_t nbytes)
+    int64_t blosc2_schunk_append_buffer(blosc2_schunk *schunk, void *src, int32_t nbytes) nogil
     int blosc2_schunk_decompress_chunk(blosc2_schunk *schunk, int64_t nchunk, void *dest, int32_t nbytes)
 
     int blosc2_schunk_get_chunk(blosc2_schunk *schunk, int64_t nchunk, uint8_t ** chunk,
@@ -380,6 +380,12 @@ cdef extern from "blosc2.h":
     int blosc2_schunk_reorder_offsets(blosc2_schunk *schunk, int64_t *offsets_order)
     int64_t blosc2_schunk_frame_len(blosc2_schunk* schunk)
 
+    int blosc2_chunk_zeros(blosc2_cparams cparams, const int32_t nbytes,
+                           void *dest, int32_t destsize)
+    int blosc2_chunk_nans(blosc2_cparams cparams, const int32_t nbytes,
+                          void *dest, int32_t destsize)
+    int blosc2_chunk_uninit(blosc2_cparams cparams, const int32_t nbytes,
+                            void *dest, int32_t destsize)
     int blosc2_chunk_repeatval(blosc2_cparams cparams, const int32_t nbytes,
                                void *dest, int32_t destsize, const void *repeatval)
 
@@ -520,6 +526,14 @@ ctypedef struct user_filters_udata:
     int output_cdtype
     int32_t chunkshape
 
+# Native (e.g. numba cfunc) filters; they are called without the GIL
+ctypedef int (*native_filter_fn)(const void *input, void *output, int64_t nitems, int64_t offset) noexcept nogil
+
+ctypedef struct native_filter_udata:
+    char* py_func
+    native_filter_fn func
+    int32_t chunkshape
+
 ctypedef struct filler_udata:
     char* py_func
     uintptr_t inputs_id
@@ -693,8 +707,8 @@ cdef _check_cparams(blosc2_cparams *cparams):
             if ufilters[i] and cparams.filters[i] in blosc2.ufilters_registry.keys():
                 raise ValueError("Cannot use multi-threading with user defined Python filters")
 
-        if cparams.prefilter != NULL:
-            raise ValueError("`nthreads` must be 1 when a prefilter is set")
+        if cparams.prefilter != NULL and cparams.prefilter != <blosc2_prefilter_fn> native_prefilter:
+            raise ValueError("`nthreads` must be 1 when a (non-native) prefilter is set")
 
 cdef _check_dparams(blosc2_dparams* dparams, blosc2_cparams* cparams=NULL):
     if cparams == NULL:
@@ -710,8 +724,8 @@ cdef _check_dparams(blosc2_dparams* dparams, blosc2_cparams* cparams=NULL):
             if ufilters[i] and cparams.filters[i] in blosc2.ufilters_registry.keys():
                 raise ValueError("Cannot use multi-threading with user defined Python filters")
 
-        if dparams.postfilter != NULL:
-            raise ValueError("`nthreads` must be 1 when a postfilter is set")
+        if dparams.postfilter != NULL and dparams.postfilter != <blosc2_postfilter_fn> native_postfilter:
+            raise ValueError("`nthreads` must be 1 when a (non-native) postfilter is set")
 
 
 cdef create_cparams_from_kwargs(blosc2_cparams *cparams, kwargs):
@@ -1156,7 +1170,12 @@ cdef class SChunk:
     def append_data(self, data):
         cdef Py_buffer *buf = <Py_buffer *> malloc(sizeof(Py_buffer))
         PyObject_GetBuffer(data, buf, PyBUF_SIMPLE)
-        rc = blosc2_schunk_append_buffer(self.schunk, buf.buf, <int32_t> buf.len)
+        cdef int64_t rc
+        if RELEASEGIL:
+            with nogil:
+                rc = blosc2_schunk_append_buffer(self.schunk, buf.buf, <int32_t> buf.len)
+        else:
+            rc = blosc2_schunk_append_buffer(self.schunk, buf.buf, <int32_t> buf.len)
         PyBuffer_Release(buf)
         free(buf)
         if rc < 0:
@@ -1213,6 +1232,58 @@ cdef class SChunk:
 
         return self.nchunks
 
+    def update_special(self, nchunk, special_value, value):
+        # Create a special chunk (a header only chunk) covering as many bytes as the current one
+        cdef uint8_t *current
+        cdef c_bool needs_free
+        cdef int32_t nbytes
+        cdef int32_t cbytes
+        cdef int32_t blocksize
+        rc = blosc2_schunk_get_chunk(self.schunk, nchunk, &current, &needs_free)
+        if rc < 0:
+            raise RuntimeError("Error while getting the chunk")
+        rc = blosc2_cbuffer_sizes(current, &nbytes, &cbytes, &blocksize)
+        if needs_free:
+            free(current)
+        if rc < 0:
+            raise RuntimeError("Error while getting the chunk sizes")
+
+        cdef blosc2_cparams *cparams = self.schunk.storage.cparams
+        cdef int32_t chunksize = BLOSC_EXTENDED_HEADER_LENGTH + self.typesize
+        cdef uint8_t *chunk = <uint8_t *> malloc(chunksize)
+        cdef Py_buffer *buf
+        if special_value == 1:
+            rc = blosc2_chunk_zeros(dereference(cparams), nbytes, chunk, chunksize)
+        elif special_value == 2:
+            rc = blosc2_chunk_nans(dereference(cparams), nbytes, chunk, chunksize)
+        elif special_value == 3:
+            if isinstance(value, bytes):
+                array = value
+            elif isinstance(value, int):
+                array = np.array(value, dtype='i' + str(self.typesize))
+            elif isinstance(value, float):
+                array = np.array(value, dtype='f' + str(self.typesize))
+            else:
+                array = np.ascontiguousarray(value)
+            if len(memoryview(array).cast('B')) != self.typesize:
+                free(chunk)
+                raise ValueError("value size in bytes must match with typesize")
+            buf = <Py_buffer *> malloc(sizeof(Py_buffer))
+            PyObject_GetBuffer(array, buf, PyBUF_SIMPLE)
+            rc = blosc2_chunk_repeatval(dereference(cparams), nbytes, chunk, chunksize, buf.buf)
+            PyBuffer_Release(buf)
+            free(buf)
+        else:
+            rc = blosc2_chunk_uninit(dereference(cparams), nbytes, chunk, chunksize)
+        if rc < 0:
+            free(chunk)
+            raise RuntimeError("Problems when creating the special chunk")
+        rc = blosc2_schunk_update_chunk(self.schunk, nchunk, chunk, True)
+        free(chunk)
+        if rc < 0:
+            raise RuntimeError("Could not update the desired chunk")
+        return rc
+
     def decompress_chunk(self, nchunk, dst=None):
         cdef uint8_t *chunk
         cdef c_bool needs_free
@@ -1361,6 +1432,49 @@ cdef class SChunk:
             raise RuntimeError("Could not update the desired chunk")
         return rc
 
+    def _fill_prefilter(self, func, nthreads):
+        # Compress every chunk with the blocks computed by ``func(nchunk, nblock, output)``
+        # inside a prefilter.  As the prefilter acquires the GIL by itself, a private
+        # context is used, and compression happens without the GIL, so `nthreads` can be > 1.
+        cdef blosc2_cparams cparams = dereference(self.schunk.storage.cparams)
+        cdef blosc2_prefilter_params preparams
+        # The chunk number in the prefilter params is not the one in the schunk, so pass it too
+        state = [func, 0]
+        preparams.user_data = <void *> state
+        cparams.prefilter = <blosc2_prefilter_fn> block_prefilter
+        cparams.preparams = &preparams
+        cparams.nthreads = nthreads
+        cdef blosc2_context *cctx = blosc2_create_cctx(cparams)
+        if cctx == NULL:
+            raise RuntimeError("Could not create compression context")
+
+        cdef int32_t chunksize = self.schunk.chunksize
+        cdef int32_t len_chunk = chunksize + BLOSC2_MAX_OVERHEAD
+        # The prefilter fills the blocks, so the contents of the source do not matter
+        cdef uint8_t *src = <uint8_t *> malloc(chunksize)
+        cdef uint8_t *chunk
+        cdef int size
+        cdef int64_t rc
+        try:
+            for nchunk in range(self.schunk.nchunks):
+                state[1] = nchunk
+                chunk = <uint8_t *> malloc(len_chunk)
+                with nogil:
+                    size = blosc2_compress_ctx(cctx, src, chunksize, chunk, len_chunk)
+                if size <= 0:
+                    free(chunk)
+                    if func.error is not None:
+                        raise func.error
+                    raise RuntimeError("Could not compress the data")
+                chunk = <uint8_t *> realloc(chunk, size)
+                rc = blosc2_schunk_update_chunk(self.schunk, nchunk, chunk, False)
+                if rc < 0:
+                    free(chunk)
+                    raise RuntimeError("Could not update the desired chunk")
+        finally:
+            free(src)
+            blosc2_free_ctx(cctx)
+
     def get_slice(self, start=0, stop=None, out=None):
         cdef int64_t nitems = self.schunk.nbytes // self.schunk.typesize
         start, stop, _ = slice(start, stop, 1).indices(nitems)
@@ -1534,6 +1648,28 @@ cdef class SChunk:
             # Avoid creating new dctx when calling this from the __dealloc__
             self.schunk.dctx = NULL
 
+    def _set_native_postfilter(self, func, address, func_name):
+        blosc2.postfilter_funcs[func_name] = func
+        func_id = func_name.encode("utf-8")
+
+        cdef blosc2_dparams* dparams = self.schunk.storage.dparams
+        dparams.postfilter = <blosc2_postfilter_fn> native_postfilter
+        cdef blosc2_postfilter_params* postparams = <blosc2_postfilter_params *> malloc(sizeof(blosc2_postfilter_params))
+        cdef native_filter_udata* postf_udata = <native_filter_udata *> malloc(sizeof(native_filter_udata))
+        postf_udata.py_func = <char *> malloc(strlen(func_id) + 1)
+        strcpy(postf_udata.py_func, func_id)
+        postf_udata.func = <native_filter_fn> <uintptr_t> address
+        postf_udata.chunkshape = self.schunk.chunksize // self.schunk.typesize
+
+        postparams.user_data = postf_udata
+        dparams.postparams = postparams
+        _check_dparams(dparams, self.schunk.storage.cparams)
+
+        blosc2_free_ctx(self.schunk.dctx)
+        self.schunk.dctx = blosc2_create_dctx(dereference(dparams))
+        if self.schunk.dctx == NULL:
+            raise RuntimeError("Could not create decompression context")
+
     def _set_filler(self, func, inputs_id, dtype_output):
         if self.schunk.storage.cparams.nthreads > 1:
             raise AttributeError("compress `nthreads` must be 1 when assigning a prefilter")
@@ -1596,6 +1732,28 @@ cdef class SChunk:
         if self.schunk.cctx == NULL:
             raise RuntimeError("Could not create compression context")
 
+    def _set_native_prefilter(self, func, address, func_name):
+        blosc2.prefilter_funcs[func_name] = func
+        func_id = func_name.encode("utf-8")
+
+        cdef blosc2_cparams* cparams = self.schunk.storage.cparams
+        cparams.prefilter = <blosc2_prefilter_fn> native_prefilter
+        cdef blosc2_prefilter_params* preparams = <blosc2_prefilter_params *> malloc(sizeof(blosc2_prefilter_params))
+        cdef native_filter_udata* pref_udata = <native_filter_udata *> malloc(sizeof(native_filter_udata))
+        pref_udata.py_func = <char *> malloc(strlen(func_id) + 1)
+        strcpy(pref_udata.py_func, func_id)
+        pref_udata.func = <native_filter_fn> <uintptr_t> address
+        pref_udata.chunkshape = self.schunk.chunksize // self.schunk.typesize
+
+        preparams.user_data = pref_udata
+        cparams.preparams = preparams
+        _check_cparams(cparams)
+
+        blosc2_free_ctx(self.schunk.cctx)
+        self.schunk.cctx = blosc2_create_cctx(dereference(cparams))
+        if self.schunk.cctx == NULL:
+            raise RuntimeError("Could not create compression context")
+
     cpdef remove_prefilter(self, func_name, _new_ctx=True):
         if func_name is not None:
             del blosc2.prefilter_funcs[func_name]
@@ -1641,6 +1799,19 @@ cdef int general_postfilter(blosc2_postfilter_params *params):
     return 0
 
 
+# Native filters do not need the GIL, so they can be run by several threads
+cdef int native_postfilter(blosc2_postfilter_params *params) noexcept nogil:
+    cdef native_filter_udata *udata = <native_filter_udata *> params.user_data
+    cdef int64_t offset = params.nchunk * udata.chunkshape + params.offset // params.typesize
+    return udata.func(params.input, params.output, params.size // params.typesize, offset)
+
+
+cdef int native_prefilter(blosc2_prefilter_params *params) noexcept nogil:
+    cdef native_filter_udata *udata = <native_filter_udata *> params.user_data
+    cdef int64_t offset = params.nchunk * udata.chunkshape + params.output_offset // params.output_typesize
+    return udata.func(params.input, params.output, params.output_size // params.output_typesize, offset)
+
+
 # filler
 cdef int general_filler(blosc2_prefilter_params *params):
     cdef filler_udata *udata = <filler_udata *> params.user_data
@@ -1745,6 +1916,17 @@ cdef int aux_udf(udf_udata *udata, int64_t nchunk, int32_t nblock,
     return 0
 
 
+cdef int block_prefilter(blosc2_prefilter_params *params) noexcept with gil:
+    # Unlike the other prefilters, this one can be called from the compression threads
+    cdef np.npy_intp size = params.output_size
+    output = np.PyArray_SimpleNewFromData(1, &size, np.NPY_UINT8, params.output)
+    func, nchunk = <object> params.user_data
+    try:
+        return func(nchunk, params.nblock, output)
+    except BaseException:
+        return -1
+
+
 cdef int general_udf_prefilter(blosc2_prefilter_params *params):
     cdef udf_udata *udata = <udf_udata *> params.user_data
     return aux_udf(udata, params.nchunk, params.nblock, False, params.output, params.output_typesize)
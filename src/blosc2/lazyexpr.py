@@ -9,19 +9,24 @@
 from __future__ import annotations
 
 import ast
-import asyncio
 import concurrent.futures
+import contextlib
 import copy
+import itertools
 import math
+import operator
 import os
 import pathlib
 import re
 import sys
+import tempfile
 import threading
+import warnings
+import weakref
 from abc import ABC, abstractmethod
+from collections import OrderedDict, deque
 from enum import Enum
 from pathlib import Path
-from queue import Empty, Queue
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -36,7 +41,7 @@ import numpy as np
 import blosc2
 from blosc2 import compute_chunks_blocks
 from blosc2.info import InfoReporter
-from blosc2.ndarray import _check_allowed_dtypes, get_chunks_idx
+from blosc2.ndarray import _check_allowed_dtypes, get_chunks_idx, get_intersecting_nchunks
 
 
 def is_inside_eval():
@@ -68,6 +73,28 @@ class ReduceOp(Enum):
     MIN = np.minimum
     ANY = np.any
     ALL = np.all
+    # Positional reductions: only the best candidates (and their positions) are kept for
+    # every output item while traversing the chunks
+    ARGMAX = np.argmax
+    ARGMIN = np.argmin
+    TOPK = np.partition
+    # Binning reductions: the counts of every chunk are added up
+    HISTOGRAM = np.histogram
+    BINCOUNT = np.bincount
+
+
+# The reductions supported by LazyExpr.aggregate
+aggregate_ops = {
+    "sum": ReduceOp.SUM,
+    "prod": ReduceOp.PROD,
+    "mean": ReduceOp.MEAN,
+    "std": ReduceOp.STD,
+    "var": ReduceOp.VAR,
+    "min": ReduceOp.MIN,
+    "max": ReduceOp.MAX,
+    "any": ReduceOp.ANY,
+    "all": ReduceOp.ALL,
+}
 
 
 class LazyArrayEnum(Enum):
@@ -94,6 +121,18 @@ class LazyArray(ABC):
         kwargs: dict, optional
             Keyword arguments that are supported by the :func:`empty` constructor.
             These arguments will be set in the resulting :ref:`NDArray`.
+            Additionally, the following keyword arguments are supported:
+
+            nworkers: int, optional
+                The number of threads that evaluate chunks in parallel.  Each worker
+                decompresses, evaluates and compresses its own chunk, while the results
+                are still written in order.  Default is 1 (serial evaluation).
+            block_eval: bool, optional
+                If True, string expressions whose operands are all NDArray objects with
+                the same shape, chunks and blocks are evaluated block by block, inside the
+                compression of the result (and using the threads in its `cparams`).  This
+                keeps the working set of every step in the CPU caches.  Otherwise, this is
+                ignored.  Default is False.
 
         Returns
         -------
@@ -174,6 +213,18 @@ class LazyArray(ABC):
 
         Parameters
         ----------
+        materialize: bool, optional
+            Whether to store the outcome of the :ref:`LazyExpr` too, as a materialized view
+            that can be read from the `array` attribute after opening it.  The view can be
+            brought up to date with :meth:`LazyExpr.refresh`, which only computes the chunks
+            depending on chunks of the operands that changed.  All the operands must be
+            :ref:`NDArray` instances.  Default is False.
+
+            Note that this writes to the operands too, as they start keeping the write
+            stamps of their chunks (in a hidden entry of their `vlmeta`).  Operands opened
+            with ``mode="r"`` cannot keep them, so the whole outcome is computed again when
+            refreshing (a warning is issued).  For refreshing in another session, flush the
+            stamps of the operands (see :meth:`SChunk.flush_tracking`) after writing them.
         kwargs: dict, optional
             Keyword arguments that are supported by the :func:`empty` constructor.
             The `urlpath` must always be provided.
@@ -339,6 +390,9 @@ _blacklist_re = re.compile("|".join(validation_patterns))
 # Define valid method names
 valid_methods = {"sum", "prod", "min", "max", "std", "mean", "var", "any", "all", "where"}
 
+# Names of the reductions that can appear in expressions
+reduce_methods = ("sum", "prod", "min", "max", "std", "mean", "var", "any", "all")
+
 
 def validate_expr(expr: str) -> None:
     """
@@ -410,7 +464,7 @@ def get_expr_operands(expression: str) -> set:
     return set(visitor.operands)
 
 
-def validate_inputs(inputs: dict, out=None) -> tuple:  # noqa: C901
+def validate_inputs(inputs: dict, out=None) -> tuple:
     """Validate the inputs for the expression."""
     if len(inputs) == 0:
         raise ValueError(
@@ -420,15 +474,13 @@ def validate_inputs(inputs: dict, out=None) -> tuple:  # noqa: C901
     inputs = [input for input in inputs.values() if hasattr(input, "shape")]
     shape = compute_broadcast_shape(inputs)
 
-    if not all(np.array_equal(shape, input.shape) for input in inputs):
-        # If inputs have different shapes, we cannot take the fast path
-        return shape, None, None, False
-
-    # More checks specific of NDArray inputs
-    NDinputs = [input for input in inputs if hasattr(input, "chunks")]
+    # More checks specific of NDArray inputs.  Only the inputs with the (broadcast) shape
+    # of the output determine the partitions, as the smaller ones are broadcast chunk by chunk
+    NDinputs = [input for input in inputs if hasattr(input, "chunks") and input.shape == shape]
     if len(NDinputs) == 0:
-        # All inputs are NumPy arrays, so we cannot take the fast path
-        return inputs[0].shape, None, None, False
+        # All inputs are NumPy arrays, or no NDArray has the shape of the output,
+        # so we cannot take the fast path
+        return shape, None, None, False
 
     # Check if we can take the fast path
     # For this we need that the chunks and blocks for all inputs (and a possible output)
@@ -501,8 +553,57 @@ def do_slices_intersect(slice1: list | tuple, slice2: list | tuple) -> bool:
     return True
 
 
+def get_special_scalar(chunk, dtype):
+    """Get the value of a special chunk (zeros, NaNs or a repeated value) as a scalar.
+
+    Only the header of the chunk is read, so `chunk` can be a lazy chunk.  If the chunk
+    is not special, None is returned.
+    """
+    special = blosc2.SpecialValue((chunk[31] & 0x70) >> 4)
+    if special in (blosc2.SpecialValue.ZERO, blosc2.SpecialValue.UNINIT):
+        # The contents of uninitialized chunks are undefined, so zeros are as good as anything
+        return np.zeros((), dtype=dtype)
+    if special == blosc2.SpecialValue.NAN:
+        return np.full((), np.nan, dtype=dtype)
+    if special == blosc2.SpecialValue.VALUE:
+        value_start = blosc2.EXTENDED_HEADER_LENGTH
+        return np.frombuffer(chunk[value_start : value_start + dtype.itemsize], dtype=dtype).reshape(())
+    return None
+
+
+def update_special_chunk(out, nchunk, value):
+    """Replace the chunk `nchunk` of `out` by a special chunk filled with `value`."""
+    value = np.asarray(value, dtype=out.dtype)
+    if value.tobytes() == bytes(value.itemsize):
+        out.schunk.update_special(nchunk, blosc2.SpecialValue.ZERO)
+    elif value.dtype.kind == "f" and value.itemsize in (4, 8) and np.isnan(value):
+        out.schunk.update_special(nchunk, blosc2.SpecialValue.NAN)
+    else:
+        out.schunk.update_special(nchunk, blosc2.SpecialValue.VALUE, value)
+
+
+def is_constant(result):
+    """Check whether all the items in `result` are the same (bitwise).
+
+    A few evenly spaced items are checked first, so non-constant results are
+    normally discarded without scanning the whole buffer.
+    """
+    itemsize = result.dtype.itemsize
+    if result.size == 0 or not result.flags.c_contiguous or result.dtype.hasobject:
+        return False
+    if itemsize in (1, 2, 4, 8):
+        items = result.reshape(-1).view(f"u{itemsize}")
+    else:
+        items = result.reshape(-1).view(np.uint8).reshape(-1, itemsize)
+    first = items[0]
+    sample = items[:: max(1, len(items) // 64)]
+    if not (sample == first).all():
+        return False
+    return bool((items == first).all())
+
+
 def get_chunk(arr, info, nchunk):
-    reduc, aligned, low_mem, chunks_idx = info
+    _, aligned, low_mem, chunks_idx = info
 
     if low_mem:
         # We don't want to uncompress the chunk, so keep it compressed and
@@ -510,14 +611,12 @@ def get_chunk(arr, info, nchunk):
         # can be useful in scarce memory situations.
         return arr.schunk.get_chunk(nchunk)
 
-    # First check if the chunk is a special zero chunk.
+    # First check if the chunk is a special one (zeros, NaNs or a repeated value).
     # Using lazychunks is very effective here because we only need to read the header.
-    if reduc:
-        # Reductions can treat zero scalars as zero chunks
-        chunk = arr.schunk.get_lazychunk(nchunk)
-        special = blosc2.SpecialValue((chunk[31] & 0x70) >> 4)
-        if special == blosc2.SpecialValue.ZERO:
-            return np.zeros((), dtype=arr.dtype)
+    # The value is returned as a scalar, which numexpr broadcasts as needed.
+    scalar = get_special_scalar(arr.schunk.get_lazychunk(nchunk), arr.dtype)
+    if scalar is not None:
+        return scalar
 
     shape, chunks = arr.shape, arr.chunks
     coords = tuple(np.unravel_index(nchunk, chunks_idx))
@@ -537,97 +636,477 @@ def get_chunk(arr, info, nchunk):
     return arr[slice_]
 
 
-async def async_read_chunks(arrs, info, queue):
-    loop = asyncio.get_event_loop()
-    nchunks = arrs[0].schunk.nchunks
+# Defaults for the chunk prefetcher used when evaluating expressions with operands on disk
+prefetch_dflts = {
+    # Maximum number of chunks (of all the operands) in flight
+    "depth": 2,
+    # Maximum number of (uncompressed) bytes in flight; at least one chunk is always prefetched
+    "max_bytes": 2**28,  # 256 MB
+}
+"""
+Defaults for prefetching the chunks of operands on disk when evaluating expressions:
+``depth`` is the maximum number of chunks in flight, and ``max_bytes`` the maximum number of
+(uncompressed) bytes in flight.
+"""
+
+# A shared, long-lived pool of threads for reading chunks.  It is created lazily, and
+# all the prefetchers (e.g. in different threads) share it.
+_io_pool = None
+_io_pool_lock = threading.Lock()
+
+
+def get_io_pool() -> concurrent.futures.ThreadPoolExecutor:
+    """Return the shared pool of threads used for reading chunks."""
+    global _io_pool
+    with _io_pool_lock:
+        if _io_pool is None:
+            _io_pool = concurrent.futures.ThreadPoolExecutor(
+                max_workers=max(4, blosc2.nthreads), thread_name_prefix="blosc2-io"
+            )
+        return _io_pool
 
-    with concurrent.futures.ThreadPoolExecutor() as executor:
-        for nchunk in range(nchunks):
-            futures = [
-                (index, loop.run_in_executor(executor, get_chunk, arr, info, nchunk))
-                for index, arr in enumerate(arrs)
-            ]
-            chunks = await asyncio.gather(*(future for index, future in futures), return_exceptions=True)
-            chunks_sorted = []
-            for chunk in chunks:
-                if isinstance(chunk, Exception):
-                    # Handle the exception (e.g., log it, raise a custom exception, etc.)
-                    print(f"Exception occurred: {chunk}")
-                    raise chunk
-                chunks_sorted.append(chunk)
-            queue.put((nchunk, chunks_sorted))  # use non-async queue.put()
 
-    queue.put(None)  # signal the end of the chunks
+def _reset_io_pool():
+    # Threads do not survive a fork, so the child needs a new pool
+    global _io_pool, _io_pool_lock
+    _io_pool = None
+    _io_pool_lock = threading.Lock()
 
 
-def async_read_chunks_thread(arrs, info, queue):
-    asyncio.run(async_read_chunks(arrs, info, queue))
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_io_pool)
 
 
-def sync_read_chunks(arrs, info):
-    queue_size = 2  # maximum number of chunks in the queue
-    queue = Queue(maxsize=queue_size)
+class ChunkPrefetcher:
+    """Read the chunks of several operands ahead of their evaluation.
 
-    # Start the async file reading in a separate thread
-    thread = threading.Thread(target=async_read_chunks_thread, args=(arrs, info, queue))
-    thread.start()
+    Each prefetcher belongs to a single evaluation, so different evaluations (even in
+    different threads) do not interfere.  The actual reads are done in the shared pool
+    returned by :func:`get_io_pool`.
 
-    # Read the chunks synchronously from the queue
-    while True:
+    Parameters
+    ----------
+    arrs: list of :ref:`NDArray`
+        The operands.  All of them must have the same shape and chunks.
+    info: tuple
+        The (reduc, aligned, low_mem, chunks_idx) tuple to be passed to :func:`get_chunk`.
+    depth: int, optional
+        The maximum number of chunks in flight.  If None, ``prefetch_dflts["depth"]`` is used.
+    max_bytes: int, optional
+        The maximum number of uncompressed bytes in flight.  If None,
+        ``prefetch_dflts["max_bytes"]`` is used.
+    """
+
+    def __init__(self, arrs, info, depth=None, max_bytes=None):
+        self.arrs = arrs
+        self.info = info
+        self.nchunks = arrs[0].schunk.nchunks
+        depth = prefetch_dflts["depth"] if depth is None else depth
+        max_bytes = prefetch_dflts["max_bytes"] if max_bytes is None else max_bytes
+        chunk_nbytes = sum(math.prod(arr.chunks) * arr.dtype.itemsize for arr in arrs)
+        self.depth = max(1, min(depth, max_bytes // max(chunk_nbytes, 1)))
+        self._pending = deque()
+        self._next_submit = 0
+        self._closed = False
+
+    def _submit(self):
+        pool = get_io_pool()
+        while len(self._pending) < self.depth and self._next_submit < self.nchunks:
+            nchunk = self._next_submit
+            futures = [pool.submit(get_chunk, arr, self.info, nchunk) for arr in self.arrs]
+            self._pending.append((nchunk, futures))
+            self._next_submit += 1
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self._closed:
+            raise StopIteration
+        self._submit()
+        if not self._pending:
+            self.close()
+            raise StopIteration
+        nchunk, futures = self._pending.popleft()
         try:
-            chunks = queue.get(timeout=1)  # Wait for the next chunk
-            if chunks is None:  # End of chunks
-                break
-            yield chunks
-        except Empty:
+            chunks = [future.result() for future in futures]
+        except BaseException:
+            self.close()
+            raise
+        # Keep the pipeline full while the caller is busy with this chunk
+        self._submit()
+        return nchunk, chunks
+
+    def close(self):
+        """Stop prefetching and discard the chunks that are still in flight."""
+        self._closed = True
+        while self._pending:
+            _, futures = self._pending.popleft()
+            for future in futures:
+                future.cancel()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def get_prefetcher(operands, aligned, reduc=False):
+    """Get a :class:`ChunkPrefetcher` for reading all the chunks of the operands in order."""
+    # Use an environment variable to control the memory usage
+    low_mem = os.environ.get("BLOSC_LOW_MEM", False)
+    # Take any operand (all should have the same shape and chunks)
+    arr = next(iter(operands.values()))
+    chunks_idx, _ = get_chunks_idx(arr.shape, arr.chunks)
+    info = (reduc, aligned, low_mem, chunks_idx)
+    return ChunkPrefetcher(list(operands.values()), info)
+
+
+# Defaults for the working set of the readers of operands with different partitions
+overlap_dflts = {
+    # Maximum number of (uncompressed) bytes kept per operand; at least the chunks needed
+    # by the current slice are always kept
+    "max_bytes": 2**28,  # 256 MB
+}
+"""
+Defaults for reading operands whose chunks differ from the ones of an evaluation:
+``max_bytes`` is the maximum number of (uncompressed) bytes of chunks kept per operand.
+"""
+
+
+class ChunkOverlapReader:
+    """Read slices of an NDArray whose chunks differ from the ones of an evaluation.
+
+    The slices to be read (in order) are planned in advance, so the chunks of the array
+    overlapping each one are known.  Every chunk is decompressed once and kept in a working
+    set until the last slice needing it has been read; if the working set grows beyond
+    `max_bytes`, the least recently used chunks are evicted first.
+
+    Parameters
+    ----------
+    arr: :ref:`NDArray`
+        The operand.
+    slices: list of tuples of slices
+        The (step-less) slices to be read, in the order that they will be read.
+    max_bytes: int, optional
+        The maximum size of the working set.  If None, ``overlap_dflts["max_bytes"]`` is used.
+    """
+
+    def __init__(self, arr, slices, max_bytes=None):
+        self.arr = arr
+        self.max_bytes = overlap_dflts["max_bytes"] if max_bytes is None else max_bytes
+        self.slices = slices
+        self.pos = 0
+        self.working_set = OrderedDict()
+        self.nbytes = 0
+        # The plan: the position of the last slice needing every chunk
+        self.last_use = {}
+        self.reused = False
+        for pos, slice_ in enumerate(slices):
+            for coords in self.overlapping(slice_):
+                self.reused = self.reused or coords in self.last_use
+                self.last_use[coords] = pos
+
+    def overlapping(self, slice_):
+        """Return the coordinates of the chunks overlapping with `slice_`."""
+        return itertools.product(
+            *(range(s.start // c, -(-s.stop // c)) for s, c in zip(slice_, self.arr.chunks, strict=True))
+        )
+
+    def get_chunk(self, coords):
+        chunk = self.working_set.get(coords)
+        if chunk is not None:
+            self.working_set.move_to_end(coords)
+            return chunk
+        chunk_slice = tuple(
+            slice(c * s, min((c + 1) * s, sh))
+            for c, s, sh in zip(coords, self.arr.chunks, self.arr.shape, strict=True)
+        )
+        chunk = self.arr[chunk_slice]
+        self.working_set[coords] = chunk
+        self.nbytes += chunk.nbytes
+        return chunk
+
+    def evict(self, coords):
+        self.nbytes -= self.working_set.pop(coords).nbytes
+
+    def __getitem__(self, slice_):
+        if slice_ != self.slices[self.pos]:
+            raise ValueError(f"Slice {slice_} does not follow the plan ({self.slices[self.pos]})")
+        chunks = self.arr.chunks
+        overlapping = list(self.overlapping(slice_))
+        if len(overlapping) == 1:
+            # No need to copy when the slice is within a single chunk
+            coords = overlapping[0]
+            chunk = self.get_chunk(coords)
+            part = chunk[
+                tuple(
+                    slice(s.start - c * cs, s.stop - c * cs)
+                    for s, c, cs in zip(slice_, coords, chunks, strict=True)
+                )
+            ]
+        else:
+            part = np.empty(tuple(s.stop - s.start for s in slice_), dtype=self.arr.dtype)
+            for coords in overlapping:
+                chunk = self.get_chunk(coords)
+                # The intersection of the chunk and the slice, in global coordinates
+                inter = tuple(
+                    (max(s.start, c * cs), min(s.stop, (c + 1) * cs))
+                    for s, c, cs in zip(slice_, coords, chunks, strict=True)
+                )
+                src = tuple(
+                    slice(start - c * cs, stop - c * cs)
+                    for (start, stop), c, cs in zip(inter, coords, chunks, strict=True)
+                )
+                dst = tuple(
+                    slice(start - s.start, stop - s.start)
+                    for (start, stop), s in zip(inter, slice_, strict=True)
+                )
+                part[dst] = chunk[src]
+        # Drop the chunks that are not needed anymore, and then keep the working set bounded
+        for coords in overlapping:
+            if self.last_use[coords] == self.pos:
+                self.evict(coords)
+        while self.nbytes > self.max_bytes:
+            self.evict(next(iter(self.working_set)))
+        self.pos += 1
+        return part
+
+
+def get_overlap_readers(operands, shape, chunks, slices):
+    """Get a :class:`ChunkOverlapReader` for each operand that would decompress chunks repeatedly.
+
+    These are the NDArray operands with `shape` and chunks different from `chunks`, where
+    some of their chunks overlap with more than one of `slices`.
+    """
+    readers = {}
+    for key, value in operands.items():
+        if not isinstance(value, blosc2.NDArray) or value.shape != shape or value.chunks == chunks:
             continue
+        reader = ChunkOverlapReader(value, slices)
+        if reader.reused:
+            readers[key] = reader
+    return readers
+
+
+# Defaults for the cache of parts of the smaller operands in broadcasting
+bcast_dflts = {
+    # Maximum number of (uncompressed) bytes kept per evaluation
+    "max_bytes": 2**26,  # 64 MB
+}
+"""
+Defaults for broadcasting the smaller operands of an evaluation: ``max_bytes`` is the
+maximum number of (uncompressed) bytes of their parts kept per evaluation.
+"""
 
 
-def read_nchunk(arrs, info):
-    for _, chunks in sync_read_chunks(arrs, info):
-        yield chunks
+class BroadcastCache:
+    """Keep the parts of the smaller operands that broadcast with the chunks of an evaluation.
 
+    Chunks sharing the same part (e.g. all the chunks in the same columns for a row vector)
+    only fetch it once while it is kept.  If the cached parts grow beyond `max_bytes`, the
+    least recently used ones are evicted first (and fetched again if needed later on).
 
-iter_chunks = None
+    Parameters
+    ----------
+    max_bytes: int, optional
+        The maximum size of the cached parts.  If None, ``bcast_dflts["max_bytes"]`` is used.
+    """
+
+    def __init__(self, max_bytes=None):
+        self.max_bytes = bcast_dflts["max_bytes"] if max_bytes is None else max_bytes
+        self.parts = OrderedDict()
+        self.nbytes = 0
+        # Chunks can be evaluated by several threads
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            part = self.parts.get(key)
+            if part is not None:
+                self.parts.move_to_end(key)
+            return part
+
+    def put(self, key, part):
+        with self.lock:
+            if key in self.parts or part.nbytes > self.max_bytes:
+                return
+            self.parts[key] = part
+            self.nbytes += part.nbytes
+            while self.nbytes > self.max_bytes:
+                self.nbytes -= self.parts.popitem(last=False)[1].nbytes
+
+
+def get_broadcast_operand(key, value, shape, slice_, cache):
+    """Get the part of a smaller operand that broadcasts with the `slice_` of `shape`.
+
+    The parts are kept in `cache` (a :class:`BroadcastCache`).
+    """
+    smaller_slice = compute_smaller_slice(shape, value.shape, slice_)
+    cache_key = (key, tuple((s.start, s.stop) for s in smaller_slice))
+    part = cache.get(cache_key)
+    if part is None:
+        part = value[smaller_slice]
+        cache.put(cache_key, part)
+    return part
+
+
+# Defaults for the cache of compiled numexpr programs
+ne_cache_dflts = {
+    # Maximum number of compiled programs kept (per thread)
+    "maxsize": 256,
+}
+"""
+Defaults for the cache of compiled numexpr programs: ``maxsize`` is the maximum number of
+programs kept per thread.
+"""
+
+# Defaults for splitting the evaluation of long expressions in stages
+stage_dflts = {
+    # Shared subexpressions longer than this (in characters) are evaluated in a stage of their own
+    "max_inline": 1024,
+}
+"""
+Defaults for evaluating long expressions in stages: shared subexpressions longer than
+``max_inline`` characters are evaluated in a stage of their own.
+"""
+
+# Like numexpr, keep a cache per thread, as compiled programs cannot be run concurrently
+_ne_cache = threading.local()
+
+
+def _has_ne_internals():
+    """Whether the numexpr internals used for reusing compiled programs are available.
+
+    These are not public, and their `sanitize` keyword appeared in numexpr 2.8.5.
+    """
+    necompiler = getattr(ne, "necompiler", None)
+    names = ("getContext", "getExprNames", "getType", "typecode_to_kind", "kind_to_type")
+    if necompiler is None or not all(hasattr(necompiler, name) for name in names):
+        return False
+    try:
+        return all(
+            "sanitize" in inspect.signature(func).parameters
+            for func in (necompiler.getExprNames, ne.NumExpr)
+        )
+    except (AttributeError, TypeError, ValueError):
+        return False
+
+
+_ne_programs = _has_ne_internals()
+
+
+def get_ne_program(expression, local_dict):
+    """Get the compiled numexpr program for the operands in `local_dict`.
+
+    The program is a list of ``(compiled, names, ex_uses_vml, result)`` stages, where the
+    `result` of every stage (but the last one) is a new operand for the following stages.
+    Expressions are split in stages only when they are longer than
+    ``stage_dflts["max_inline"]`` and share some long subexpressions (see :class:`ExprDAG`).
+
+    Programs are compiled just once for each expression and operand dtypes, and kept in
+    a (per thread) LRU cache with up to ``ne_cache_dflts["maxsize"]`` entries.
+    """
+    cache = getattr(_ne_cache, "programs", None)
+    if cache is None:
+        cache = _ne_cache.programs = OrderedDict()
+    key = (expression, *((name, np.asarray(value).dtype) for name, value in local_dict.items()))
+    program = cache.get(key)
+    if program is not None:
+        cache.move_to_end(key)
+        return program
+    stages = []
+    max_inline = stage_dflts["max_inline"]
+    if len(expression) > max_inline:
+        stages, expression = ExprDAG(expression).emit(max_inline)
+    sanitize = os.environ.get("NUMEXPR_SANITIZE", "1") != "0"
+    context = ne.necompiler.getContext({})
+    types = {}
+    program = []
+    for result, expr in [*stages, (None, expression)]:
+        names, ex_uses_vml = ne.necompiler.getExprNames(expr, context, sanitize=sanitize)
+        for name in names:
+            if name not in types:
+                types[name] = ne.necompiler.getType(np.asarray(local_dict[name]))
+        signature = [(name, types[name]) for name in names]
+        compiled = ne.NumExpr(expr, signature, sanitize=sanitize, **context)
+        program.append((compiled, names, ex_uses_vml, result))
+        if result is not None:
+            # The first item in the full signature is the type of the output
+            kind = ne.necompiler.typecode_to_kind[chr(compiled.fullsig[0])]
+            types[result] = ne.necompiler.kind_to_type[kind]
+    cache[key] = program
+    while len(cache) > ne_cache_dflts["maxsize"]:
+        cache.popitem(last=False)
+    return program
+
+
+def ne_evaluate(expression, local_dict, out=None):
+    """Evaluate `expression` like :func:`numexpr.evaluate`, but reusing compiled programs.
+
+    This avoids parsing and validating the expression (and its operands) on every chunk.
+    If the numexpr internals needed for this are not available, :func:`numexpr.evaluate`
+    is used instead.
+    """
+    if not _ne_programs:
+        return ne.evaluate(expression, local_dict=local_dict, out=out, casting="same_kind")
+    *stages, (compiled, names, ex_uses_vml, _) = get_ne_program(expression, local_dict)
+    if stages:
+        local_dict = dict(local_dict)
+        for stage, stage_names, stage_uses_vml, result in stages:
+            args = [np.asarray(local_dict[name]) for name in stage_names]
+            local_dict[result] = stage(*args, order="K", casting="same_kind", ex_uses_vml=stage_uses_vml)
+    args = [np.asarray(local_dict[name]) for name in names]
+    return compiled(*args, out=out, order="K", casting="same_kind", ex_uses_vml=ex_uses_vml)
 
 
 def fill_chunk_operands(  # noqa: C901
-    operands, slice_, chunks_, full_chunk, aligned, nchunk, iter_disk, chunk_operands, reduc=False
+    operands,
+    slice_,
+    chunks_,
+    full_chunk,
+    aligned,
+    nchunk,
+    prefetcher,
+    chunk_operands,
+    reduc=False,
+    shape=None,
+    bcast_cache=None,
 ):
     """Retrieve the chunk operands for evaluating an expression.
 
     This function provides an optimized path for full chunks and a slower path for partial chunks.
+    If a :class:`ChunkPrefetcher` is passed, the chunks are taken from it.  If `bcast_cache`
+    is passed, operands with a smaller shape than `shape` are broadcast, and their parts are
+    cached in it (the prefetcher, if any, must contain only the operands with `shape`).
     """
-    global iter_chunks
-
-    if iter_disk:
-        # Use an environment variable to control the memory usage
-        low_mem = os.environ.get("BLOSC_LOW_MEM", False)
+    if prefetcher is not None:
         # This method is only useful when all operands are NDArray and shows better
         # performance only when at least one of them is persisted on disk
-        if nchunk == 0:
-            # Initialize the iterator for reading the chunks
-            # Take any operand (all should have the same shape and chunks)
-            arr = next(iter(operands.values()))
-            chunks_idx, _ = get_chunks_idx(arr.shape, arr.chunks)
-            info = (reduc, aligned, low_mem, chunks_idx)
-            iter_chunks = read_nchunk(list(operands.values()), info)
-        # Run the asynchronous file reading function from a synchronous context
-        chunks = next(iter_chunks)
-
-        for i, (key, value) in enumerate(operands.items()):
+        low_mem = prefetcher.info[2]
+        nchunk_, chunks = next(prefetcher)
+        if nchunk_ != nchunk:
+            raise RuntimeError(f"Prefetched chunk {nchunk_} does not match the requested one ({nchunk})")
+
+        chunks = iter(chunks)
+        for key, value in operands.items():
+            if bcast_cache is not None and value.shape != shape:
+                chunk_operands[key] = get_broadcast_operand(key, value, shape, slice_, bcast_cache)
+                continue
+            chunk = next(chunks)
             # The chunks are already decompressed, so we can use them directly
             if not low_mem:
-                chunk_operands[key] = chunks[i]
+                chunk_operands[key] = chunk
                 continue
             # Otherwise, we need to decompress the chunks
-            special = blosc2.SpecialValue((chunks[i][31] & 0x70) >> 4)
-            if special == blosc2.SpecialValue.ZERO:
-                # The chunk is a special zero chunk, so we can treat it as a scalar
-                chunk_operands[key] = np.zeros((), dtype=value.dtype)
+            scalar = get_special_scalar(chunk, value.dtype)
+            if scalar is not None:
+                # The chunk is a special chunk, so we can treat it as a scalar
+                chunk_operands[key] = scalar
                 continue
             if aligned:
-                buff = blosc2.decompress2(chunks[i])
+                buff = blosc2.decompress2(chunk)
                 bsize = value.dtype.itemsize * math.prod(chunks_)
                 chunk_operands[key] = np.frombuffer(buff[:bsize], dtype=value.dtype).reshape(chunks_)
             else:
@@ -642,31 +1121,27 @@ def fill_chunk_operands(  # noqa: C901
             chunk_operands[key] = value[()]
             continue
 
+        if bcast_cache is not None and value.shape != shape:
+            # We need to fetch the part of the value that broadcasts with the operand
+            chunk_operands[key] = get_broadcast_operand(key, value, shape, slice_, bcast_cache)
+            continue
+
         if isinstance(value, np.ndarray | blosc2.C2Array):
             chunk_operands[key] = value[slice_]
             continue
 
-        # TODO: broadcast is not in the fast path yet, so no need to check for it
-        # slice_shape = tuple(s.stop - s.start for s in slice_)
-        # if check_smaller_shape(value, shape, slice_shape):
-        #     # We need to fetch the part of the value that broadcasts with the operand
-        #     smaller_slice = compute_smaller_slice(shape, value.shape, slice_)
-        #     chunk_operands[key] = value[smaller_slice]
-        #     continue
-
         if not full_chunk or not isinstance(value, blosc2.NDArray):
             # The chunk is not a full one, or has padding, or is not a blosc2.NDArray,
             # so we need to go the slow path
             chunk_operands[key] = value[slice_]
             continue
 
-        # First check if the chunk is a special zero chunk.
+        # First check if the chunk is a special one (zeros, NaNs or a repeated value).
         # Using lazychunks is very effective here because we only need to read the header.
-        chunk = value.schunk.get_lazychunk(nchunk)
-        special = blosc2.SpecialValue((chunk[31] & 0x70) >> 4)
-        if special == blosc2.SpecialValue.ZERO:
-            # The chunk is a special zero chunk, so we can treat it as a scalar
-            chunk_operands[key] = np.zeros((), dtype=value.dtype)
+        scalar = get_special_scalar(value.schunk.get_lazychunk(nchunk), value.dtype)
+        if scalar is not None:
+            # The chunk is a special chunk, so we can treat it as a scalar
+            chunk_operands[key] = scalar
             continue
         if aligned:
             # Decompress the whole chunk and store it
@@ -677,10 +1152,39 @@ def fill_chunk_operands(  # noqa: C901
             chunk_operands[key] = value[slice_]
 
 
+def ordered_chunk_map(func, nchunks, nworkers=1):
+    """Yield `func(nchunk)` for every chunk, in chunk order.
+
+    When `nworkers` is larger than 1, a bounded pool of threads is used, so that several
+    chunks are in flight at the same time while the results are still delivered in order.
+    """
+    if nworkers <= 1:
+        for nchunk in range(nchunks):
+            yield func(nchunk)
+        return
+
+    # Keep a limited number of chunks in flight, so that memory consumption is bounded
+    max_inflight = 2 * nworkers
+    pending = deque()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=nworkers) as executor:
+        try:
+            for nchunk in range(nchunks):
+                pending.append(executor.submit(func, nchunk))
+                if len(pending) >= max_inflight:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            # The consumer may stop early (e.g. because of an exception); do not start new work
+            for future in pending:
+                future.cancel()
+
+
 def fast_eval(  # noqa: C901
     expression: str | Callable[[tuple, np.ndarray, tuple[int]], None],
     operands: dict,
     getitem: bool,
+    nworkers: int = 1,
     **kwargs,
 ) -> blosc2.NDArray | np.ndarray:
     """Evaluate the expression in chunks of operands using a fast path.
@@ -694,6 +1198,9 @@ def fast_eval(  # noqa: C901
     getitem: bool, optional
         Indicates whether the expression is being evaluated for a getitem operation or eval().
         Default is False.
+    nworkers: int, optional
+        The number of threads evaluating chunks in parallel.  The results are still
+        written in chunk order.  Default is 1 (serial evaluation).
     kwargs: dict, optional
         Additional keyword arguments supported by the :func:`empty` constructor.
 
@@ -704,35 +1211,49 @@ def fast_eval(  # noqa: C901
     """
     out = kwargs.pop("_output", None)
     where: dict | None = kwargs.pop("_where_args", None)
+    # Operands with a smaller shape are broadcast against the ones with the shape of the output
+    shape = compute_broadcast_shape([o for o in operands.values() if hasattr(o, "shape")])
+    full_operands = {
+        key: value for key, value in operands.items() if hasattr(value, "shape") and value.shape == shape
+    }
     if isinstance(out, blosc2.NDArray):
         # If 'out' has been passed, and is a NDArray, use it as the base array
         basearr = out
     else:
-        # Otherwise, find the operand with the 'chunks' attribute and the longest shape
-        operands_with_chunks = [o for o in operands.values() if hasattr(o, "chunks")]
-        basearr = max(operands_with_chunks, key=lambda x: len(x.shape))
+        # Otherwise, use the first operand with the 'chunks' attribute and the shape of the output
+        basearr = next(o for o in full_operands.values() if hasattr(o, "chunks"))
 
-    # Get the shape of the base array
-    shape = basearr.shape
+    # Get the partitions of the base array
     chunks = basearr.chunks
     # Check whether the partitions are aligned and behaved
     aligned = blosc2.are_partitions_aligned(shape, chunks, basearr.blocks)
     behaved = blosc2.are_partitions_behaved(shape, chunks, basearr.blocks)
 
     # Check that all operands are NDArray for fast path
-    all_ndarray = all(isinstance(value, blosc2.NDArray) and value.shape != () for value in operands.values())
+    all_ndarray = all(isinstance(value, blosc2.NDArray) for value in operands.values())
     # Check that there is some NDArray that is persisted in the disk
     any_persisted = any(
-        (isinstance(value, blosc2.NDArray) and value.shape != () and value.schunk.urlpath is not None)
-        for value in operands.values()
+        (isinstance(value, blosc2.NDArray) and value.schunk.urlpath is not None)
+        for value in full_operands.values()
     )
-    iter_disk = all_ndarray and any_persisted
+    # The sequential disk reader does not make sense when chunks are fetched in parallel
+    iter_disk = shape != () and all_ndarray and any_persisted and nworkers <= 1
+    prefetcher = get_prefetcher(full_operands, aligned) if iter_disk else None
+    # Parts of the smaller operands, shared by all the chunks that broadcast with them
+    bcast_cache = BroadcastCache()
+
+    if where is not None and len(where) != 2:
+        # We do not support one or zero operands in the fast path yet
+        raise ValueError("The where condition must be a tuple with one or two elements")
 
-    chunk_operands = {}
     chunks_idx, nchunks = get_chunks_idx(shape, chunks)
+    # Fast path: put the result straight in the output array (avoiding a memory copy)
+    direct_out = isinstance(out, np.ndarray) and not where
+    if where is not None and not callable(expression):
+        # Apply the where condition (in result)
+        expression = f"where({expression}, _where_x, _where_y)"
 
-    # Iterate over the chunks and evaluate the expression
-    for nchunk in range(nchunks):
+    def eval_chunk(nchunk):
         coords = tuple(np.unravel_index(nchunk, chunks_idx))
         slice_ = tuple(
             slice(c * s, min((c + 1) * s, shape[i]))
@@ -742,34 +1263,43 @@ def fast_eval(  # noqa: C901
         chunks_ = tuple(s.stop - s.start for s in slice_)
 
         full_chunk = chunks_ == chunks
-        # To avoid overbooking memory, we need to clear the chunk_operands dict
-        chunk_operands.clear()
+        chunk_operands = {}
         fill_chunk_operands(
-            operands, slice_, chunks_, full_chunk, aligned, nchunk, iter_disk, chunk_operands
+            operands,
+            slice_,
+            chunks_,
+            full_chunk,
+            aligned,
+            nchunk,
+            prefetcher,
+            chunk_operands,
+            shape=shape,
+            bcast_cache=bcast_cache,
         )
+        if callable(expression):
+            # Special chunks come as scalars, but udfs expect full chunks
+            for key, value in chunk_operands.items():
+                if isinstance(value, np.ndarray) and value.ndim == 0:
+                    chunk_operands[key] = np.broadcast_to(value, chunks_)
 
-        if isinstance(out, np.ndarray) and not where:
-            # Fast path: put the result straight in the output array (avoiding a memory copy)
+        if direct_out:
             if callable(expression):
                 expression(tuple(chunk_operands.values()), out[slice_], offset=offset)
             else:
-                ne.evaluate(expression, chunk_operands, out=out[slice_])
-            continue
+                ne_evaluate(expression, chunk_operands, out=out[slice_])
+            return slice_, chunks_, None
         if callable(expression):
             result = np.empty(chunks_, dtype=out.dtype)
             expression(tuple(chunk_operands.values()), result, offset=offset)
         else:
-            if where is None:
-                result = ne.evaluate(expression, chunk_operands)
-            else:
-                # Apply the where condition (in result)
-                if len(where) == 2:
-                    new_expr = f"where({expression}, _where_x, _where_y)"
-                    result = ne.evaluate(new_expr, chunk_operands)
-                else:
-                    # We do not support one or zero operands in the fast path yet
-                    raise ValueError("The where condition must be a tuple with one or two elements")
+            result = ne_evaluate(expression, chunk_operands)
+        return slice_, chunks_, result
 
+    # Iterate over the chunks and evaluate the expression
+    try:
+        for nchunk, (slice_, chunks_, result) in enumerate(ordered_chunk_map(eval_chunk, nchunks, nworkers)):
+            if direct_out:
+                continue
             if out is None:
                 # We can enter here when using any of the eval() or __getitem__() methods
                 if getitem:
@@ -779,19 +1309,356 @@ def fast_eval(  # noqa: C901
                         shape, chunks=chunks, blocks=basearr.blocks, dtype=result.dtype, **kwargs
                     )
 
-        # Store the result in the output array
-        if getitem:
-            out[slice_] = result
-        else:
-            if behaved and result.shape == chunks_:
-                # Fast path only works for results that are full chunks
-                out.schunk.update_data(nchunk, result, copy=False)
-            else:
+            # Store the result in the output array
+            if getitem:
                 out[slice_] = result
+            else:
+                store_chunk_result(out, nchunk, slice_, chunks_, result, behaved)
+    finally:
+        if prefetcher is not None:
+            prefetcher.close()
 
     return out
 
 
+def store_chunk_result(out, nchunk, slice_, chunks_, result, behaved):
+    """Store the `result` of evaluating the chunk `nchunk` (in `slice_`) in `out`.
+
+    The partitions of the `out` NDArray must be the ones used for the evaluation.
+    """
+    if result.shape == ():
+        # All the operands were scalars (e.g. special chunks), so the output
+        # chunk can be written as a special chunk too
+        update_special_chunk(out, nchunk, result)
+    elif is_constant(result):
+        # Constant results (e.g. all False masks) do not need to be compressed
+        update_special_chunk(out, nchunk, result.reshape(-1)[0])
+    elif behaved and result.shape == chunks_:
+        # Fast path only works for results that are full chunks
+        out.schunk.update_data(nchunk, result, copy=False)
+    else:
+        out[slice_] = result
+
+
+def many_eval(  # noqa: C901
+    expressions: list[str], operands: dict, nworkers: int = 1, **kwargs
+) -> list[blosc2.NDArray]:
+    """Evaluate several expressions on the same operands, in a single pass over their chunks.
+
+    Every chunk of the operands is read (and decompressed) just once, and then all the
+    expressions are evaluated on it.
+
+    Parameters
+    ----------
+    expressions: list of str
+        The expressions to evaluate.
+    operands: dict
+        A dictionary containing the operands of all the expressions.
+    nworkers: int, optional
+        The number of threads evaluating chunks in parallel.  Default is 1.
+    kwargs: dict, optional
+        Additional keyword arguments supported by the :func:`empty` constructor, used
+        for all the outputs.
+
+    Returns
+    -------
+    list of :ref:`NDArray`
+        The output arrays, one per expression.
+    """
+    shape, chunks, blocks, fast_path = validate_inputs(operands)
+    aligned = blosc2.are_partitions_aligned(shape, chunks, blocks)
+    behaved = blosc2.are_partitions_behaved(shape, chunks, blocks)
+    full_operands = {
+        key: value for key, value in operands.items() if hasattr(value, "shape") and value.shape == shape
+    }
+    all_ndarray = all(isinstance(value, blosc2.NDArray) for value in operands.values())
+    any_persisted = any(
+        (isinstance(value, blosc2.NDArray) and value.schunk.urlpath is not None)
+        for value in full_operands.values()
+    )
+    iter_disk = fast_path and shape != () and all_ndarray and any_persisted and nworkers <= 1
+    prefetcher = get_prefetcher(full_operands, aligned) if iter_disk else None
+    bcast_cache = BroadcastCache()
+    chunks_idx, nchunks = get_chunks_idx(shape, chunks)
+    # The outputs are created when the dtypes of the results are known
+    outs = [None] * len(expressions)
+
+    def eval_chunk(nchunk):
+        coords = tuple(np.unravel_index(nchunk, chunks_idx))
+        slice_ = tuple(
+            slice(c * s, min((c + 1) * s, shape[i]))
+            for i, (c, s) in enumerate(zip(coords, chunks, strict=True))
+        )
+        chunks_ = tuple(s.stop - s.start for s in slice_)
+        chunk_operands = {}
+        # Operands with other partitions are sliced (which is what a non full chunk means here)
+        full_chunk = fast_path and chunks_ == chunks
+        fill_chunk_operands(
+            operands,
+            slice_,
+            chunks_,
+            full_chunk,
+            aligned,
+            nchunk,
+            prefetcher,
+            chunk_operands,
+            shape=shape,
+            bcast_cache=bcast_cache,
+        )
+        return slice_, chunks_, [ne_evaluate(expression, chunk_operands) for expression in expressions]
+
+    # Activate last read cache for NDField instances
+    for value in operands.values():
+        if isinstance(value, blosc2.NDField):
+            value.ndarr.keep_last_read = True
+    try:
+        for nchunk, (slice_, chunks_, results) in enumerate(
+            ordered_chunk_map(eval_chunk, nchunks, nworkers)
+        ):
+            for i, result in enumerate(results):
+                if outs[i] is None:
+                    outs[i] = blosc2.empty(
+                        shape, dtype=result.dtype, **({"chunks": chunks, "blocks": blocks} | kwargs)
+                    )
+                out = outs[i]
+                if out.chunks == chunks and out.blocks == blocks:
+                    store_chunk_result(out, nchunk, slice_, chunks_, result, behaved)
+                else:
+                    out[slice_] = result
+    finally:
+        if prefetcher is not None:
+            prefetcher.close()
+        # Deactivate cache for NDField instances
+        for value in operands.values():
+            if isinstance(value, blosc2.NDField):
+                value.ndarr.keep_last_read = False
+
+    return outs
+
+
+class BlockEvaluator:
+    """Evaluate an expression for a block of the output, from the same block of the operands.
+
+    This is meant to be called from a prefilter (possibly from several compression threads
+    at a time), so exceptions are kept in `error` instead of being raised.
+    """
+
+    def __init__(self, expression, operands, out):
+        self.expression = expression
+        self.operands = operands
+        self.dtype = out.dtype
+        # Chunks are made of (padded) blocks stored one after the other, so the items of a
+        # block have the same (contiguous) positions in the output and in the operands
+        self.chunk_nitems = out.schunk.chunksize // out.dtype.itemsize
+        self.block_nitems = out.schunk.blocksize // out.dtype.itemsize
+        self.error = None
+
+    def __call__(self, nchunk, nblock, output):
+        try:
+            output = output.view(self.dtype)
+            start = nchunk * self.chunk_nitems + nblock * self.block_nitems
+            block_operands = {}
+            for key, value in self.operands.items():
+                block = np.empty(len(output), dtype=value.dtype)
+                value.schunk.get_slice(start, start + len(output), out=block)
+                block_operands[key] = block
+            ne_evaluate(self.expression, block_operands, out=output)
+        except Exception as exc:  # noqa: BLE001 (re-raised after compression)
+            self.error = exc
+            return -1
+        return 0
+
+
+def can_blocks_eval(expression, operands, out) -> bool:
+    """Check whether :func:`blocks_eval` can be used (the fast path is assumed)."""
+    if callable(expression) or not operands:
+        return False
+    shape = out.shape if out is not None else None
+    for value in operands.values():
+        # The operands must provide the blocks straight from their chunks
+        if type(value) is not blosc2.NDArray or (shape is not None and value.shape != shape):
+            return False
+        shape = value.shape
+    return shape != ()
+
+
+def blocks_eval(expression: str, operands: dict, **kwargs) -> blosc2.NDArray:
+    """Evaluate the expression block by block, inside the compression of the output.
+
+    The expression is evaluated from a prefilter of the output, so decompressing the blocks
+    of the operands, evaluating and compressing the result happens for every block in turn,
+    in (typically) L2-sized working sets and using the threads for compressing the output.
+    All the operands must be NDArray objects with the same shape, chunks and blocks.
+
+    Parameters
+    ----------
+    expression: str
+        The expression to evaluate.
+    operands: dict
+        A dictionary containing the operands for the expression.
+    kwargs: dict, optional
+        Additional keyword arguments supported by the :func:`empty` constructor.
+
+    Returns
+    -------
+    :ref:`NDArray`
+        The output array.
+    """
+    out = kwargs.pop("_output", None)
+    kwargs.pop("_where_args", None)
+    if out is None:
+        basearr = next(iter(operands.values()))
+        dtype = ne.evaluate(
+            expression, {key: np.ones(1, dtype=value.dtype) for key, value in operands.items()}
+        )
+        out = blosc2.empty(
+            basearr.shape, dtype=dtype.dtype, chunks=basearr.chunks, blocks=basearr.blocks, **kwargs
+        )
+    evaluator = BlockEvaluator(expression, operands, out)
+    out.schunk._fill_prefilter(evaluator, out.schunk.cparams.nthreads)
+    return out
+
+
+def get_slice_region(item, shape):
+    """Get the region (slices with unit steps) of `shape` that contains a basic index.
+
+    Returns the region, and the index to apply to the evaluated region to get the final
+    result.  If `item` is not made of integers and positive step slices, (None, None)
+    is returned.
+    """
+    try:
+        key = ndindex.ndindex(item).expand(shape).raw
+    except (IndexError, TypeError, ValueError):
+        return None, None
+    region, subitem = [], []
+    for k, size in zip(key, shape, strict=False):
+        if isinstance(k, int):
+            region.append(slice(k, k + 1))
+            subitem.append(0)
+        elif isinstance(k, slice) and (k.step or 1) > 0:
+            start, stop, step = k.indices(size)
+            stop = max(start, stop)
+            region.append(slice(start, stop))
+            subitem.append(slice(None, None, step))
+        else:
+            return None, None
+    if len(region) != len(shape):
+        return None, None
+    return tuple(region), tuple(subitem)
+
+
+# Comparisons of the items in a range with a number (and whether any item can satisfy it)
+_range_cmps = {
+    ast.Gt: lambda lo, hi, value: hi > value,
+    ast.GtE: lambda lo, hi, value: hi >= value,
+    ast.Lt: lambda lo, hi, value: lo < value,
+    ast.LtE: lambda lo, hi, value: lo <= value,
+    ast.Eq: lambda lo, hi, value: lo <= value <= hi,
+}
+# The comparisons to use when swapping the operands
+_mirror_cmps = {
+    ast.Gt: ast.Lt,
+    ast.GtE: ast.LtE,
+    ast.Lt: ast.Gt,
+    ast.LtE: ast.GtE,
+    ast.Eq: ast.Eq,
+    ast.NotEq: ast.NotEq,
+}
+
+
+def get_zonemaps(operands, shape):
+    """Get the stats in the zone maps of the NDArray operands (with `shape`) having one."""
+    zonemaps = {}
+    for key, value in operands.items():
+        if isinstance(value, blosc2.NDArray) and value.shape == shape:
+            zonemap = value.schunk.zonemap
+            if zonemap is not None:
+                zonemaps[key] = (value, zonemap["stats"])
+    return zonemaps
+
+
+def get_zonemap_ranges(zonemaps, slice_):
+    """Get the (min, max, nans) of the items of the operands in `slice_` from their zone maps."""
+    ranges = {}
+    start = tuple(s.start for s in slice_)
+    stop = tuple(s.stop for s in slice_)
+    for key, (value, stats) in zonemaps.items():
+        nchunks = get_intersecting_nchunks(start, stop, value.shape, value.chunks)
+        stats_ = [stats[nchunk] for nchunk in nchunks]
+        mins = [stat[0] for stat in stats_ if stat[0] is not None]
+        maxs = [stat[1] for stat in stats_ if stat[1] is not None]
+        nans = sum(stat[2] for stat in stats_)
+        ranges[key] = (min(mins) if mins else None, max(maxs) if maxs else None, nans)
+    return ranges
+
+
+def may_match(node, ranges) -> bool:
+    """Check whether the condition in `node` (an AST) may be true for some items in `ranges`.
+
+    `ranges` maps the names of the operands to the (min, max, nans) of their items.  Only
+    comparisons between operands and numbers, combined with ``&`` and ``|``, are checked;
+    anything else may always be true.
+    """
+    if isinstance(node, ast.BinOp) and isinstance(node.op, ast.BitAnd):
+        return may_match(node.left, ranges) and may_match(node.right, ranges)
+    if isinstance(node, ast.BinOp) and isinstance(node.op, ast.BitOr):
+        return may_match(node.left, ranges) or may_match(node.right, ranges)
+    if not isinstance(node, ast.Compare) or len(node.ops) != 1:
+        return True
+    left, op, right = node.left, type(node.ops[0]), node.comparators[0]
+    if isinstance(right, ast.Name) and op in _mirror_cmps:
+        left, op, right = right, _mirror_cmps[op], left
+    if not isinstance(left, ast.Name) or left.id not in ranges:
+        return True
+    try:
+        value = ast.literal_eval(right)
+    except ValueError:
+        return True
+    if not isinstance(value, bool | int | float):
+        return True
+    lo, hi, nans = ranges[left.id]
+    if op is ast.NotEq:
+        # NaNs are different from anything
+        return nans > 0 or lo is None or not (lo == hi == value)
+    if op not in _range_cmps:
+        return True
+    # Comparisons with NaNs are always false
+    return lo is not None and _range_cmps[op](lo, hi, value)
+
+
+def get_slice_operands(operands, shape, slice_, readers):
+    """Get the part of each operand needed for evaluating the `slice_` of the output."""
+    slice_shape = tuple(s.stop - s.start for s in slice_)
+    chunk_operands = {}
+    for key, value in operands.items():
+        if np.isscalar(value):
+            chunk_operands[key] = value
+            continue
+        if value.shape == ():
+            chunk_operands[key] = value[()]
+            continue
+        if check_smaller_shape(value, shape, slice_shape):
+            # We need to fetch the part of the value that broadcasts with the operand
+            smaller_slice = compute_smaller_slice(shape, value.shape, slice_)
+            chunk_operands[key] = value[smaller_slice]
+            continue
+        if key in readers:
+            chunk_operands[key] = readers[key][slice_]
+            continue
+        chunk_operands[key] = value[slice_]
+    return chunk_operands
+
+
+def c_order_items(parts):
+    """Concatenate the items in `parts` (from several chunks) in C order of their positions.
+
+    `parts` is a list of (positions, items) pairs, with the flat positions of the items.
+    """
+    positions = np.concatenate([positions for positions, _ in parts])
+    items = np.concatenate([items for _, items in parts])
+    return items[np.argsort(positions)]
+
+
 def slices_eval(  # noqa: C901
     expression: str | Callable[[tuple, np.ndarray, tuple[int]], None],
     operands: dict,
@@ -806,6 +1673,10 @@ def slices_eval(  # noqa: C901
 
     This is also flexible enough to work with operands of different shapes.
 
+    When selecting the items satisfying a condition (``where(x)``), the chunks that cannot
+    have any of them according to the zone maps of the operands are skipped, and the items
+    selected in the rest of the chunks are put back in C order.
+
     Parameters
     ----------
     expression: str or callable
@@ -833,6 +1704,20 @@ def slices_eval(  # noqa: C901
 
     # We need to keep the original _slice arg, for allowing a final getitem (if necessary
     orig_slice = _slice
+    # A NumPy output may hold just the _slice region (e.g. from LazyUDF.__getitem__)
+    region_out = getitem and isinstance(out, np.ndarray) and _slice not in (None, ()) and out.shape != shape
+
+    zonemaps = None
+    if where is not None and len(where) == 1 and not callable(expression):
+        # The chunks where no item can satisfy the condition can be skipped
+        zonemaps = get_zonemaps(operands, shape)
+        try:
+            condition = ast.parse(expression, mode="eval").body
+        except SyntaxError:
+            zonemaps = None
+    if chunks is None and zonemaps:
+        # Skip the same chunks as in the zone maps
+        chunks = next(iter(zonemaps.values()))[0].chunks
 
     if chunks is None:
         # Any out or operand with `chunks` will be used to get the chunks
@@ -849,13 +1734,18 @@ def slices_eval(  # noqa: C901
             # Use operands to get the shape and chunks
             chunks = operands_[0].chunks
 
-    # Iterate over the operands and get the chunks
+    if _slice is not None and _slice != ():
+        # Ensure that _slice is of type slice
+        key = ndindex.ndindex(_slice).expand(shape).raw
+        _slice = tuple(k if isinstance(k, slice) else slice(k, k + 1, None) for k in key)
+        # Ensure that slices do not have any None as start or stop
+        _slice = tuple(slice(s.start or 0, s.stop or shape[i], s.step) for i, s in enumerate(_slice))
+
+    # Plan the (chunk) slices to be evaluated
     chunks_idx, nchunks = get_chunks_idx(shape, chunks)
-    lenout = 0
-    behaved = False
+    plan = []
     for nchunk in range(nchunks):
         coords = tuple(np.unravel_index(nchunk, chunks_idx))
-        chunk_operands = {}
         # Calculate the shape of the (chunk) slice_ (specially at the end of the array)
         slice_ = tuple(
             slice(c * s, min((c + 1) * s, shape[i]))
@@ -864,12 +1754,6 @@ def slices_eval(  # noqa: C901
         offset = tuple(s.start for s in slice_)  # offset for the udf
         # Check whether current slice_ intersects with _slice
         if _slice is not None and _slice != ():
-            # Ensure that _slice is of type slice
-            key = ndindex.ndindex(_slice).expand(shape).raw
-            _slice = tuple(k if isinstance(k, slice) else slice(k, k + 1, None) for k in key)
-            # Ensure that slices do not have any None as start or stop
-            _slice = tuple(slice(s.start or 0, s.stop or shape[i], s.step) for i, s in enumerate(_slice))
-            slice_ = tuple(slice(s.start or 0, s.stop or shape[i], s.step) for i, s in enumerate(slice_))
             intersects = do_slices_intersect(_slice, slice_)
             if not intersects:
                 continue
@@ -878,21 +1762,41 @@ def slices_eval(  # noqa: C901
                 slice(max(s1.start, s2.start), min(s1.stop, s2.stop))
                 for s1, s2 in zip(slice_, _slice, strict=True)
             )
+        if zonemaps and not may_match(condition, get_zonemap_ranges(zonemaps, slice_)):
+            # No item can satisfy the condition
+            continue
+        plan.append((nchunk, slice_, offset))
+    # Operands with other chunks are read through a working set of their decompressed chunks,
+    # so that chunks overlapping with several slices are not decompressed again
+    readers = get_overlap_readers(operands, shape, chunks, [slice_ for _, slice_, _ in plan])
+    if where is not None and len(where) == 2 and not callable(expression):
+        # numexpr is a bit faster than np.where, and we can fuse operations in this case
+        where_expr = f"where({expression}, _where_x, _where_y)"
+
+    # The items selected in the chunks of a slab (along the first dimension) interleave, so
+    # they are gathered with their positions, and put in C order before being written
+    slab_nchunks = math.prod(get_chunks_idx(shape, chunks)[0][1:])
+    reorder = bool(zonemaps) and slab_nchunks > 1
+    slab, slab_parts = None, []
+
+    # Iterate over the operands and get the chunks
+    lenout = 0
+    behaved = False
+    for nchunk, slice_, offset in plan:
+        if slab_parts and nchunk // slab_nchunks != slab:
+            result = c_order_items(slab_parts)
+            out[lenout : lenout + len(result)] = result
+            lenout += len(result)
+            slab_parts = []
+        slab = nchunk // slab_nchunks
         slice_shape = tuple(s.stop - s.start for s in slice_)
-        # Get the slice of each operand
-        for key, value in operands.items():
-            if np.isscalar(value):
-                chunk_operands[key] = value
-                continue
-            if value.shape == ():
-                chunk_operands[key] = value[()]
-                continue
-            if check_smaller_shape(value, shape, slice_shape):
-                # We need to fetch the part of the value that broadcasts with the operand
-                smaller_slice = compute_smaller_slice(shape, value.shape, slice_)
-                chunk_operands[key] = value[smaller_slice]
-                continue
-            chunk_operands[key] = value[slice_]
+        out_slice = slice_
+        if region_out:
+            # Place the result relative to the start of the region
+            out_slice = tuple(
+                slice(s.start - r.start, s.stop - r.start) for s, r in zip(slice_, _slice, strict=True)
+            )
+        chunk_operands = get_slice_operands(operands, shape, slice_, readers)
 
         # Evaluate the expression using chunks of operands
 
@@ -900,23 +1804,25 @@ def slices_eval(  # noqa: C901
             result = np.empty(slice_shape, dtype=out.dtype)
             # Call the udf directly and use result as the output array
             expression(tuple(chunk_operands.values()), result, offset=offset)
-            out[slice_] = result
+            out[out_slice] = result
             continue
 
         if where is None:
-            result = ne.evaluate(expression, chunk_operands)
+            result = ne_evaluate(expression, chunk_operands)
         else:
             # Apply the where condition (in result)
             if len(where) == 2:
                 # x = chunk_operands["_where_x"]
                 # y = chunk_operands["_where_y"]
                 # result = np.where(result, x, y)
-                # numexpr is a bit faster than np.where, and we can fuse operations in this case
-                new_expr = f"where({expression}, _where_x, _where_y)"
-                result = ne.evaluate(new_expr, chunk_operands)
+                result = ne_evaluate(where_expr, chunk_operands)
             elif len(where) == 1:
-                result = ne.evaluate(expression, chunk_operands)
+                result = ne_evaluate(expression, chunk_operands)
                 x = chunk_operands["_where_x"]
+                if reorder:
+                    mask = np.broadcast_to(result, slice_shape)
+                    coords = tuple(c + s.start for c, s in zip(np.nonzero(mask), slice_, strict=True))
+                    positions = np.ravel_multi_index(coords, shape)
                 result = x[result]
             else:
                 # result = np.asarray(result).nonzero()
@@ -947,7 +1853,9 @@ def slices_eval(  # noqa: C901
                 # Fast path
                 out.schunk.update_data(nchunk, result, copy=False)
             else:
-                out[slice_] = result
+                out[out_slice] = result
+        elif reorder:
+            slab_parts.append((positions, result))
         elif len(where) == 1:
             lenres = len(result)
             out[lenout : lenout + lenres] = result
@@ -955,7 +1863,18 @@ def slices_eval(  # noqa: C901
         else:
             raise ValueError("The where condition must be a tuple with one or two elements")
 
-    if orig_slice is not None:
+    if slab_parts:
+        result = c_order_items(slab_parts)
+        out[lenout : lenout + len(result)] = result
+        lenout += len(result)
+
+    if out is None and zonemaps:
+        # All the chunks have been skipped
+        dtype = where["_where_x"].dtype
+        kwargs.pop("chunks", None)
+        out = np.empty(0, dtype=dtype) if getitem else blosc2.empty(0, dtype=dtype, **kwargs)
+
+    if orig_slice is not None and not region_out:
         if isinstance(out, np.ndarray):
             out = out[orig_slice]
         elif isinstance(out, blosc2.NDArray):
@@ -971,11 +1890,657 @@ def slices_eval(  # noqa: C901
     return out
 
 
+def nonzero_eval(expression: str, operands: dict, **kwargs) -> np.ndarray | blosc2.NDArray:  # noqa: C901
+    """Get the (flat) positions of the items where a boolean expression is true.
+
+    The expression is evaluated chunk by chunk, and only the positions of the true items
+    are kept, so no boolean array of the full shape is ever built.  Chunks that cannot
+    have true items according to the zone maps of the operands are skipped.
+
+    The chunks are walked in C order, in slabs of chunks along the first dimension.  The
+    positions in a slab come after the ones in the previous slabs, so only the (true)
+    positions in the chunks of a slab need to be sorted before they are output.
+
+    Parameters
+    ----------
+    expression: str
+        The (boolean) expression to evaluate.
+    operands: dict
+        A dictionary containing the operands for the expression.
+    kwargs: dict, optional
+        If given, the positions are written into an :ref:`NDArray` created with these
+        keyword arguments (as they are found), instead of a NumPy array.
+
+    Returns
+    -------
+    np.ndarray or :ref:`NDArray`
+        The positions (in C order) of the true items, as int64 values.
+    """
+    shape = compute_broadcast_shape(operands.values())
+    operands_ = [o for o in operands.values() if hasattr(o, "chunks") and o.shape == shape]
+    zonemaps = get_zonemaps(operands, shape)
+    if zonemaps:
+        chunks = next(iter(zonemaps.values()))[0].chunks
+    elif operands_:
+        chunks = operands_[0].chunks
+    else:
+        chunks = compute_chunks_blocks(shape)[0]
+    condition = ast.parse(expression, mode="eval").body
+
+    chunks_idx, nchunks = get_chunks_idx(shape, chunks)
+    plan = []
+    for nchunk in range(nchunks):
+        coords = np.unravel_index(nchunk, chunks_idx)
+        slice_ = tuple(
+            slice(c * s, min((c + 1) * s, shape[i]))
+            for i, (c, s) in enumerate(zip(coords, chunks, strict=True))
+        )
+        if not zonemaps or may_match(condition, get_zonemap_ranges(zonemaps, slice_)):
+            plan.append((nchunk, slice_))
+    readers = get_overlap_readers(operands, shape, chunks, [slice_ for _, slice_ in plan])
+    out = writer = None
+    if kwargs:
+        # The positions cannot be more than the items; the chunks not written are not stored
+        out = blosc2.empty(math.prod(shape), dtype=np.int64, **kwargs)
+        writer = ChunkedWriter(out)
+    positions = []
+    slab_nchunks = math.prod(chunks_idx[1:])
+    for _, slab in itertools.groupby(plan, key=lambda p: p[0] // slab_nchunks):
+        slab_positions = []
+        for _, slice_ in slab:
+            chunk_operands = get_slice_operands(operands, shape, slice_, readers)
+            slice_shape = tuple(s.stop - s.start for s in slice_)
+            result = np.broadcast_to(ne_evaluate(expression, chunk_operands), slice_shape)
+            coords = tuple(c + s.start for c, s in zip(np.nonzero(result), slice_, strict=True))
+            slab_positions.append(np.ravel_multi_index(coords, shape).astype(np.int64, copy=False))
+        slab_positions = np.concatenate(slab_positions)
+        if slab_nchunks > 1:
+            # The positions in the chunks of a slab interleave
+            slab_positions.sort()
+        if writer is not None:
+            writer.write(slab_positions)
+        else:
+            positions.append(slab_positions)
+    if writer is not None:
+        writer.flush()
+        out.resize((writer.offset,))
+        return out
+    if not positions:
+        return np.empty(0, dtype=np.int64)
+    return np.concatenate(positions)
+
+
+class ChunkedWriter:
+    """Write consecutive pieces of values into a 1-dim NDArray.
+
+    The pieces are buffered, so only whole chunks are written, and none of them has to be
+    decompressed and recompressed again.  Call :meth:`flush` after the last piece.
+    """
+
+    def __init__(self, arr):
+        self.arr = arr
+        self.offset = 0
+        self.pending = []
+        self.npending = 0
+
+    def write(self, values):
+        self.pending.append(values)
+        self.npending += len(values)
+        if self.npending >= self.arr.chunks[0]:
+            self.flush(whole_chunks=True)
+
+    def flush(self, whole_chunks=False):
+        if self.npending == 0:
+            return
+        pending = np.concatenate(self.pending)
+        nwrite = self.npending - self.npending % self.arr.chunks[0] if whole_chunks else self.npending
+        self.arr[self.offset : self.offset + nwrite] = pending[:nwrite]
+        self.offset += nwrite
+        self.pending = [pending[nwrite:]]
+        self.npending -= nwrite
+
+
+# The ufuncs for the scans, where the carry of the previous chunks is combined
+# with the (local) scan of every chunk.
+scan_ufuncs = {
+    "cumsum": np.add,
+    "cumprod": np.multiply,
+    "cummax": np.maximum,
+    "cummin": np.minimum,
+}
+
+
+def scan_eval(  # noqa: C901
+    expression: str, operands: dict, op: str, axis: int | None, dtype: np.dtype, **kwargs
+) -> blosc2.NDArray:
+    """Compute a cumulative operation (a scan) of an expression along an axis.
+
+    The chunks of the output are evaluated one at a time, walking along `axis` for every
+    cross-section of chunks, and the boundary values of the last chunk (the carry) are
+    combined with the next one.  This way, only a chunk and its cross-section are kept in
+    memory, and the result is written straight into a new NDArray.
+
+    Parameters
+    ----------
+    expression: str
+        The expression to evaluate.
+    operands: dict
+        A dictionary containing the operands for the expression.
+    op: str
+        The scan to compute: 'cumsum', 'cumprod', 'cummax' or 'cummin'.
+    axis: int, optional
+        The axis along which to compute the scan.  If None, it is computed over the
+        flattened (in C order) array, in slabs of chunks along the first dimension.
+    dtype: np.dtype
+        The dtype of the result, which is also used for accumulating.
+    kwargs: dict, optional
+        Keyword arguments that are supported by the :func:`empty` constructor.
+
+    Returns
+    -------
+    :ref:`NDArray`
+        The result of the scan.
+    """
+    ufunc = scan_ufuncs[op]
+    shape = compute_broadcast_shape(operands.values())
+    operands_ = [o for o in operands.values() if hasattr(o, "chunks") and o.shape == shape]
+    chunks = operands_[0].chunks if operands_ else compute_chunks_blocks(shape)[0]
+    dtype = np.dtype(dtype)
+    if operands_ and (axis is not None or len(shape) == 1) and not {"chunks", "blocks"} & kwargs.keys():
+        # The output has the same partitions as the input, so chunks are written as a whole
+        kwargs = {"chunks": operands_[0].chunks, "blocks": operands_[0].blocks, **kwargs}
+
+    if axis is None:
+        # The flattened array is scanned in slabs made of a row of chunks along the first axis
+        if len(shape) == 0:
+            slices = [()]
+        else:
+            slices = [
+                (slice(start, min(start + chunks[0], shape[0])), *(slice(0, s) for s in shape[1:]))
+                for start in range(0, shape[0], chunks[0])
+            ]
+        out = blosc2.empty((math.prod(shape),), dtype=dtype, **kwargs)
+    else:
+        if not isinstance(axis, int | np.integer):
+            raise ValueError(f"axis must be an integer or None for {op}")
+        if not -len(shape) <= axis < len(shape):
+            raise np.exceptions.AxisError(axis, len(shape))
+        axis = int(axis) % len(shape)
+        out = blosc2.empty(shape, dtype=dtype, **kwargs)
+        # Walk along the axis (innermost) for every cross-section of chunks, so the carry
+        # is never larger than a chunk cross-section
+        chunks_idx, _ = get_chunks_idx(shape, out.chunks)
+        order = [i for i in range(len(shape)) if i != axis] + [axis]
+        slices = []
+        for coords in itertools.product(*(range(chunks_idx[i]) for i in order)):
+            coords = dict(zip(order, coords, strict=True))
+            slices.append(
+                tuple(
+                    slice(coords[i] * c, min((coords[i] + 1) * c, shape[i]))
+                    for i, c in enumerate(out.chunks)
+                )
+            )
+        chunks = out.chunks
+    if math.prod(shape) == 0:
+        return out
+
+    readers = get_overlap_readers(operands, shape, chunks, slices)
+    carry = None
+    writer = ChunkedWriter(out) if axis is None else None
+    for slice_ in slices:
+        chunk_operands = get_slice_operands(operands, shape, slice_, readers)
+        slice_shape = tuple(s.stop - s.start for s in slice_)
+        if expression == "o0":
+            # We don't have an actual expression, so avoid a copy
+            result = chunk_operands["o0"]
+        else:
+            result = np.broadcast_to(ne_evaluate(expression, chunk_operands), slice_shape)
+        if axis is None:
+            result = ufunc.accumulate(result.reshape(-1), dtype=dtype)
+            if carry is not None:
+                ufunc(result, carry, out=result)
+            carry = result[-1]
+            writer.write(result)
+            continue
+        if slice_[axis].start == 0:
+            # A new cross-section of chunks starts
+            carry = None
+        result = ufunc.accumulate(result, axis=axis, dtype=dtype)
+        if carry is not None:
+            ufunc(result, carry, out=result)
+        carry = np.take(result, [-1], axis=axis)
+        out[slice_] = result
+    if writer is not None:
+        writer.flush()
+    return out
+
+
+# Defaults for sorting out of core
+sort_dflts = {
+    # Maximum size (in bytes) of the runs that are sorted in memory
+    "max_bytes": 2**28,
+}
+"""
+Defaults for sorting out of core: ``max_bytes`` is the maximum size of the runs that are
+sorted in memory.
+"""
+
+
+def sort_keys(values, order):
+    """Get the keys for sorting `values`, with the fields in `order` first (as in NumPy)."""
+    if order is None:
+        return values
+    if values.dtype.names is None:
+        raise ValueError("Cannot specify order when the array has no fields.")
+    names = [order] if isinstance(order, str) else list(order)
+    return values[names + [name for name in values.dtype.names if name not in names]]
+
+
+def stable_argsort(keys):
+    """Get the indices that sort `keys`, keeping the order of the equal ones.
+
+    An unstable sort is much faster (e.g. for floats), and it is enough when there are no
+    duplicated keys, which is checked afterwards.
+    """
+    indices = np.argsort(keys)
+    if keys.dtype.names is None:
+        sorted_keys = keys[indices]
+        duplicated = sorted_keys[1:] == sorted_keys[:-1]
+        if keys.dtype.kind in "fc":
+            # NaNs are not equal to each other, but their order matters too
+            duplicated |= np.isnan(sorted_keys[1:]) & np.isnan(sorted_keys[:-1])
+        if not duplicated.any():
+            return indices
+    return np.argsort(keys, kind="stable")
+
+
+def merge_runs(runs, runs_idx, run_len, order, writer):
+    """Merge sorted runs of `runs` (of `run_len` items each) with a k-way merge.
+
+    The merged values are written with `writer`, or their indices if `runs_idx` (the
+    original indices of the values in every run) is given.  Every run is read a chunk
+    at a time.  In each step, the items that are not larger
+    than the last one buffered for some pending run (the bound) are merged and written,
+    so memory is bounded by a chunk per run.  Ties are resolved in favour of the earlier
+    runs, which keeps the merge stable.
+    """
+    n = runs.shape[0]
+    step = runs.chunks[0]
+    pos = list(range(0, n, run_len))
+    ends = [min(start + run_len, n) for start in pos]
+    bufs = [np.empty(0, dtype=runs.dtype) for _ in pos]
+    idx_bufs = [np.empty(0, dtype=np.int64) for _ in pos]
+    while True:
+        for r in range(len(pos)):
+            if len(bufs[r]) == 0 and pos[r] < ends[r]:
+                stop = min(pos[r] + step, ends[r])
+                bufs[r] = runs[pos[r] : stop]
+                if runs_idx is not None:
+                    idx_bufs[r] = runs_idx[pos[r] : stop]
+                pos[r] = stop
+        active = [r for r in range(len(pos)) if len(bufs[r]) > 0]
+        if not active:
+            break
+        keys = {r: sort_keys(bufs[r], order) for r in active}
+        pending = [r for r in active if pos[r] < ends[r]]
+        cuts = {r: len(bufs[r]) for r in active}
+        if pending:
+            # The first (stable) minimum of the last buffered keys of the pending runs
+            lasts = np.concatenate([keys[r][-1:] for r in pending])
+            first = np.argsort(lasts, kind="stable")[0]
+            bound, rbound = lasts[first : first + 1], pending[first]
+            for r in active:
+                # Items equal to the bound in later runs must wait for the ones in `rbound`
+                side = "right" if r <= rbound else "left"
+                cuts[r] = np.searchsorted(keys[r], bound, side=side)[0]
+        pieces = [r for r in active if cuts[r] > 0]
+        if runs_idx is None:
+            # Equal values cannot be told apart, so a (faster) unstable sort is fine
+            writer.write(np.sort(np.concatenate([bufs[r][: cuts[r]] for r in pieces]), order=order))
+        else:
+            merged_keys = np.concatenate([keys[r][: cuts[r]] for r in pieces])
+            indices = stable_argsort(merged_keys)
+            writer.write(np.concatenate([idx_bufs[r][: cuts[r]] for r in pieces])[indices])
+        for r in pieces:
+            bufs[r] = bufs[r][cuts[r] :]
+            idx_bufs[r] = idx_bufs[r][cuts[r] :]
+    writer.flush()
+
+
+def sort_eval(  # noqa: C901
+    expression: str,
+    operands: dict,
+    dtype: np.dtype,
+    order: str | list[str] | None = None,
+    argsort: bool = False,
+    nworkers: int = 1,
+    **kwargs,
+) -> blosc2.NDArray:
+    """Sort the values of a 1-dim expression out of core (i.e. an external merge sort).
+
+    The expression is evaluated in runs of whole chunks (of up to ``sort_dflts["max_bytes"]``),
+    which are sorted in memory (in parallel when `nworkers` > 1) and stored compressed.  The
+    runs are then merged (see :func:`merge_runs`) straight into a new NDArray.  The sort is
+    stable.
+
+    Parameters
+    ----------
+    expression: str
+        The expression to evaluate.
+    operands: dict
+        A dictionary containing the operands for the expression.
+    dtype: np.dtype
+        The dtype of the values.
+    order: str or list of str, optional
+        The fields to compare first, for structured dtypes.
+    argsort: bool, optional
+        Whether to return the indices that sort the values, instead of the sorted values.
+    nworkers: int, optional
+        The number of threads sorting runs in parallel.
+    kwargs: dict, optional
+        Keyword arguments that are supported by the :func:`empty` constructor.  If they
+        contain an `urlpath`, the runs are stored in a temporary directory next to it.
+
+    Returns
+    -------
+    :ref:`NDArray`
+        The sorted values, or the indices that sort them.
+    """
+    shape = compute_broadcast_shape(operands.values())
+    if len(shape) != 1:
+        raise ValueError("only 1-dimensional arrays can be sorted")
+    dtype = np.dtype(dtype)
+    if order is not None and dtype.names is None:
+        raise ValueError("Cannot specify order when the array has no fields.")
+    n = shape[0]
+    operands_ = [o for o in operands.values() if hasattr(o, "chunks") and o.shape == shape]
+    if operands_:
+        chunks, blocks = operands_[0].chunks, operands_[0].blocks
+    else:
+        chunks, blocks = compute_chunks_blocks(shape, dtype=dtype)
+    if not {"chunks", "blocks"} & kwargs.keys():
+        kwargs = {"chunks": chunks, "blocks": blocks, **kwargs}
+    out = blosc2.empty(shape, dtype=np.int64 if argsort else dtype, **kwargs)
+    # Runs are made of whole chunks, so every chunk is read once
+    run_len = max(chunks[0], sort_dflts["max_bytes"] // dtype.itemsize // chunks[0] * chunks[0])
+    nruns = math.ceil(n / run_len)
+
+    def sort_run(nrun):
+        slice_ = (slice(nrun * run_len, min((nrun + 1) * run_len, n)),)
+        chunk_operands = get_slice_operands(operands, shape, slice_, {})
+        if expression == "o0":
+            values = chunk_operands["o0"]
+        else:
+            values = np.broadcast_to(
+                ne_evaluate(expression, chunk_operands), (slice_[0].stop - slice_[0].start,)
+            )
+        if not argsort:
+            # Equal values cannot be told apart, so a (faster) unstable sort is fine
+            return slice_[0], np.sort(values, order=order), None
+        indices = stable_argsort(sort_keys(values, order))
+        return slice_[0], values[indices], indices + slice_[0].start
+
+    if nruns <= 1:
+        # A single run is sorted in memory
+        for slice_, values, indices in ordered_chunk_map(sort_run, nruns):
+            out[slice_] = indices if argsort else values
+        return out
+
+    urlpath = kwargs.get("urlpath")
+    if urlpath is not None:
+        # The output is persistent, so keep the runs out of memory too
+        tmpdir = tempfile.TemporaryDirectory(dir=os.path.dirname(urlpath) or None)
+    else:
+        tmpdir = contextlib.nullcontext()
+    with tmpdir as tmpdir:
+        runs_urlpath = None if tmpdir is None else os.path.join(tmpdir, "runs.b2nd")
+        runs = blosc2.empty(shape, dtype=dtype, chunks=chunks, blocks=blocks, urlpath=runs_urlpath)
+        runs_idx = None
+        if argsort:
+            idx_urlpath = None if tmpdir is None else os.path.join(tmpdir, "runs_idx.b2nd")
+            runs_idx = blosc2.empty(shape, dtype=np.int64, chunks=chunks, blocks=blocks, urlpath=idx_urlpath)
+        for slice_, values, indices in ordered_chunk_map(sort_run, nruns, nworkers):
+            runs[slice_] = values
+            if argsort:
+                runs_idx[slice_] = indices
+        merge_runs(runs, runs_idx, run_len, order, ChunkedWriter(out))
+    return out
+
+
+# The aggregations supported by GroupBy.agg
+groupby_ops = ("count", "sum", "mean", "std", "var", "min", "max")
+
+
+def group_table(keys, values, stats):
+    """Get the partial statistics of every group in a chunk.
+
+    Integer keys spanning no more values than the chunk are grouped in a dense array
+    (indexed by the key); the rest are grouped by sorting the keys.
+
+    Parameters
+    ----------
+    keys: np.ndarray
+        The (flattened) keys of the chunk.
+    values: dict
+        The (flattened) values of the aggregated fields in the chunk.
+    stats: set
+        The (statistic, field) pairs to compute.  The statistics can be 'sum', 'min',
+        'max' and 'm2' (the sum of the squared deviations from the mean).
+
+    Returns
+    -------
+    tuple
+        The sorted unique keys, and a dict mapping 'count' and every (statistic, field)
+        pair to an array with the statistic of every group.
+    """
+    dense = keys.dtype.kind in "biu" and len(keys) > 0
+    if dense:
+        kmin = int(keys.min())
+        span = int(keys.max()) - kmin + 1
+        dense = span <= len(keys)
+    if dense:
+        slots = keys.astype(np.int64) - kmin
+        ngroups = span
+    else:
+        group_keys, slots = np.unique(keys, return_inverse=True)
+        ngroups = len(group_keys)
+    count = np.bincount(slots, minlength=ngroups)
+    table = {"count": count}
+    for stat, field in sorted(stats):
+        # Fields of structured chunks are strided, which makes ufunc.at much slower
+        v = np.ascontiguousarray(values[field])
+        if stat == "sum":
+            acc_dtype = np.add.reduce(np.zeros(1, dtype=v.dtype)).dtype
+            if v.dtype.kind == "f":
+                table[stat, field] = np.bincount(slots, weights=v, minlength=ngroups).astype(acc_dtype)
+            else:
+                table[stat, field] = np.zeros(ngroups, dtype=acc_dtype)
+                np.add.at(table[stat, field], slots, v)
+        elif stat in ("min", "max"):
+            ufunc = np.minimum if stat == "min" else np.maximum
+            # Start with any value of every group, so no identity is needed
+            table[stat, field] = np.empty(ngroups, dtype=v.dtype)
+            table[stat, field][slots] = v
+            ufunc.at(table[stat, field], slots, v)
+        else:
+            sums = table.get(("sum", field))
+            if sums is None:
+                sums = np.bincount(slots, weights=v.real, minlength=ngroups)
+                if v.dtype.kind == "c":
+                    sums = sums + 1j * np.bincount(slots, weights=v.imag, minlength=ngroups)
+            dev = v - (sums / np.maximum(count, 1))[slots]
+            table[stat, field] = np.bincount(slots, weights=np.abs(dev) ** 2, minlength=ngroups)
+    if dense:
+        used = np.flatnonzero(count)
+        group_keys = (used + kmin).astype(keys.dtype)
+        table = {name: stat[used] for name, stat in table.items()}
+    return group_keys, table
+
+
+def merge_tables(table1, table2):
+    """Merge two tables of partial statistics of groups (see :func:`group_table`)."""
+    keys1, stats1 = table1
+    keys2, stats2 = table2
+    group_keys, inverse = np.unique(np.concatenate([keys1, keys2]), return_inverse=True)
+    slots1, slots2 = inverse[: len(keys1)], inverse[len(keys1) :]
+    # The rows of the first table for the groups in both tables
+    rows1 = np.full(len(group_keys), -1, dtype=np.int64)
+    rows1[slots1] = np.arange(len(keys1))
+    shared = rows1[slots2] >= 0
+    both1, both2 = rows1[slots2[shared]], np.flatnonzero(shared)
+    count1, count2 = stats1["count"][both1], stats2["count"][both2]
+    merged = {}
+    for name in stats1:
+        stat1, stat2 = stats1[name], stats2[name]
+        out = np.empty(len(group_keys), dtype=np.result_type(stat1, stat2))
+        out[slots1] = stat1
+        out[slots2[~shared]] = stat2[~shared]
+        kind = name if isinstance(name, str) else name[0]
+        if kind in ("count", "sum"):
+            combined = stat1[both1] + stat2[both2]
+        elif kind == "min":
+            combined = np.minimum(stat1[both1], stat2[both2])
+        elif kind == "max":
+            combined = np.maximum(stat1[both1], stat2[both2])
+        else:
+            # Chan et al. parallel algorithm, as in merge_moments
+            sum1, sum2 = stats1["sum", name[1]][both1], stats2["sum", name[1]][both2]
+            delta = sum2 / count2 - sum1 / count1
+            combined = (
+                stat1[both1] + stat2[both2] + np.abs(delta) ** 2 * (count1 * count2 / (count1 + count2))
+            )
+        out[slots2[shared]] = combined
+        merged[name] = out
+    return group_keys, merged
+
+
+class GroupBy:
+    """Group the items of a structured :ref:`NDArray` by the values of one of its fields.
+
+    Instances are created with :meth:`NDArray.groupby`.
+    """
+
+    def __init__(self, ndarr: blosc2.NDArray, key: str):
+        if ndarr.dtype.fields is None:
+            raise TypeError("NDArray does not have a structured dtype!")
+        if key not in ndarr.dtype.fields:
+            raise TypeError(f"Field {key} not found in the dtype of the NDArray")
+        self.ndarr = ndarr
+        self.key = key
+
+    def agg(self, aggs: dict, ddof: int = 0, nworkers: int = 1, **kwargs: dict) -> blosc2.NDArray:  # noqa: C901
+        """Aggregate fields of every group.
+
+        The chunks are read (in parallel when `nworkers` > 1) and their groups aggregated
+        into tables of partial statistics, which are merged pairwise in chunk order.  Memory
+        is bounded by a chunk plus the tables, whose size is proportional to the number of
+        groups.
+
+        Parameters
+        ----------
+        aggs: dict
+            A mapping from field names to an aggregation (or a list of them).  The
+            aggregations can be 'count', 'sum', 'mean', 'std', 'var', 'min' and 'max'.
+        ddof: int, optional
+            Means Delta Degrees of Freedom for the 'std' and 'var' aggregations.
+            By default, ddof is zero (as in NumPy).
+        nworkers: int, optional
+            The number of threads aggregating chunks in parallel.  Default is 1.
+        kwargs: dict, optional
+            Additional keyword arguments that are supported by the :func:`empty` constructor.
+
+        Returns
+        -------
+        out: :ref:`NDArray`
+            A 1-dim structured array with a row per group (sorted by the key).  Its first
+            field is the key, followed by a field per aggregation, named as
+            ``<field>_<aggregation>`` (e.g. ``temp_mean``).
+
+        Examples
+        --------
+        >>> import blosc2
+        >>> import numpy as np
+        >>> dtype = np.dtype([("sensor", np.int32), ("temp", np.float64)])
+        >>> data = np.array([(1, 20.0), (2, 15.0), (1, 22.0), (2, 17.0), (3, 9.0)], dtype=dtype)
+        >>> events = blosc2.asarray(data)
+        >>> stats = events.groupby("sensor").agg({"temp": ["mean", "max"]})
+        >>> stats[:]["temp_mean"]
+        array([21., 16.,  9.])
+        >>> stats[:]["temp_max"]
+        array([22., 17.,  9.])
+        """
+        ndarr, fields = self.ndarr, self.ndarr.dtype.fields
+        columns = []
+        for field, ops in aggs.items():
+            if field not in fields:
+                raise TypeError(f"Field {field} not found in the dtype of the NDArray")
+            for op in [ops] if isinstance(ops, str) else ops:
+                if op not in groupby_ops:
+                    raise ValueError(f"Unsupported aggregation: {op}")
+                columns.append((f"{field}_{op}", field, op))
+        stats = set()
+        for _, field, op in columns:
+            if op in ("sum", "mean", "std", "var"):
+                stats.add(("sum", field))
+            if op in ("std", "var"):
+                stats.add(("m2", field))
+            if op in ("min", "max"):
+                stats.add((op, field))
+        agg_fields = {field for _, field, _ in columns}
+
+        chunks_idx, nchunks = get_chunks_idx(ndarr.shape, ndarr.chunks)
+
+        def chunk_table(nchunk):
+            coords = np.unravel_index(nchunk, chunks_idx)
+            slice_ = tuple(
+                slice(c * s, min((c + 1) * s, ndarr.shape[i]))
+                for i, (c, s) in enumerate(zip(coords, ndarr.chunks, strict=True))
+            )
+            chunk = np.asarray(ndarr[slice_]).reshape(-1)
+            return group_table(chunk[self.key], {field: chunk[field] for field in agg_fields}, stats)
+
+        tree = []
+        for table in ordered_chunk_map(chunk_table, nchunks, nworkers):
+            push_partial(tree, table, merge_tables)
+        if tree:
+            group_keys, table = pop_partials(tree, merge_tables)
+        else:
+            empty = np.empty(0, dtype=ndarr.dtype)
+            group_keys, table = group_table(empty[self.key], {f: empty[f] for f in agg_fields}, stats)
+
+        count = table["count"]
+        dtype, results = [(self.key, fields[self.key][0])], [group_keys]
+        for name, field, op in columns:
+            field_dtype = fields[field][0]
+            if op == "count":
+                result = count
+            elif op in ("sum", "min", "max"):
+                result = table[op, field]
+            else:
+                mean_dtype = get_moments_dtypes(field_dtype)[0]
+                if op == "mean":
+                    result = table["sum", field] / count
+                else:
+                    result = table["m2", field] / (count - ddof)
+                    if op == "std":
+                        result = np.sqrt(result)
+                result = result.astype(
+                    moments_dtype(ReduceOp.MEAN if op == "mean" else ReduceOp.VAR, mean_dtype)
+                )
+            dtype.append((name, result.dtype))
+            results.append(result)
+        out = np.empty(len(group_keys), dtype=dtype)
+        for (name, _), result in zip(dtype, results, strict=True):
+            out[name] = result
+        return blosc2.asarray(out, **kwargs)
+
+
 def reduce_slices(  # noqa: C901
     expression: str | Callable[[tuple, np.ndarray, tuple[int]], None],
     operands: dict,
     reduce_args,
     _slice=None,
+    nworkers: int = 1,
     **kwargs,
 ) -> blosc2.NDArray | np.ndarray:
     """Evaluate the expression in chunks of operands.
@@ -990,10 +2555,17 @@ def reduce_slices(  # noqa: C901
     operands: dict
         A dictionary containing the operands for the operands.
     reduce_args: dict
-        A dictionary with arguments to be passed to the reduction function.
+        A dictionary with arguments to be passed to the reduction function.  If its
+        "op" entry is a tuple of reduction operations, all of them are computed from
+        the same evaluated chunks and a dict mapping each operation to its result
+        is returned.
     _slice: slice, list of slices, optional
         If provided, only the chunks that intersect with this slice
         will be evaluated.
+    nworkers: int, optional
+        The number of threads evaluating and reducing chunks in parallel.  The partial
+        results are combined in the same (pairwise) order whatever the number of
+        threads, so results are reproducible.  Default is 1.
     kwargs: dict, optional
         Additional keyword arguments supported by the :func:`empty` constructor.
 
@@ -1005,13 +2577,46 @@ def reduce_slices(  # noqa: C901
     out = kwargs.pop("_output", None)
     where: dict | None = kwargs.pop("_where_args", None)
     reduce_op = reduce_args.pop("op")
+    # Several reductions can be fed from the same evaluated chunk (see LazyExpr.aggregate)
+    multi_op = isinstance(reduce_op, tuple)
+    reduce_ops = reduce_op if multi_op else (reduce_op,)
     axis = reduce_args["axis"]
     keepdims = reduce_args["keepdims"]
-    dtype = reduce_args["dtype"] if reduce_op in (ReduceOp.SUM, ReduceOp.PROD) else None
+    ddof = reduce_args.pop("ddof", 0)
+    dtype = reduce_args.pop("dtype", None)
+    # mean, std and var are computed in a single pass by merging the statistics of every chunk
+    moments = None
+    moment_ops = [op for op in reduce_ops if op in (ReduceOp.MEAN, ReduceOp.STD, ReduceOp.VAR)]
+    # argmax, argmin and topk keep the best candidates of every output item (see chunk_candidates)
+    select_op = reduce_op if reduce_op in (ReduceOp.ARGMAX, ReduceOp.ARGMIN, ReduceOp.TOPK) else None
+    k = reduce_args.pop("k", 1)
+    largest = reduce_args.pop("largest", select_op != ReduceOp.ARGMIN)
+    # As in NumPy, argmin and argmax prefer NaNs, whereas topk sorts them last
+    nans_first = select_op == ReduceOp.ARGMIN
+    # histogram and bincount add up the counts of every chunk (see chunk_counts)
+    bin_op = reduce_op if reduce_op in (ReduceOp.HISTOGRAM, ReduceOp.BINCOUNT) else None
+    bins = reduce_args.pop("bins", None)
+    bin_range = reduce_args.pop("range", None)
+    density = reduce_args.pop("density", False)
+    minlength = reduce_args.pop("minlength", 0)
+    outs = {op: None for op in reduce_ops if op not in moment_ops and op not in (select_op, bin_op)}
+    dtypes = {op: dtype if op in (ReduceOp.SUM, ReduceOp.PROD) else None for op in outs}
+    if out is not None and reduce_op in outs:
+        outs[reduce_op] = out
 
     # Compute the shape and chunks of the output array, including broadcasting
     shape = compute_broadcast_shape(operands.values())
 
+    select_axis = None
+    if select_op is not None:
+        if axis is not None and not isinstance(axis, int | np.integer):
+            raise ValueError(f"axis must be an integer or None for {select_op.__name__}")
+        if not isinstance(k, int | np.integer) or k < 1:
+            raise ValueError("k must be a positive integer")
+        if axis is not None:
+            if not -len(shape) <= axis < len(shape):
+                raise np.exceptions.AxisError(axis, len(shape))
+            select_axis = int(axis) % len(shape)
     if axis is None:
         axis = tuple(range(len(shape)))
     elif not isinstance(axis, tuple):
@@ -1045,15 +2650,34 @@ def reduce_slices(  # noqa: C901
         # iter_disk = all_ndarray and any_persisted
         # Experiments say that iter_disk is faster than the regular path for reductions
         # even when all operands are in memory, so no need to check any_persisted
-        iter_disk = all_ndarray
+        iter_disk = all_ndarray and _slice in (None, ())
         aligned = blosc2.are_partitions_aligned(shape, chunks, operand.blocks)
+        if len(axis) < len(shape) or select_op is not None:
+            # Decompressed chunks are laid out block after block, which is only equivalent
+            # to the C order of the chunk when the blocks are behaved
+            aligned = aligned and blosc2.are_partitions_behaved(shape, chunks, operand.blocks)
+    # The sequential disk reader does not make sense when chunks are fetched in parallel
+    iter_disk = iter_disk and nworkers <= 1
+    prefetcher = get_prefetcher(operands, aligned, reduc=True) if iter_disk else None
+
+    if where is not None and len(where) != 2:
+        raise ValueError(
+            "A where condition with less than 2 params in combination with reductions is not supported yet"
+        )
+    if where is not None and not callable(expression):
+        # numexpr is a bit faster than np.where, and we can fuse operations in this case
+        where_expr = f"where({expression}, _where_x, _where_y)"
+    if _slice is not None and _slice != ():
+        # Ensure that slices do not have any None as start or stop
+        _slice = tuple(slice(s.start or 0, s.stop or shape[i], s.step) for i, s in enumerate(_slice))
+    # Positions in positional reductions are relative to the reduced region
+    base = tuple(s.start for s in _slice) if _slice not in (None, ()) else (0,) * len(shape)
+    region_shape = tuple(s.stop - s.start for s in _slice) if _slice not in (None, ()) else shape
 
-    # Iterate over the operands and get the chunks
     chunks_idx, nchunks = get_chunks_idx(shape, chunks)
-    chunk_operands = {}
-
-    # Iterate over the operands and get the chunks
-    for nchunk in range(nchunks):
+
+    def eval_chunk(nchunk):  # noqa: C901
+        """Evaluate the expression on a chunk and get the partial reductions of it."""
         coords = tuple(np.unravel_index(nchunk, chunks_idx))
         # Calculate the shape of the (chunk) slice_ (specially at the end of the array)
         slice_ = tuple(
@@ -1067,12 +2691,10 @@ def reduce_slices(  # noqa: C901
         offset = tuple(s.start for s in slice_)  # offset for the udf
         # Check whether current slice_ intersects with _slice
         if _slice is not None and _slice != ():
-            # Ensure that slices do not have any None as start or stop
-            _slice = tuple(slice(s.start or 0, s.stop or shape[i], s.step) for i, s in enumerate(_slice))
             slice_ = tuple(slice(s.start or 0, s.stop or shape[i], s.step) for i, s in enumerate(slice_))
             intersects = do_slices_intersect(_slice, slice_)
             if not intersects:
-                continue
+                return None
             # Compute the part of the slice_ that intersects with _slice
             slice_ = tuple(
                 slice(max(s1.start, s2.start), min(s1.stop, s2.stop))
@@ -1080,23 +2702,27 @@ def reduce_slices(  # noqa: C901
             )
 
         chunks_ = tuple(s.stop - s.start for s in slice_)
+        chunk_slice = slice_
         if len(slice_) == 1:
             slice_ = slice_[0]
-        if len(reduced_slice) == 1:
-            reduced_slice = reduced_slice[0]
 
-        # To avoid overbooking memory, we need to clear the chunk_operands dict
-        chunk_operands.clear()
+        chunk_operands = {}
         if _slice in (None, ()) and fast_path:
             # Fast path
             full_chunk = chunks_ == chunks
             fill_chunk_operands(
-                operands, slice_, chunks_, full_chunk, aligned, nchunk, iter_disk, chunk_operands, reduc=True
+                operands,
+                slice_,
+                chunks_,
+                full_chunk,
+                aligned,
+                nchunk,
+                prefetcher,
+                chunk_operands,
+                reduc=True,
             )
         else:
             # Get the slice of each operand
-            chunk_operands = {}
-
             for key, value in operands.items():
                 if np.isscalar(value):
                     chunk_operands[key] = value
@@ -1111,85 +2737,400 @@ def reduce_slices(  # noqa: C901
                     continue
                 chunk_operands[key] = value[slice_]
 
-        # Evaluate and reduce the expression using chunks of operands
-
+        # Evaluate the expression using chunks of operands
         if callable(expression):
             # TODO: Implement the reductions for UDFs (and test them)
             result = np.empty(chunks_, dtype=out.dtype)
             expression(tuple(chunk_operands.values()), result, offset=offset)
-            # Reduce the result
-            result = reduce_op.value.reduce(result, **reduce_args)
-            # Update the output array with the result
-            out[reduced_slice] = reduce_op.value(out[reduced_slice], result)
-            continue
-
-        if where is None:
+        elif where is None:
             if expression == "o0":
                 # We don't have an actual expression, so avoid a copy
                 result = chunk_operands["o0"]
             else:
-                result = ne.evaluate(expression, chunk_operands)
+                result = ne_evaluate(expression, chunk_operands)
         else:
             # Apply the where condition (in result)
-            if len(where) == 2:
-                # x = chunk_operands["_where_x"]
-                # y = chunk_operands["_where_y"]
-                # result = np.where(result, x, y)
-                # numexpr is a bit faster than np.where, and we can fuse operations in this case
-                new_expr = f"where({expression}, _where_x, _where_y)"
-                result = ne.evaluate(new_expr, chunk_operands)
-            else:
-                raise ValueError(
-                    "A where condition with less than 2 params in combination with reductions"
-                    " is not supported yet"
-                )
+            result = ne_evaluate(where_expr, chunk_operands)
 
         # Reduce the result
-        if result.shape == ():
-            if reduce_op == ReduceOp.SUM and result[()] == 0:
-                # Avoid a reduction when result is a zero scalar. Faster for sparse data.
+        select_partial = None
+        if select_op is not None:
+            select_partial = chunk_candidates(
+                np.broadcast_to(result, chunks_),
+                chunk_slice,
+                base,
+                region_shape,
+                select_axis,
+                k,
+                largest,
+                nans_first,
+            )
+            if select_axis is not None:
+                select_slice = tuple(
+                    slice(s.start - b, s.stop - b)
+                    for i, (s, b) in enumerate(zip(chunk_slice, base, strict=True))
+                    if i != select_axis
+                )
+            else:
+                select_slice = ()
+            select_partial = (select_slice, *select_partial)
+        bin_partial = None
+        if bin_op is not None:
+            bin_partial = chunk_counts(result, chunks_, bin_op, bins, bin_range, minlength)
+        moments_partial = None
+        if moment_ops:
+            acc_dtype = get_moments_dtypes(result.dtype, dtype)[1]
+            moments_partial = chunk_moments(result, chunks_, axis, keepdims, acc_dtype)
+        partials = {}
+        for op in outs:
+            if result.shape == ():
+                if op == ReduceOp.SUM and result[()] == 0:
+                    # Avoid a reduction when result is a zero scalar. Faster for sparse data.
+                    continue
+                result = np.full(chunks_, result[()])
+            if op == ReduceOp.ANY:
+                partials[op] = np.any(result, **reduce_args)
+            elif op == ReduceOp.ALL:
+                partials[op] = np.all(result, **reduce_args)
+            else:
+                partials[op] = op.value.reduce(result, dtype=dtypes[op], **reduce_args)
+        return reduced_slice, result.dtype, partials, moments_partial, select_partial, bin_partial
+
+    # Every output slice gets its partials combined by a pairwise tree.  As the partials
+    # are delivered in chunk order, the result does not depend on the number of workers.
+    trees = {}
+    selections = {}
+    counts, bin_edges = None, None
+    try:
+        for chunk_result in ordered_chunk_map(eval_chunk, nchunks, nworkers):
+            if chunk_result is None:
                 continue
-            chunks_ = tuple(s.stop - s.start for s in slice_)
-            result = np.full(chunks_, result[()])
-        if reduce_op == ReduceOp.ANY:
-            result = np.any(result, **reduce_args)
-        elif reduce_op == ReduceOp.ALL:
-            result = np.all(result, **reduce_args)
+            reduced_slice, result_dtype, partials, moments_partial, select_partial, bin_partial = (
+                chunk_result
+            )
+
+            if bin_partial is not None:
+                # The counts are integers, so the order of the additions does not matter
+                counts = add_counts(counts, bin_partial[0])
+                bin_edges = bin_partial[1]
+
+            if select_partial is not None:
+                select_slice, values, positions = select_partial
+                key = tuple((sl.start, sl.stop) for sl in select_slice)
+                if key in selections:
+                    _, values_, positions_ = selections[key]
+                    values, positions = select_best(
+                        np.concatenate([values_, values], axis=-1),
+                        np.concatenate([positions_, positions], axis=-1),
+                        k,
+                        largest,
+                        nans_first,
+                    )
+                selections[key] = (select_slice, values, positions)
+
+            if moment_ops:
+                if moments is None:
+                    mean_dtype, acc_dtype = get_moments_dtypes(result_dtype, dtype)
+                    if not multi_op and is_inside_eval():
+                        # We already have the dtype and reduced_shape, so return immediately
+                        return blosc2.zeros(reduced_shape, dtype=moments_dtype(reduce_op, mean_dtype))
+                    moments = init_moments(reduced_shape, acc_dtype)
+                merge_moments(moments, reduced_slice, *moments_partial)
+
+            for op, partial in partials.items():
+                if outs[op] is None:
+                    out_dtype = partial.dtype if dtypes[op] is None else dtypes[op]
+                    if not multi_op and is_inside_eval():
+                        # We already have the dtype and reduced_shape, so return immediately
+                        # Use a blosc2 container, as it consumes less memory in general
+                        return blosc2.zeros(reduced_shape, dtype=out_dtype)
+                    outs[op] = convert_none_out(out_dtype, op, reduced_shape)
+                key = (op, tuple((sl.start, sl.stop) for sl in reduced_slice))
+                if key not in trees:
+                    trees[key] = (reduced_slice, [])
+                push_partial(trees[key][1], partial, reduce_combine(op))
+    finally:
+        if prefetcher is not None:
+            prefetcher.close()
+
+    if bin_op is not None:
+        if counts is None:
+            # Nothing to count (e.g. an empty array)
+            empty = np.empty(0, dtype=np.float64 if bin_op == ReduceOp.HISTOGRAM else np.int64)
+            counts, bin_edges = chunk_counts(empty, (0,), bin_op, bins, bin_range, minlength)
+        if density:
+            # As in NumPy, the integral over the range is 1
+            counts = counts / np.diff(bin_edges) / counts.sum()
+        if kwargs != {}:
+            counts = blosc2.asarray(counts, **kwargs)
+        return (counts, bin_edges) if bin_op == ReduceOp.HISTOGRAM else counts
+
+    if select_op is not None:
+        out = selection_result(selections, select_op, select_axis, region_shape, k, keepdims)
+        if kwargs != {}:
+            if isinstance(out, tuple):
+                return tuple(blosc2.asarray(o, **kwargs) for o in out)
+            if not np.isscalar(out):
+                return blosc2.asarray(out, **kwargs)
+        return out
+
+    # Update the output arrays with the combined partials
+    for (op, _), (reduced_slice, tree) in trees.items():
+        combine = reduce_combine(op)
+        result = pop_partials(tree, combine)
+        out = outs[op]
+        if reduced_slice == ():
+            outs[op] = combine(out, result)
         else:
-            result = reduce_op.value.reduce(result, **reduce_args)
+            if len(reduced_slice) == 1:
+                reduced_slice = reduced_slice[0]
+            out[reduced_slice] = combine(out[reduced_slice], result)
+
+    results = {}
+    for op in reduce_ops:
+        if op in moment_ops:
+            out = moments_result(moments, op, ddof, mean_dtype) if moments is not None else None
+        else:
+            out = outs[op]
+            if out is None:
+                if op in (ReduceOp.MIN, ReduceOp.MAX):
+                    raise ValueError("zero-size array in min/max reduction operation is not supported")
+                # We have no hint here, so choose a default dtype
+                out_dtype = np.float64 if dtypes[op] is None else dtypes[op]
+                out = convert_none_out(out_dtype, op, reduced_shape)
+        # Check if the output array needs to be converted into a blosc2.NDArray
+        if kwargs != {} and out is not None and not np.isscalar(out):
+            out = blosc2.asarray(out, **kwargs)
+        results[op] = out
+    return results if multi_op else results[reduce_op]
 
-        if out is None:
-            if dtype is None:
-                dtype = result.dtype
-            if is_inside_eval():
-                # We already have the dtype and reduced_shape, so return immediately
-                # Use a blosc2 container, as it consumes less memory in general
-                return blosc2.zeros(reduced_shape, dtype=dtype)
-            out = convert_none_out(dtype, reduce_op, reduced_shape)
-
-        # Update the output array with the result
-        if reduce_op == ReduceOp.ANY:
-            out[reduced_slice] += result
-        elif reduce_op == ReduceOp.ALL:
-            out[reduced_slice] *= result
+
+def reduce_combine(reduce_op):
+    """Get the function combining two partial results of a reduction."""
+    if reduce_op == ReduceOp.ANY:
+        return np.logical_or
+    if reduce_op == ReduceOp.ALL:
+        return np.logical_and
+    return reduce_op.value
+
+
+def push_partial(tree, partial, combine):
+    """Push a partial result into a pairwise reduction tree.
+
+    The tree is kept as a stack of (level, partial) pairs, and two partials are combined
+    as soon as they reach the same level, so only O(log n) partials are alive at any time.
+    """
+    level = 0
+    while tree and tree[-1][0] == level:
+        partial = combine(tree.pop()[1], partial)
+        level += 1
+    tree.append((level, partial))
+
+
+def pop_partials(tree, combine):
+    """Combine the partial results remaining in a pairwise reduction tree."""
+    result = tree.pop()[1]
+    while tree:
+        result = combine(tree.pop()[1], result)
+    return result
+
+
+def get_moments_dtypes(result_dtype, dtype=None):
+    """Get the dtypes of the mean and the accumulators for mean, std and var reductions."""
+    if dtype is None:
+        dtype = np.float64 if result_dtype.kind in "biu" else result_dtype
+    # Use (at least) double precision for accumulating the partial statistics
+    acc_dtype = np.result_type(dtype, np.float64)
+    return np.dtype(dtype), acc_dtype
+
+
+def moments_dtype(reduce_op, mean_dtype):
+    """Get the output dtype of a mean, std or var reduction."""
+    if reduce_op == ReduceOp.MEAN:
+        return mean_dtype
+    # The output of std and var is always real, even for complex inputs
+    return np.empty((), dtype=mean_dtype).real.dtype
+
+
+def init_moments(reduced_shape, acc_dtype):
+    """Create the (count, mean, M2) accumulators for std and var reductions."""
+    count = np.zeros(reduced_shape, dtype=np.int64)
+    mean = np.zeros(reduced_shape, dtype=acc_dtype)
+    m2 = np.zeros(reduced_shape, dtype=mean.real.dtype)
+    return count, mean, m2
+
+
+def chunk_moments(result, chunks_, axis, keepdims, acc_dtype):
+    """Compute the (count, mean, M2) statistics of a chunk along `axis`."""
+    count = math.prod(chunks_[i] for i in axis)
+    if result.shape == ():
+        # All the values in the chunk are the same (e.g. a special chunk)
+        if keepdims:
+            partial_shape = tuple(1 if i in axis else c for i, c in enumerate(chunks_))
         else:
-            if reduced_slice == ():
-                out = reduce_op.value(out, result)
-            else:
-                out[reduced_slice] = reduce_op.value(out[reduced_slice], result)
+            partial_shape = tuple(c for i, c in enumerate(chunks_) if i not in axis)
+        mean = np.full(partial_shape, result[()], dtype=acc_dtype)
+        return count, mean, np.zeros(partial_shape, dtype=mean.real.dtype)
+    mean = np.mean(result, axis=axis, dtype=acc_dtype, keepdims=True)
+    dev = np.abs(result - mean) if np.iscomplexobj(mean) else result - mean
+    m2 = np.sum(dev * dev, axis=axis, keepdims=keepdims)
+    if not keepdims:
+        mean = mean.squeeze(axis=axis)
+    return count, mean, m2
+
+
+def merge_moments(moments, reduced_slice, count_b, mean_b, m2_b):
+    """Merge the statistics of a chunk into `moments` (Chan et al. parallel algorithm)."""
+    count, mean, m2 = moments
+    count_a = count[reduced_slice]
+    new_count = count_a + count_b
+    delta = mean_b - mean[reduced_slice]
+    mean[reduced_slice] += delta * (count_b / new_count)
+    delta2 = np.abs(delta) ** 2 if np.iscomplexobj(delta) else delta * delta
+    m2[reduced_slice] += m2_b + delta2 * (count_a * count_b / new_count)
+    count[reduced_slice] = new_count
+
+
+def moments_result(moments, reduce_op, ddof, mean_dtype):
+    """Get the final mean, std or var from the accumulated statistics."""
+    count, mean, m2 = moments
+    if reduce_op == ReduceOp.MEAN:
+        out = mean
+    else:
+        out = m2 / (count - ddof)
+        if reduce_op == ReduceOp.STD:
+            out = np.sqrt(out)
+    out = out.astype(moments_dtype(reduce_op, mean_dtype), copy=False)
+    return out[()] if out.ndim == 0 else out
 
-    if out is None:
-        if reduce_op in (ReduceOp.MIN, ReduceOp.MAX):
-            raise ValueError("zero-size array in min/max reduction operation is not supported")
-        if dtype is None:
-            # We have no hint here, so choose a default dtype
-            dtype = np.float64
-        out = convert_none_out(dtype, reduce_op, reduced_shape)
 
-    # Check if the output array needs to be converted into a blosc2.NDArray
-    if kwargs != {} and not np.isscalar(out):
-        out = blosc2.asarray(out, **kwargs)
-    return out
+def chunk_counts(result, chunks_, bin_op, bins, bin_range, minlength):
+    """Count the values of a chunk for histogram and bincount reductions.
+
+    Returns the counts and, for histograms, the bin edges.  When all the values in the
+    chunk are the same (e.g. a special chunk), only that value is binned.
+    """
+    values = np.asarray(result).reshape(-1)
+    if bin_op == ReduceOp.HISTOGRAM:
+        counts, bin_edges = np.histogram(values, bins=bins, range=bin_range)
+    else:
+        counts, bin_edges = np.bincount(values, minlength=minlength), None
+    if np.ndim(result) == 0:
+        counts *= math.prod(chunks_)
+    return counts, bin_edges
+
+
+def add_counts(counts, other):
+    """Add the counts of a chunk to the accumulated ones (which may be shorter for bincount)."""
+    if counts is None:
+        return other
+    if len(counts) < len(other):
+        counts, other = other, counts
+    counts[: len(other)] += other
+    return counts
+
+
+def select_best(values, positions, k, largest, nans_first):
+    """Select the (at most) k best values along the last axis, along with their positions.
+
+    Ties are broken in favour of the lowest positions.  NaNs are the largest values (as in
+    NumPy sorting), unless `nans_first` is true, where they are the best ones (as in
+    NumPy argmin).
+    """
+    if largest:
+        order = np.lexsort((-positions, values), axis=-1)[..., ::-1]
+    elif nans_first and values.dtype.kind == "f":
+        order = np.lexsort((positions, values, ~np.isnan(values)), axis=-1)
+    else:
+        order = np.lexsort((positions, values), axis=-1)
+    order = order[..., :k]
+    return np.take_along_axis(values, order, axis=-1), np.take_along_axis(positions, order, axis=-1)
+
+
+def prefilter_best(values, k, largest):
+    """Get the positions along the last axis of the k items that may be the k best ones.
+
+    A partition finds the k-th best value of every row, and ties with it are broken in
+    favour of the lowest positions, so exactly k (ascending) positions are kept per row.
+    """
+    m = values.shape[-1]
+    if m <= k:
+        return np.broadcast_to(np.arange(m), values.shape)
+    kth = m - k if largest else k - 1
+    kth = np.partition(values, kth, axis=-1)[..., kth : kth + 1]
+    if values.dtype.kind == "f":
+        # NaNs are sorted last, so the k-th value is NaN when there are not enough numbers
+        isnan, kth_nan = np.isnan(values), np.isnan(kth)
+    else:
+        isnan, kth_nan = np.zeros(values.shape, dtype=bool), np.zeros(kth.shape, dtype=bool)
+    if largest:
+        better = ~kth_nan & ((values > kth) | isnan)
+    else:
+        better = np.where(kth_nan, ~isnan, values < kth)
+    ties = np.where(kth_nan, isnan, values == kth)
+    need = k - better.sum(axis=-1, keepdims=True)
+    if np.array_equal(ties.sum(axis=-1, keepdims=True), need):
+        # No excess of ties (the usual case)
+        keep = better | ties
+    else:
+        keep = better | (ties & (np.cumsum(ties, axis=-1) <= need))
+    return np.nonzero(keep)[-1].reshape(*values.shape[:-1], k)
+
+
+def chunk_candidates(result, slice_, base, shape, axis, k, largest, nans_first):
+    """Get the k best values of an evaluated chunk for every output item, with their positions.
+
+    If `axis` is None, the positions are flat indices in `shape`; else, they are indices
+    along `axis`.  Positions are relative to `base`, the origin of the reduced region.
+    """
+    starts = [s.start - b for s, b in zip(slice_, base, strict=True)]
+    fast = k == 1 and (largest or nans_first)
+    if axis is None:
+        values = result.reshape(-1)
+        if fast:
+            local = np.array([np.argmax(values) if largest else np.argmin(values)])
+        else:
+            local = prefilter_best(values, k, largest)
+        coords = np.unravel_index(local, result.shape)
+        positions = np.ravel_multi_index(
+            tuple(c + st for c, st in zip(coords, starts, strict=True)), shape
+        ).astype(np.int64)
+        return select_best(values[local], positions, k, largest, nans_first)
+    values = np.moveaxis(result, axis, -1)
+    if fast:
+        local = (np.argmax if largest else np.argmin)(values, axis=-1, keepdims=True)
+        return np.take_along_axis(values, local, axis=-1), local.astype(np.int64) + starts[axis]
+    local = prefilter_best(values, k, largest)
+    positions = local.astype(np.int64) + starts[axis]
+    return select_best(np.take_along_axis(values, local, axis=-1), positions, k, largest, nans_first)
+
+
+def selection_result(selections, select_op, axis, shape, k, keepdims):
+    """Get the result of a positional reduction from the best candidates of every slice."""
+    if select_op != ReduceOp.TOPK and (math.prod(shape) == 0 or (axis is not None and shape[axis] == 0)):
+        raise ValueError(f"attempt to get {select_op.__name__} of an empty sequence")
+    dtype = next(iter(selections.values()))[1].dtype if selections else np.float64
+    if axis is None:
+        if selections:
+            _, values, positions = selections[()]
+        else:
+            values, positions = np.empty(0, dtype=dtype), np.empty(0, dtype=np.int64)
+    else:
+        kk = min(k, shape[axis])
+        cells = tuple(s for i, s in enumerate(shape) if i != axis)
+        values = np.empty((*cells, kk), dtype=dtype)
+        positions = np.empty((*cells, kk), dtype=np.int64)
+        for reduced_slice, values_, positions_ in selections.values():
+            values[reduced_slice] = values_
+            positions[reduced_slice] = positions_
+    if select_op == ReduceOp.TOPK:
+        if axis is not None:
+            values, positions = np.moveaxis(values, -1, axis), np.moveaxis(positions, -1, axis)
+        return values, positions
+    out = positions[..., 0]
+    if keepdims:
+        out = out.reshape((1,) * len(shape)) if axis is None else np.expand_dims(out, axis)
+    return out[()] if out.ndim == 0 else out
 
 
 def convert_none_out(dtype, reduce_op, reduced_shape):
@@ -1242,9 +3183,18 @@ def chunked_eval(  # noqa: C901
             The output array to store the result.
         _where_args: dict, optional
             Additional arguments for conditional evaluation.
+        nworkers: int, optional
+            The number of threads evaluating chunks in parallel (when the fast path
+            can be used, or for reductions).  Default is 1.
+        block_eval: bool, optional
+            Whether to evaluate string expressions block by block inside the compression
+            of the output (see :func:`blocks_eval`), when all the operands are NDArray objects
+            with the same partitions.  Default is False.
     """
     try:
         getitem = kwargs.pop("_getitem", False)
+        nworkers = kwargs.pop("nworkers", 1)
+        block_eval = kwargs.pop("block_eval", False)
         out = kwargs.get("_output")
         where: dict | None = kwargs.get("_where_args")
         if where:
@@ -1260,7 +3210,9 @@ def chunked_eval(  # noqa: C901
         reduce_args = kwargs.pop("_reduce_args", {})
         if reduce_args:
             # Eval and reduce the expression in a single step
-            return reduce_slices(expression, operands, reduce_args=reduce_args, _slice=item, **kwargs)
+            return reduce_slices(
+                expression, operands, reduce_args=reduce_args, _slice=item, nworkers=nworkers, **kwargs
+            )
 
         if not is_full_slice(item) or (where is not None and len(where) < 2):
             # The fast path is not possible when using partial slices or where returning
@@ -1270,14 +3222,16 @@ def chunked_eval(  # noqa: C901
         if fast_path:
             if getitem:
                 # When using getitem, taking the fast path is always possible
-                return fast_eval(expression, operands, getitem=True, **kwargs)
+                return fast_eval(expression, operands, getitem=True, nworkers=nworkers, **kwargs)
             elif (kwargs.get("chunks") is None and kwargs.get("blocks") is None) and (
                 out is None or isinstance(out, blosc2.NDArray)
             ):
                 # If not, the conditions to use the fast path are a bit more restrictive
                 # e.g. the user cannot specify chunks or blocks, or an output that is not
                 # a blosc2.NDArray
-                return fast_eval(expression, operands, getitem=False, **kwargs)
+                if block_eval and where is None and can_blocks_eval(expression, operands, out):
+                    return blocks_eval(expression, operands, **kwargs)
+                return fast_eval(expression, operands, getitem=False, nworkers=nworkers, **kwargs)
 
         res = slices_eval(expression, operands, getitem=getitem, _slice=item, **kwargs)
 
@@ -1290,61 +3244,216 @@ def chunked_eval(  # noqa: C901
     return res
 
 
+# Symbols of the operators in expressions
+_ast_ops = {
+    ast.Add: "+",
+    ast.Sub: "-",
+    ast.Mult: "*",
+    ast.Div: "/",
+    ast.FloorDiv: "//",
+    ast.Mod: "%",
+    ast.Pow: "**",
+    ast.LShift: "<<",
+    ast.RShift: ">>",
+    ast.BitAnd: "&",
+    ast.BitOr: "|",
+    ast.BitXor: "^",
+    ast.Invert: "~",
+    ast.UAdd: "+",
+    ast.USub: "-",
+    ast.Eq: "==",
+    ast.NotEq: "!=",
+    ast.Lt: "<",
+    ast.LtE: "<=",
+    ast.Gt: ">",
+    ast.GtE: ">=",
+}
+
+# Operators (and their number of operands) folded when all their operands are numbers
+_fold_ops = {
+    ("+", 2): operator.add,
+    ("-", 2): operator.sub,
+    ("*", 2): operator.mul,
+    ("/", 2): operator.truediv,
+    ("//", 2): operator.floordiv,
+    ("%", 2): operator.mod,
+    ("**", 2): operator.pow,
+    ("+", 1): operator.pos,
+    ("-", 1): operator.neg,
+}
+
+
+class ExprDAG:
+    """Graph of an expression, with its common subexpressions shared and its constants folded.
+
+    Nodes are ``(kind, value, children)`` tuples, and equal nodes are stored just once, so
+    the graph grows with the number of distinct subexpressions, and not with the length of
+    the expression (which grows exponentially when composing lazy expressions that reuse
+    their operands, like in ``e = e * e + sin(e)``).
+
+    Parameters
+    ----------
+    expression: str
+        The expression.
+    names: dict, optional
+        A mapping for renaming the operands in the expression.
+    """
+
+    def __init__(self, expression, names=None):
+        self.names = {} if names is None else names
+        self.nodes = []
+        self.ids = {}
+        self.numbers = {}
+        self.root = self._add(ast.parse(expression, mode="eval").body)
+
+    def _node(self, kind, value, children=()):
+        key = (kind, value, children)
+        nid = self.ids.get(key)
+        if nid is None:
+            nid = self.ids[key] = len(self.nodes)
+            self.nodes.append(key)
+        return nid
+
+    def _const(self, value):
+        # Use the repr as the value, so that e.g. 1, 1.0, True and -0.0 are different nodes
+        nid = self._node("const", repr(value))
+        if type(value) in (int, float, complex):
+            self.numbers[nid] = value
+        return nid
+
+    def _fold(self, op, children):
+        fold_op = _fold_ops.get((op, len(children)))
+        if fold_op is None or any(child not in self.numbers for child in children):
+            return None
+        try:
+            value = fold_op(*(self.numbers[child] for child in children))
+        except (ArithmeticError, ValueError):
+            # Let numexpr report the error (if any) when evaluating the expression
+            return None
+        if (isinstance(value, int) and value.bit_length() > 63) or not np.isfinite(value):
+            return None
+        return self._const(value)
+
+    def _add(self, node):
+        if isinstance(node, ast.Name):
+            return self._node("name", self.names.get(node.id, node.id))
+        if isinstance(node, ast.Constant):
+            return self._const(node.value)
+        if isinstance(node, ast.BinOp | ast.UnaryOp) and type(node.op) in _ast_ops:
+            op = _ast_ops[type(node.op)]
+            operands = [node.left, node.right] if isinstance(node, ast.BinOp) else [node.operand]
+            children = tuple(self._add(operand) for operand in operands)
+            nid = self._fold(op, children)
+            return self._node("op", op, children) if nid is None else nid
+        if isinstance(node, ast.Compare) and all(type(op) in _ast_ops for op in node.ops):
+            children = tuple(self._add(operand) for operand in [node.left, *node.comparators])
+            return self._node("compare", tuple(_ast_ops[type(op)] for op in node.ops), children)
+        if (
+            isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Name)
+            and not any(isinstance(arg, ast.Starred) for arg in node.args)
+            and all(kw.arg is not None for kw in node.keywords)
+        ):
+            args = [*node.args, *(kw.value for kw in node.keywords)]
+            value = (node.func.id, tuple(kw.arg for kw in node.keywords))
+            return self._node("call", value, tuple(self._add(arg) for arg in args))
+        # Other constructs (attributes, subscripts...) are kept verbatim, but renaming operands
+        for child in ast.walk(node):
+            if isinstance(child, ast.Name):
+                child.id = self.names.get(child.id, child.id)
+        return self._node("source", ast.unparse(node))
+
+    @staticmethod
+    def _text(kind, value, args):
+        if kind in ("name", "source"):
+            return value
+        if kind == "const":
+            return f"({value})" if value.startswith("-") else value
+        if kind == "op":
+            return f"({args[0]} {value} {args[1]})" if len(args) == 2 else f"({value}{args[0]})"
+        if kind == "compare":
+            return f"({args[0]}{''.join(f' {op} {arg}' for op, arg in zip(value, args[1:], strict=True))})"
+        func, kwnames = value
+        nargs = len(args) - len(kwnames)
+        params = args[:nargs] + [f"{kw}={arg}" for kw, arg in zip(kwnames, args[nargs:], strict=True)]
+        return f"{func}({', '.join(params)})"
+
+    def emit(self, max_inline=None):
+        """Emit the expression, as a list of ``(name, expression)`` stages, plus the final one.
+
+        Shared subexpressions longer than `max_inline` characters are evaluated just once,
+        in a stage of their own, and are referred by the name of their result (``_t0``,
+        ``_t1``...) in the following stages.  By default, no stages are used.  Emitted
+        expressions are always enclosed in parentheses (unless they are a single name,
+        constant or call), so they can be used as operands of other expressions.
+        """
+        # Count the references to the nodes which are reachable from the root
+        refs = [0] * len(self.nodes)
+        refs[self.root] = 1
+        pending = [self.root]
+        while pending:
+            for child in self.nodes[pending.pop()][2]:
+                refs[child] += 1
+                if refs[child] == 1:
+                    pending.append(child)
+        stages = []
+        texts = {}
+        # Children are always added before their parents, so they are emitted first
+        for nid, (kind, value, children) in enumerate(self.nodes):
+            if refs[nid] == 0:
+                continue
+            text = self._text(kind, value, [texts[child] for child in children])
+            if max_inline is not None and refs[nid] > 1 and children and len(text) > max_inline:
+                stages.append((f"_t{len(stages)}", text))
+                text = stages[-1][0]
+            texts[nid] = text
+        return stages, texts[self.root]
+
+
 def fuse_operands(operands1, operands2):
+    """Fuse the operands of two expressions, comparing them by identity.
+
+    Returns the operands in `operands2` which are not in `operands1` (under new names),
+    and a mapping from the names in `operands2` to the names of the fused operands.
+    """
+    names1 = {id(value): name for name, value in operands1.items()}
     new_operands = {}
-    dup_operands = {}
+    names = {}
     new_pos = len(operands1)
-    for k2, v2 in operands2.items():
-        try:
-            k1 = list(operands1.keys())[list(operands1.values()).index(v2)]
-            # The operand is duplicated; keep track of it
-            dup_operands[k2] = k1
-        except ValueError:
-            # The value is not among operands1, so rebase it
-            new_op = f"o{new_pos}"
+    for name2, value2 in operands2.items():
+        name = names1.get(id(value2))
+        if name is None:
+            # The value is not among the fused operands, so add it with a new name
+            while f"o{new_pos}" in operands1:
+                new_pos += 1
+            name = f"o{new_pos}"
             new_pos += 1
-            new_operands[new_op] = v2
-    return new_operands, dup_operands
+            new_operands[name] = value2
+            names1[id(value2)] = name
+        names[name2] = name
+    return new_operands, names
 
 
-def fuse_expressions(expr, new_base, dup_op):
-    new_expr = ""
-    skip_to_char = 0
-    old_base = 0
-    prev_pos = {}
-    for i, expr_i in enumerate(expr):
-        if i < skip_to_char:
-            continue
-        if expr_i == "o":
-            if i > 0 and (expr[i - 1] != " " and expr[i - 1] != "("):
-                # Not a variable
-                new_expr += expr_i
-                continue
-            # This is a variable.  Find the end of it.
-            j = i + 1
-            for k in range(len(expr[j:])):
-                if expr[j + k] in " )[":
-                    j = k
-                    break
-            if expr[i + j] == ")":
-                j -= 1
-            old_pos = int(expr[i + 1 : i + j + 1])
-            old_op = f"o{old_pos}"
-            if old_op not in dup_op:
-                if old_pos in prev_pos:
-                    # Keep track of duplicated old positions inside expr
-                    new_pos = prev_pos[old_pos]
-                else:
-                    new_pos = old_base + new_base
-                    old_base += 1
-                new_expr += f"o{new_pos}"
-                prev_pos[old_pos] = new_pos
-            else:
-                new_expr += dup_op[old_op]
-            skip_to_char = i + j + 1
-        else:
-            new_expr += expr_i
-    return new_expr
+def fuse_expressions(expr, names=None):
+    """Rename the operands in `expr` after `names`, folding its constants too.
+
+    The result can be used as an operand of other expressions (see :meth:`ExprDAG.emit`).
+    """
+    return ExprDAG(expr, names).emit()[1]
+
+
+def operand_expression(lazy_expr, names=None):
+    """The expression of `lazy_expr`, ready to be used as an operand of a new expression.
+
+    Expressions composed by :class:`LazyExpr` are already fused, so they are reused as is
+    when no renaming is needed; this avoids parsing long expressions over and over.
+    """
+    expression = lazy_expr.expression
+    if getattr(lazy_expr, "_fused_expression", None) is expression and (
+        names is None or all(name == new_name for name, new_name in names.items())
+    ):
+        return expression
+    return fuse_expressions(expression, names)
 
 
 functions = [
@@ -1384,6 +3493,192 @@ functions = [
 ]
 
 
+# Defaults for the cache of results of lazy expressions
+result_cache_dflts = {
+    # Maximum number of bytes kept for the results of __getitem__ and reductions (0 disables it)
+    "max_bytes": 0,
+}
+"""
+Defaults for the cache of results of lazy expressions: ``max_bytes`` is the maximum number
+of bytes kept for the results of __getitem__ and reductions (0, the default, disables it).
+
+Results are keyed on the identity (``id()``) of the operands and the version of their data
+kept in memory, which is bumped by every write through them.  Writes through another handle
+of the same file (or in another process) are not seen, so cached results can be stale then;
+do not enable the cache if operands on disk can be written elsewhere.
+"""
+
+
+def _hashable(value):
+    """Convert an item or a reduction argument to a hashable value (or raise a TypeError)."""
+    if isinstance(value, slice):
+        return "slice", value.start, value.stop, value.step
+    if isinstance(value, tuple | list):
+        return tuple(_hashable(v) for v in value)
+    if isinstance(value, dict):
+        return tuple(sorted((k, _hashable(v)) for k, v in value.items()))
+    if isinstance(value, np.ndarray | blosc2.NDArray | blosc2.NDField | blosc2.LazyArray):
+        # Their contents can change, so they cannot be part of a key
+        raise TypeError("arrays cannot be part of a key")
+    hash(value)
+    return value
+
+
+class ResultCache:
+    """LRU cache for the results of lazy expressions, with a budget of bytes.
+
+    Results are keyed on the expression, the identity of the operands and the version of
+    their data, and the item (or reduction) computed.  Writing to an operand bumps its
+    version, so the previous results are not used anymore (and are evicted eventually).
+    The version is kept in memory by each handle, so writes through other handles (or
+    processes) are not seen (see ``result_cache_dflts``).
+    """
+
+    def __init__(self):
+        self.entries = OrderedDict()
+        self.nbytes = 0
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def get_key(expr, item, kwargs):
+        """Get the key for a result of `expr`, and weak references to its operands.
+
+        Only the results of __getitem__ and reductions, with operands whose writes can be
+        tracked (i.e. :ref:`NDArray` and :ref:`NDField` instances, or scalars), are cached.
+        """
+        if "_output" in kwargs or not (kwargs.get("_getitem") or "_reduce_args" in kwargs):
+            return None, None
+        if set(kwargs) - {"_getitem", "_reduce_args", "_where_args", "nworkers"}:
+            return None, None
+        key = [expr.expression]
+        refs = []
+        for name, value in {**expr.operands, **kwargs.get("_where_args", {})}.items():
+            if np.isscalar(value):
+                key.append((name, value))
+                continue
+            arr = value.ndarr if isinstance(value, blosc2.NDField) else value
+            if not isinstance(arr, blosc2.NDArray):
+                # Other operands (like NumPy arrays) can change without notice
+                return None, None
+            key.append((name, id(value), arr.schunk._version))
+            refs.append(weakref.ref(value))
+        try:
+            key.append(_hashable(item))
+            key.append(_hashable(kwargs.get("_reduce_args")))
+        except TypeError:
+            # E.g. items which are masks
+            return None, None
+        return tuple(key), refs
+
+    def get(self, key):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+            refs, result, nbytes = entry
+            if any(ref() is None for ref in refs):
+                # An operand is gone, so the current one with its id is a different object
+                del self.entries[key]
+                self.nbytes -= nbytes
+                return None
+            self.entries.move_to_end(key)
+            return result
+
+    def put(self, key, refs, result, max_bytes):
+        nbytes = result.nbytes
+        if nbytes > max_bytes:
+            return
+        with self.lock:
+            old = self.entries.pop(key, None)
+            if old is not None:
+                self.nbytes -= old[2]
+            self.entries[key] = (refs, result, nbytes)
+            self.nbytes += nbytes
+            while self.nbytes > max_bytes:
+                _, (_, _, evicted_nbytes) = self.entries.popitem(last=False)
+                self.nbytes -= evicted_nbytes
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.nbytes = 0
+
+
+_result_cache = ResultCache()
+
+
+def get_chunk_stamps(operands):
+    """Get the shapes of the NDArray `operands`, and the write stamps of their chunks.
+
+    The stamps are kept by the operands on every write (see ``SChunk._chunk_stamps``), so no
+    chunk is read; they are flushed too, so that they can be compared in other sessions.
+    They are None (with a warning) for read-only operands not keeping them.
+    """
+    stamps = {}
+    for key, value in operands.items():
+        stamps_ = value.schunk._chunk_stamps()
+        if stamps_ is None:
+            warnings.warn(
+                f"Operand {key} is read-only and does not keep the write stamps of its chunks, "
+                "so the whole outcome will be computed when refreshing",
+                stacklevel=3,
+            )
+        else:
+            value.schunk.flush_tracking()
+        stamps[key] = {
+            "shape": list(value.shape),
+            "stamps": None if stamps_ is None else np.array(stamps_, dtype=np.int64).tobytes(),
+        }
+    return stamps
+
+
+def get_dirty_slices(array, operands, old_stamps, new_stamps):
+    """Get the slices for the chunks of `array` that depend on changed chunks of `operands`.
+
+    `array` is the outcome of an expression with the `operands`, and the chunks of an operand
+    have changed if they have different stamps (see :func:`get_chunk_stamps`).
+    """
+    shape = array.shape
+    chunks_idx, nchunks = get_chunks_idx(shape, array.chunks)
+    dirty = set()
+    for key, value in operands.items():
+        old, new = old_stamps.get(key), new_stamps[key]
+        if (
+            old is None
+            or old["stamps"] is None
+            or new["stamps"] is None
+            or old["shape"][1:] != new["shape"][1:]
+        ):
+            # Chunks are only preserved when growing (or shrinking) the first dimension
+            dirty = set(range(nchunks))
+            break
+        old_ = np.frombuffer(old["stamps"], dtype=np.int64)
+        new_ = np.frombuffer(new["stamps"], dtype=np.int64)
+        changed = np.ones(len(new_), dtype=bool)
+        common = min(len(old_), len(new_))
+        changed[:common] = old_[:common] != new_[:common]
+        op_chunks_idx, _ = get_chunks_idx(value.shape, value.chunks)
+        for nchunk in np.flatnonzero(changed).tolist():
+            # The region of the array depending on the changed chunk (broadcasting the operand)
+            coords = np.unravel_index(nchunk, op_chunks_idx)
+            region = [(0, s) for s in shape[: len(shape) - value.ndim]]
+            for c, cs, s, s_ in zip(
+                coords, value.chunks, value.shape, shape[len(shape) - value.ndim :], strict=True
+            ):
+                region.append((c * cs, min((c + 1) * cs, s)) if s == s_ else (0, s_))
+            ranges = [
+                range(start // cs, -(-stop // cs))
+                for (start, stop), cs in zip(region, array.chunks, strict=True)
+            ]
+            dirty.update(np.ravel_multi_index(coords, chunks_idx) for coords in itertools.product(*ranges))
+    for nchunk in sorted(dirty):
+        coords = np.unravel_index(nchunk, chunks_idx)
+        yield tuple(
+            slice(int(c) * cs, min((int(c) + 1) * cs, s))
+            for c, cs, s in zip(coords, array.chunks, shape, strict=True)
+        )
+
+
 class LazyExpr(LazyArray):
     """Class for hosting lazy expressions.
 
@@ -1400,8 +3695,9 @@ class LazyExpr(LazyArray):
         value1, op, value2 = new_op
         if value2 is None:
             if isinstance(value1, LazyExpr):
-                self.expression = f"{op}({value1.expression})"
+                self.expression = f"{op}({operand_expression(value1)})"
                 self.operands = value1.operands
+                self._fused_expression = self.expression
             else:
                 self.operands = {"o0": value1}
                 self.expression = "o0" if op is None else f"{op}(o0)"
@@ -1448,6 +3744,7 @@ class LazyExpr(LazyArray):
                 newexpr = self.update_expr(new_op)
                 self.expression = newexpr.expression
                 self.operands = newexpr.operands
+                self._fused_expression = self.expression
             else:
                 # This is the very first time that a LazyExpr is formed from two operands
                 # that are not LazyExpr themselves
@@ -1502,45 +3799,41 @@ class LazyExpr(LazyArray):
         elif isinstance(value1, LazyExpr) and isinstance(value2, LazyExpr):
             # Expression fusion
             # Fuse operands in expressions and detect duplicates
-            new_operands, dup_op = fuse_operands(value1.operands, value2.operands)
-            # Take expression 2 and rebase the operands while removing duplicates
-            new_expr = fuse_expressions(value2.expression, len(value1.operands), dup_op)
-            expression = f"({self.expression} {op} {new_expr})"
+            new_operands, names = fuse_operands(value1.operands, value2.operands)
+            # Take expression 2 and rename its operands after the fused ones
+            new_expr = operand_expression(value2, names)
+            expression = f"({operand_expression(self)} {op} {new_expr})"
         elif isinstance(value1, LazyExpr):
+            self_expr = operand_expression(self)
             if op == "~":
-                expression = f"({op}{self.expression})"
+                expression = f"({op}{self_expr})"
             elif np.isscalar(value2):
-                expression = f"({self.expression} {op} {value2})"
+                expression = f"({self_expr} {op} {value2})"
             elif hasattr(value2, "shape") and value2.shape == ():
-                expression = f"({self.expression} {op} {value2[()]})"
+                expression = f"({self_expr} {op} {value2[()]})"
             else:
-                try:
-                    op_name = list(value1.operands.keys())[list(value1.operands.values()).index(value2)]
-                except ValueError:
-                    op_name = f"o{len(self.operands)}"
-                    new_operands = {op_name: value2}
-                expression = f"({self.expression} {op} {op_name})"
+                new_operands, names = fuse_operands(value1.operands, {"o0": value2})
+                expression = f"({self_expr} {op} {names['o0']})"
             self.operands = value1.operands
         else:
             if np.isscalar(value1):
-                expression = f"({value1} {op} {self.expression})"
+                expression = f"({value1} {op} {operand_expression(self)})"
             elif hasattr(value1, "shape") and value1.shape == ():
-                expression = f"({value1[()]} {op} {self.expression})"
+                expression = f"({value1[()]} {op} {operand_expression(self)})"
             else:
-                try:
-                    op_name = list(value2.operands.keys())[list(value2.operands.values()).index(value1)]
-                except ValueError:
-                    op_name = f"o{len(value2.operands)}"
-                    new_operands = {op_name: value1}
+                new_operands, names = fuse_operands(value2.operands, {"o0": value1})
+                op_name = names["o0"]
                 if op == "[]":  # syntactic sugar for slicing
                     expression = f"({op_name}[{self.expression}])"
                 else:
-                    expression = f"({op_name} {op} {self.expression})"
+                    expression = f"({op_name} {op} {operand_expression(self)})"
                 self.operands = value2.operands
         blosc2._disable_overloaded_equal = False
         # Return a new expression
         operands = self.operands | new_operands
-        return self._new_expr(expression, operands, guess=False, out=None, where=None)
+        new_expr = self._new_expr(expression, operands, guess=False, out=None, where=None)
+        new_expr._fused_expression = expression
+        return new_expr
 
     @property
     def dtype(self):
@@ -1736,6 +4029,65 @@ class LazyExpr(LazyArray):
         self._where_args = args
         return self
 
+    def indices(self, **kwargs):
+        """Get the flat positions (in C order) of the items where this boolean expression is true.
+
+        The expression is evaluated chunk by chunk, keeping only the positions of the true
+        items, so this is much cheaper in memory than materializing the boolean array.  When
+        an :ref:`NDArray` is requested, the positions are written into it as they are found.
+
+        Parameters
+        ----------
+        kwargs: dict, optional
+            If given, the positions are stored in an :ref:`NDArray` created with these keyword
+            arguments (e.g. ``urlpath`` or ``cparams``), instead of a NumPy array.
+
+        Returns
+        -------
+        out: np.ndarray or :ref:`NDArray`
+            The int64 positions of the true items.  These can be used for indexing other arrays
+            (via ``np.unravel_index()`` for multidimensional ones).
+
+        Examples
+        --------
+        >>> import blosc2
+        >>> import numpy as np
+        >>> a = blosc2.asarray(np.arange(10))
+        >>> ((a < 2) | (a > 7)).indices()
+        array([0, 1, 8, 9])
+        """
+        if self.dtype != np.bool_:
+            raise ValueError("indices() can only be used with boolean expressions")
+        if self.shape == ():
+            raise ValueError("indices() cannot be used with 0-dim expressions")
+        return nonzero_eval(self.expression, self.operands, **kwargs)
+
+    def nonzero(self):
+        """Get the coordinates of the items where this boolean expression is true.
+
+        This works like :func:`numpy.nonzero`, but the expression is evaluated chunk by chunk,
+        keeping only the coordinates of the true items.  The result can be used for indexing
+        other arrays with the same shape (including :ref:`NDArray` ones).
+
+        Returns
+        -------
+        out: tuple of np.ndarray
+            The coordinates of the true items, with an array for each dimension.
+
+        Examples
+        --------
+        >>> import blosc2
+        >>> import numpy as np
+        >>> a = blosc2.asarray(np.arange(6).reshape(2, 3))
+        >>> (a > 3).nonzero()
+        (array([1, 1]), array([1, 2]))
+        """
+        if self.dtype != np.bool_:
+            raise ValueError("nonzero() can only be used with boolean expressions")
+        if self.shape == ():
+            raise ValueError("nonzero() cannot be used with 0-dim expressions")
+        return np.unravel_index(nonzero_eval(self.expression, self.operands), self.shape)
+
     def sum(self, axis=None, dtype=None, keepdims=False, **kwargs):
         reduce_args = {
             "op": ReduceOp.SUM,
@@ -1766,7 +4118,8 @@ class LazyExpr(LazyArray):
 
     def mean(self, axis=None, dtype=None, keepdims=False, **kwargs):
         item = kwargs.pop("item", None)
-        total_sum = self.sum(axis=axis, dtype=dtype, keepdims=keepdims, item=item)
+        nworkers = kwargs.pop("nworkers", 1)
+        total_sum = self.sum(axis=axis, dtype=dtype, keepdims=keepdims, item=item, nworkers=nworkers)
         num_elements = self.get_num_elements(axis, item)
         if num_elements == 0:
             raise ValueError("mean of an empty array is not defined")
@@ -1776,32 +4129,30 @@ class LazyExpr(LazyArray):
         return out
 
     def std(self, axis=None, dtype=None, keepdims=False, ddof=0, **kwargs):
-        item = kwargs.pop("item", None)
-        mean_value = self.mean(axis=axis, dtype=dtype, keepdims=True, item=item)
-        expr = (self - mean_value) ** 2
-        out = expr.mean(axis=axis, dtype=dtype, keepdims=keepdims, item=item)
-        if ddof != 0:
-            num_elements = self.get_num_elements(axis, item)
-            out = np.sqrt(out * num_elements / (num_elements - ddof))
-        else:
-            out = np.sqrt(out)
-        if kwargs != {} and not np.isscalar(out):
-            out = blosc2.asarray(out, **kwargs)
-        return out
+        # The mean and the squared deviations are computed in a single pass
+        if self.get_num_elements(axis, kwargs.get("item")) == 0:
+            raise ValueError("std of an empty array is not defined")
+        reduce_args = {
+            "op": ReduceOp.STD,
+            "axis": axis,
+            "dtype": dtype,
+            "ddof": ddof,
+            "keepdims": keepdims,
+        }
+        return self.compute(_reduce_args=reduce_args, **kwargs)
 
     def var(self, axis=None, dtype=None, keepdims=False, ddof=0, **kwargs):
-        item = kwargs.pop("item", None)
-        mean_value = self.mean(axis=axis, dtype=dtype, keepdims=True, item=item)
-        expr = (self - mean_value) ** 2
-        if ddof != 0:
-            out = expr.mean(axis=axis, dtype=dtype, keepdims=keepdims, item=item)
-            num_elements = self.get_num_elements(axis, item)
-            out = out * num_elements / (num_elements - ddof)
-        else:
-            out = expr.mean(axis=axis, dtype=dtype, keepdims=keepdims, item=item)
-        if kwargs != {} and not np.isscalar(out):
-            out = blosc2.asarray(out, **kwargs)
-        return out
+        # The mean and the squared deviations are computed in a single pass
+        if self.get_num_elements(axis, kwargs.get("item")) == 0:
+            raise ValueError("var of an empty array is not defined")
+        reduce_args = {
+            "op": ReduceOp.VAR,
+            "axis": axis,
+            "dtype": dtype,
+            "ddof": ddof,
+            "keepdims": keepdims,
+        }
+        return self.compute(_reduce_args=reduce_args, **kwargs)
 
     def prod(self, axis=None, dtype=None, keepdims=False, **kwargs):
         reduce_args = {
@@ -1828,6 +4179,61 @@ class LazyExpr(LazyArray):
         }
         return self.compute(_reduce_args=reduce_args, **kwargs)
 
+    def argmax(self, axis=None, keepdims=False, **kwargs):
+        reduce_args = {
+            "op": ReduceOp.ARGMAX,
+            "axis": axis,
+            "keepdims": keepdims,
+        }
+        return self.compute(_reduce_args=reduce_args, **kwargs)
+
+    def argmin(self, axis=None, keepdims=False, **kwargs):
+        reduce_args = {
+            "op": ReduceOp.ARGMIN,
+            "axis": axis,
+            "keepdims": keepdims,
+        }
+        return self.compute(_reduce_args=reduce_args, **kwargs)
+
+    def topk(self, k, axis=None, largest=True, **kwargs):
+        reduce_args = {
+            "op": ReduceOp.TOPK,
+            "axis": axis,
+            "keepdims": False,
+            "k": k,
+            "largest": largest,
+        }
+        return self.compute(_reduce_args=reduce_args, **kwargs)
+
+    def histogram(self, bins=10, range=None, density=False, **kwargs):
+        if isinstance(bins, str):
+            raise TypeError("bin estimators are not supported; pass the number of bins or their edges")
+        if range is None and np.ndim(bins) == 0 and self.get_num_elements(None, kwargs.get("item")) > 0:
+            # As in NumPy, the range of the values is used, which needs another pass
+            item = {"item": kwargs["item"]} if "item" in kwargs else {}
+            stats = self.aggregate(("min", "max"), **item)
+            range = (stats["min"], stats["max"])
+            if not np.all(np.isfinite(range)):
+                raise ValueError(f"autodetected range of [{range[0]}, {range[1]}] is not finite")
+        reduce_args = {
+            "op": ReduceOp.HISTOGRAM,
+            "axis": None,
+            "keepdims": False,
+            "bins": bins,
+            "range": range,
+            "density": density,
+        }
+        return self.compute(_reduce_args=reduce_args, **kwargs)
+
+    def bincount(self, minlength=0, **kwargs):
+        reduce_args = {
+            "op": ReduceOp.BINCOUNT,
+            "axis": None,
+            "keepdims": False,
+            "minlength": minlength,
+        }
+        return self.compute(_reduce_args=reduce_args, **kwargs)
+
     def any(self, axis=None, keepdims=False, **kwargs):
         reduce_args = {
             "op": ReduceOp.ANY,
@@ -1844,8 +4250,79 @@ class LazyExpr(LazyArray):
         }
         return self.compute(_reduce_args=reduce_args, **kwargs)
 
+    def aggregate(self, ops, axis=None, dtype=None, keepdims=False, ddof=0, **kwargs):
+        reduce_ops = {}
+        for name in ops:
+            if name not in aggregate_ops:
+                raise ValueError(f"Unsupported reduction operation: {name}")
+            reduce_ops[name] = aggregate_ops[name]
+        if not reduce_ops:
+            raise ValueError("At least one reduction operation is needed")
+        moment_ops = {"mean", "std", "var"}
+        if moment_ops & reduce_ops.keys() and self.get_num_elements(axis, kwargs.get("item")) == 0:
+            raise ValueError("mean, std and var of an empty array are not defined")
+        # All the reductions are fed from the same evaluation of the expression
+        reduce_args = {
+            "op": tuple(reduce_ops.values()),
+            "axis": axis,
+            "dtype": dtype,
+            "ddof": ddof,
+            "keepdims": keepdims,
+        }
+        results = self.compute(_reduce_args=reduce_args, **kwargs)
+        return {name: results[op] for name, op in reduce_ops.items()}
+
+    def describe(self, axis=None, **kwargs):
+        item = kwargs.get("item")
+        out = {"count": self.get_num_elements(axis, item)}
+        out.update(self.aggregate(("mean", "std", "min", "max"), axis=axis, **kwargs))
+        return out
+
+    def _scan(self, op, axis, dtype, kwargs):
+        if dtype is None:
+            # Without an actual expression, the dtype is the one of the operand
+            dtype = self.operands["o0"].dtype if self.expression == "o0" else self.dtype
+            if op in ("cumsum", "cumprod"):
+                # Small integers and booleans are accumulated as in NumPy (e.g. int32 -> int64)
+                dtype = getattr(np, op)(np.empty(0, dtype=dtype)).dtype
+        return scan_eval(self.expression, self.operands, op, axis, dtype, **kwargs)
+
+    def cumsum(self, axis=None, dtype=None, **kwargs):
+        return self._scan("cumsum", axis, dtype, kwargs)
+
+    def cumprod(self, axis=None, dtype=None, **kwargs):
+        return self._scan("cumprod", axis, dtype, kwargs)
+
+    def cummax(self, axis=None, **kwargs):
+        return self._scan("cummax", axis, None, kwargs)
+
+    def cummin(self, axis=None, **kwargs):
+        return self._scan("cummin", axis, None, kwargs)
+
+    def _sort(self, order, argsort, nworkers, kwargs):
+        # Without an actual expression, the dtype is the one of the operand (e.g. a structured one)
+        dtype = self.operands["o0"].dtype if self.expression == "o0" else self.dtype
+        return sort_eval(self.expression, self.operands, dtype, order, argsort, nworkers, **kwargs)
+
+    def sort(self, order=None, nworkers=1, **kwargs):
+        return self._sort(order, False, nworkers, kwargs)
+
+    def argsort(self, order=None, nworkers=1, **kwargs):
+        return self._sort(order, True, nworkers, kwargs)
+
     def _compute_expr(self, item, kwargs):
-        reduce_methods = ("sum", "prod", "min", "max", "std", "mean", "var", "any", "all")
+        max_bytes = result_cache_dflts["max_bytes"]
+        key, refs = ResultCache.get_key(self, item, kwargs) if max_bytes > 0 else (None, None)
+        if key is not None:
+            result = _result_cache.get(key)
+            if result is not None:
+                return copy.copy(result)
+        result = self._eval_expr(item, kwargs)
+        if key is not None and isinstance(result, np.ndarray | np.generic):
+            _result_cache.put(key, refs, copy.copy(result), max_bytes)
+        return result
+
+    def _eval_expr(self, item, kwargs):
         if any(method in self.expression for method in reduce_methods):
             # We have reductions in the expression (probably coming from a persistent lazyexpr)
             _globals = {func: getattr(blosc2, func) for func in functions if func in self.expression}
@@ -1893,12 +4370,14 @@ class LazyExpr(LazyArray):
         items += [("dtype", self.dtype)]
         return items
 
-    def save(self, urlpath=None, **kwargs):
+    def save(self, urlpath=None, materialize=False, **kwargs):
         if urlpath is None:
             raise ValueError("To save a LazyArray you must provide an urlpath")
 
         # Validate expression
         validate_expr(self.expression)
+        if materialize and not all(isinstance(value, blosc2.NDArray) for value in self.operands.values()):
+            raise ValueError("To materialize a LazyArray, all operands must be blosc2.NDArray objects")
 
         meta = kwargs.get("meta", {})
         meta["LazyArray"] = LazyArrayEnum.Expr.value
@@ -1906,8 +4385,12 @@ class LazyExpr(LazyArray):
         kwargs["meta"] = meta
         kwargs["mode"] = "w"  # always overwrite the file in urlpath
 
-        # Create an empty array; useful for providing the shape and dtype of the outcome
-        array = blosc2.empty(shape=self.shape, dtype=self.dtype, **kwargs)
+        if materialize:
+            # Store the outcome, so that it can be refreshed later
+            array = self.compute(**kwargs)
+        else:
+            # Create an empty array; useful for providing the shape and dtype of the outcome
+            array = blosc2.empty(shape=self.shape, dtype=self.dtype, **kwargs)
 
         # Save the expression and operands in the metadata
         operands = {}
@@ -1928,11 +4411,42 @@ class LazyExpr(LazyArray):
             if value.schunk.urlpath is None:
                 raise ValueError("To save a LazyArray, all operands must be stored on disk/network")
             operands[key] = value.schunk.urlpath
-        array.schunk.vlmeta["_LazyArray"] = {
+        lazyarray = {
             "expression": self.expression,
             "UDF": None,
             "operands": operands,
         }
+        if materialize:
+            lazyarray["materialized"] = get_chunk_stamps(self.operands)
+        array.schunk.vlmeta["_LazyArray"] = lazyarray
+
+    def refresh(self) -> blosc2.NDArray:
+        """Bring up to date the materialized outcome of a :ref:`LazyExpr` opened from disk.
+
+        Only the chunks of the outcome which depend on chunks of the operands that have
+        changed (i.e. that were updated, appended or inserted) since the expression was saved
+        with ``materialize=True`` (or last refreshed) are computed again.
+
+        Returns
+        -------
+        out: :ref:`NDArray`
+            The materialized outcome, which is also available as the `array` attribute.
+        """
+        array = getattr(self, "array", None)
+        lazyarray = None if array is None else array.schunk.vlmeta["_LazyArray"]
+        if lazyarray is None or "materialized" not in lazyarray:
+            raise ValueError("Only lazy expressions saved with materialize=True can be refreshed")
+        stamps = get_chunk_stamps(self.operands)
+        shape = compute_broadcast_shape(list(self.operands.values()))
+        if shape != array.shape:
+            # The operands grew (or shrank)
+            array.resize(shape)
+            self._shape = shape
+        for slice_ in get_dirty_slices(array, self.operands, lazyarray["materialized"], stamps):
+            array[slice_] = self[slice_]
+        lazyarray["materialized"] = stamps
+        array.schunk.vlmeta["_LazyArray"] = lazyarray
+        return array
 
     @classmethod
     def _new_expr(cls, expression, operands, guess, out=None, where=None):
@@ -2048,12 +4562,17 @@ class LazyUDF(LazyArray):
         ):
             raise ValueError("Cannot use the same urlpath for LazyArray and eval NDArray")
         _ = aux_kwargs.pop("urlpath", None)
+        nworkers = kwargs.pop("nworkers", 1)
+        # UDFs are not string expressions, so they cannot be evaluated by blocks
+        kwargs.pop("block_eval", None)
         aux_kwargs.update(kwargs)
 
         if item is None:
             if self.chunked_eval:
                 res_eval = blosc2.empty(self.shape, self.dtype, **aux_kwargs)
-                chunked_eval(self.func, self.inputs_dict, None, _getitem=False, _output=res_eval)
+                chunked_eval(
+                    self.func, self.inputs_dict, None, _getitem=False, _output=res_eval, nworkers=nworkers
+                )
                 return res_eval
 
             # Cannot use multithreading when applying a prefilter, save nthreads to set them
@@ -2083,10 +4602,20 @@ class LazyUDF(LazyArray):
 
     def __getitem__(self, item):
         if self.chunked_eval:
-            output = np.empty(self.shape, self.dtype)
-            # It is important to pass kwargs here, because chunks can be used internally
-            chunked_eval(self.func, self.inputs_dict, item, _getitem=True, _output=output, **self.kwargs)
-            return output[item]
+            region, subitem = get_slice_region(item, self.shape)
+            if region is None:
+                # Not a basic (and positive step) index, so evaluate the whole array
+                output = np.empty(self.shape, self.dtype)
+                # It is important to pass kwargs here, because chunks can be used internally
+                chunked_eval(self.func, self.inputs_dict, item, _getitem=True, _output=output, **self.kwargs)
+                return output[item]
+            # Only allocate (and evaluate) the region containing the requested slice
+            output = np.empty(tuple(s.stop - s.start for s in region), self.dtype)
+            if output.size > 0:
+                chunked_eval(
+                    self.func, self.inputs_dict, region, _getitem=True, _output=output, **self.kwargs
+                )
+            return output[subitem]
         return self.res_getitem[item]
 
     def save(self, **kwargs):
@@ -2329,6 +4858,85 @@ def lazyexpr(
     return LazyExpr._new_expr(expression, operands, guess=True, out=out, where=where)
 
 
+def compute_many(exprs: Sequence[LazyArray], nworkers: int = 1, **kwargs: dict) -> list[blosc2.NDArray]:  # noqa: C901
+    """
+    Compute several lazy arrays in a single pass over their (shared) operands.
+
+    Every chunk of the operands is read and decompressed just once, and then all the
+    expressions are evaluated on it, so that the input I/O does not grow with the number of
+    expressions.  This is useful e.g. for deriving many arrays from the same inputs.
+
+    Parameters
+    ----------
+    exprs: sequence of :ref:`LazyArray`
+        The lazy arrays to compute.  The ones that cannot be evaluated together with the
+        rest (like :ref:`LazyUDF` instances, expressions with reductions or where() clauses,
+        or expressions with a shape different than the first one) are computed on their own.
+    nworkers: int, optional
+        The number of threads evaluating chunks in parallel.  Default is 1.
+    kwargs: dict, optional
+        Keyword arguments that are supported by the :func:`empty` constructor.  They are
+        used for all the outputs, so `urlpath` is not supported.  Neither is `dtype`, as
+        the dtype of every output is the one of its expression.
+
+    Returns
+    -------
+    out: list of :ref:`NDArray`
+        The computed arrays, in the same order as `exprs`.
+
+    Examples
+    --------
+    >>> import blosc2
+    >>> import numpy as np
+    >>> a = blosc2.asarray(np.arange(5))
+    >>> b = blosc2.asarray(np.arange(5) * 2)
+    >>> plus, minus = blosc2.compute_many([a + b, a - b])
+    >>> plus[:]
+    array([ 0,  3,  6,  9, 12])
+    >>> minus[:]
+    array([ 0, -1, -2, -3, -4])
+    """
+    if "urlpath" in kwargs:
+        raise ValueError("compute_many() cannot store all the outputs in the same urlpath")
+    if "dtype" in kwargs:
+        raise ValueError(
+            "compute_many() does not support `dtype`: outputs get the dtypes of the expressions"
+        )
+    exprs = list(exprs)
+    # Fuse the operands of the expressions that can be evaluated together
+    operands = {}
+    expressions = {}
+    shape = None
+    for i, expr in enumerate(exprs):
+        if (
+            not isinstance(expr, LazyExpr)
+            or not expr.operands
+            or hasattr(expr, "_where_args")
+            or hasattr(expr, "_output")
+            or any(method in expr.expression for method in reduce_methods)
+        ):
+            continue
+        expr_shape = compute_broadcast_shape([o for o in expr.operands.values() if hasattr(o, "shape")])
+        if shape is None:
+            shape = expr_shape
+        elif expr_shape != shape:
+            continue
+        new_operands, names = fuse_operands(operands, expr.operands)
+        operands |= new_operands
+        expressions[i] = fuse_expressions(expr.expression, names)
+
+    outs = [None] * len(exprs)
+    # At least an NDArray with the shape of the outputs is needed for the chunks to iterate
+    if expressions and validate_inputs(operands)[1] is not None:
+        results = many_eval(list(expressions.values()), operands, nworkers=nworkers, **kwargs)
+        for i, out in zip(expressions, results, strict=True):
+            outs[i] = out
+    for i, expr in enumerate(exprs):
+        if outs[i] is None:
+            outs[i] = expr.compute(nworkers=nworkers, **kwargs)
+    return outs
+
+
 if __name__ == "__main__":
     from time import time
 
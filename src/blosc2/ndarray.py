@@ -9,6 +9,7 @@
 from __future__ import annotations
 
 import builtins
+import itertools
 import math
 from collections import namedtuple
 from typing import TYPE_CHECKING, NamedTuple
@@ -70,6 +71,60 @@ def get_ndarray_start_stop(ndim, key, shape):
     return start, stop, step
 
 
+def get_ndarray_start_step_count(key, shape):
+    """Get the start, step and number of items of the (possibly strided) slices in `key`."""
+    ranges = [range(*s.indices(sh)) for s, sh in zip(key, shape, strict=False)]
+    start = tuple(r.start for r in ranges)
+    step = tuple(r.step for r in ranges)
+    count = tuple(len(r) for r in ranges)
+    return start, step, count
+
+
+def get_strided_slice_numpy(array, start, step, count):
+    """Get the items of a strided selection of `array` as a NumPy array.
+
+    Only the blocks containing selected items are read: along the dimensions where the
+    step is not smaller than the blocks, every block is read on its own, and along the
+    rest, the selection is read chunk by chunk (all the blocks in between contain
+    selected items anyway).
+    """
+    out = np.empty(count, dtype=array.dtype)
+    if 0 in count:
+        return out
+    # Work with positive steps, and flip the result afterwards
+    flip = tuple(i for i, st in enumerate(step) if st < 0)
+    start = [st + (n - 1) * sp if sp < 0 else st for st, sp, n in zip(start, step, count, strict=True)]
+    step = [builtins.abs(sp) for sp in step]
+    segments = []
+    for i in range(array.ndim):
+        chunk, block = array.chunks[i], array.blocks[i]
+        chunk_starts = (
+            np.arange(start[i] // chunk, (start[i] + step[i] * (count[i] - 1)) // chunk + 1) * chunk
+        )
+        edges = chunk_starts
+        if step[i] >= block:
+            # Blocks are laid out from the start of every chunk
+            edges = (chunk_starts[:, None] + np.arange(0, chunk, block)[None, :]).ravel()
+        # The positions (in the output) of the first items of every chunk or block
+        bounds = np.unique(-(-(edges - start[i]) // step[i]))
+        bounds = [0, *bounds[(bounds > 0) & (bounds < count[i])].tolist(), count[i]]
+        segments.append(list(itertools.pairwise(bounds)))
+    # Reuse the same buffer for reading all the segments
+    maxlen = math.prod(
+        builtins.max((o1 - o0 - 1) * sp + 1 for o0, o1 in segs)
+        for segs, sp in zip(segments, step, strict=True)
+    )
+    flatbuf = np.empty(maxlen, dtype=array.dtype)
+    for segment in itertools.product(*segments):
+        sl_start = [st + sp * o0 for st, sp, (o0, _) in zip(start, step, segment, strict=True)]
+        sl_stop = [st + sp * (o1 - 1) + 1 for st, sp, (_, o1) in zip(start, step, segment, strict=True)]
+        buf_shape = [sp - st for st, sp in zip(sl_start, sl_stop, strict=True)]
+        buf = flatbuf[: math.prod(buf_shape)].reshape(buf_shape)
+        array.get_slice_numpy(buf, (sl_start, sl_stop))
+        out[tuple(slice(o0, o1) for o0, o1 in segment)] = buf[tuple(slice(None, None, sp) for sp in step)]
+    return np.flip(out, flip) if flip else out
+
+
 def are_partitions_aligned(shape, chunks, blocks):
     """
     Check if the partitions defined by chunks and blocks are aligned with the shape.
@@ -130,6 +185,51 @@ def get_chunks_idx(shape, chunks):
     return chunks_idx, nchunks
 
 
+def get_intersecting_nchunks(start, stop, shape, chunks):
+    """Yield the indices of the chunks that intersect with the region from `start` to `stop`."""
+    chunks_idx, _ = get_chunks_idx(shape, chunks)
+    ranges = [range(st // c, -(-sp // c)) for st, sp, c in zip(start, stop, chunks, strict=True)]
+    for coords in itertools.product(*ranges):
+        yield int(np.ravel_multi_index(coords, chunks_idx))
+
+
+def get_coords_items(arr, coords):
+    """Get the items of `arr` at the integer `coords` (an array for each leading dimension).
+
+    This works like NumPy advanced indexing, but the items are fetched chunk by chunk,
+    reading every chunk with requested items just once.
+    """
+    coords = [c[:] if isinstance(c, NDArray) else c for c in coords]
+    if len(coords) > arr.ndim:
+        raise IndexError(f"too many indices for array: array is {arr.ndim}-dimensional")
+    coords = np.broadcast_arrays(*coords)
+    cshape = coords[0].shape
+    chunks = arr.chunks[: len(coords)]
+    shape = arr.shape[: len(coords)]
+    coords_ = []
+    for c, size in zip(coords, shape, strict=True):
+        c = c.ravel().astype(np.int64)
+        if np.any((c < -size) | (c >= size)):
+            raise IndexError(f"index out of bounds for axis with size {size}")
+        coords_.append(np.where(c < 0, c + size, c))
+    out = np.empty((len(coords_[0]), *arr.shape[len(coords) :]), dtype=arr.dtype)
+    if len(out) == 0:
+        return out.reshape(cshape + out.shape[1:])
+    # Group the coordinates by chunk
+    chunks_idx, _ = get_chunks_idx(shape, chunks)
+    nchunks = np.ravel_multi_index([c // ch for c, ch in zip(coords_, chunks, strict=True)], chunks_idx)
+    order = np.argsort(nchunks, kind="stable")
+    bounds = np.flatnonzero(np.diff(nchunks[order])) + 1
+    for group in np.split(order, bounds):
+        start = [c[group[0]] // ch * ch for c, ch in zip(coords_, chunks, strict=True)]
+        key = tuple(
+            slice(st, builtins.min(st + ch, s)) for st, ch, s in zip(start, chunks, shape, strict=True)
+        )
+        items = arr[key + (slice(None),) * (arr.ndim - len(key))]
+        out[group] = items[tuple(c[group] - st for c, st in zip(coords_, start, strict=True))]
+    return out.reshape(cshape + out.shape[1:])
+
+
 def _check_allowed_dtypes(
     value: bool | int | float | str | blosc2.NDArray | blosc2.NDField | blosc2.C2Array | blosc2.Proxy,
 ):
@@ -180,6 +280,10 @@ def sum(
         correctly against the input array.
     kwargs: dict, optional
         Additional keyword arguments supported by the :func:`empty` constructor.
+        In addition, `nworkers` sets the number of threads reducing chunks in parallel
+        (default is 1).  The partial results of the chunks are always combined in the same
+        order, so the result does not depend on the number of threads.  This is supported
+        by all the reduction functions.
 
     Returns
     -------
@@ -477,6 +581,242 @@ def max(
     return ndarr.max(axis=axis, keepdims=keepdims, **kwargs)
 
 
+def argmax(
+    ndarr: NDArray | NDField | blosc2.C2Array | blosc2.LazyExpr,
+    axis: int | None = None,
+    keepdims: bool = False,
+    **kwargs: dict,
+) -> np.ndarray | NDArray | int:
+    """
+    Return the indices of the maximum values along an axis.
+
+    Only the position of the current maximum for every output item is kept while traversing
+    the chunks, so the input does not need to fit in memory.
+
+    Parameters
+    ----------
+    ndarr: :ref:`NDArray` or :ref:`NDField` or :ref:`C2Array` or :ref:`LazyExpr`
+        The input array or expression.
+    axis: int, optional
+        Axis along which to search.  By default, `axis=None` searches the flattened array,
+        and the index is a flat (C order) one.
+    keepdims: bool, optional
+        If set to True, the reduced axes are left in the result as dimensions with size one.
+    kwargs: dict, optional
+        Additional keyword arguments that are supported by the :func:`empty` constructor.
+
+    Returns
+    -------
+    argmax_along_axis: np.ndarray or :ref:`NDArray` or scalar
+        The indices of the (first occurrences of the) maximum values.  As in NumPy, NaNs
+        are preferred.
+
+    References
+    ----------
+    `np.argmax <https://numpy.org/doc/stable/reference/generated/numpy.argmax.html>`_
+
+    Examples
+    --------
+    >>> import blosc2
+    >>> import numpy as np
+    >>> data = np.array([[11, 2, 36, 24, 5, 69], [73, 81, 49, 6, 73, 0]])
+    >>> ndarray = blosc2.asarray(data)
+    >>> print(blosc2.argmax(ndarray))
+    7
+    >>> blosc2.argmax(ndarray, axis=0)
+    array([1, 1, 1, 0, 1, 0])
+    """
+    return ndarr.argmax(axis=axis, keepdims=keepdims, **kwargs)
+
+
+def argmin(
+    ndarr: NDArray | NDField | blosc2.C2Array | blosc2.LazyExpr,
+    axis: int | None = None,
+    keepdims: bool = False,
+    **kwargs: dict,
+) -> np.ndarray | NDArray | int:
+    """
+    Return the indices of the minimum values along an axis.
+
+    The parameters are documented in the :func:`argmax <blosc2.argmax>`.
+
+    Returns
+    -------
+    argmin_along_axis: np.ndarray or :ref:`NDArray` or scalar
+        The indices of the (first occurrences of the) minimum values.  As in NumPy, NaNs
+        are preferred.
+
+    References
+    ----------
+    `np.argmin <https://numpy.org/doc/stable/reference/generated/numpy.argmin.html>`_
+
+    Examples
+    --------
+    >>> import blosc2
+    >>> import numpy as np
+    >>> data = np.array([[11, 2, 36, 24, 5, 69], [73, 81, 49, 6, 73, 0]])
+    >>> ndarray = blosc2.asarray(data)
+    >>> blosc2.argmin(ndarray, axis=1)
+    array([1, 5])
+    """
+    return ndarr.argmin(axis=axis, keepdims=keepdims, **kwargs)
+
+
+def topk(
+    ndarr: NDArray | NDField | blosc2.C2Array | blosc2.LazyExpr,
+    k: int,
+    axis: int | None = None,
+    largest: bool = True,
+    **kwargs: dict,
+) -> tuple[np.ndarray | NDArray, np.ndarray | NDArray]:
+    """
+    Return the k largest (or smallest) values along an axis, and their indices.
+
+    Only the k best candidates for every output item are kept while traversing the chunks,
+    so memory use is proportional to k and not to the size of the input.
+
+    Parameters
+    ----------
+    ndarr: :ref:`NDArray` or :ref:`NDField` or :ref:`C2Array` or :ref:`LazyExpr`
+        The input array or expression.
+    k: int
+        The number of values to select.  If the axis is shorter, all its values are selected.
+    axis: int, optional
+        Axis along which to select.  By default, `axis=None` selects from the flattened array,
+        and the indices are flat (C order) ones.
+    largest: bool, optional
+        Whether to select the largest values (the default) or the smallest ones.
+    kwargs: dict, optional
+        Additional keyword arguments that are supported by the :func:`empty` constructor.
+
+    Returns
+    -------
+    values, indices: tuple of np.ndarray or :ref:`NDArray`
+        The selected values, sorted from the best, and their indices.  The result has
+        the shape of the input, with the axis replaced by one of length k.  Ties are
+        resolved in favour of the lowest indices, and NaNs are considered larger than
+        any other value.
+
+    Examples
+    --------
+    >>> import blosc2
+    >>> import numpy as np
+    >>> data = np.array([[11, 2, 36, 24, 5, 69], [73, 81, 49, 6, 73, 0]])
+    >>> ndarray = blosc2.asarray(data)
+    >>> values, indices = blosc2.topk(ndarray, 3)
+    >>> values, indices
+    (array([81, 73, 73]), array([ 7,  6, 10]))
+    >>> blosc2.topk(ndarray, 2, axis=1, largest=False)[0]
+    array([[2, 5],
+           [0, 6]])
+    """
+    return ndarr.topk(k, axis=axis, largest=largest, **kwargs)
+
+
+def histogram(
+    ndarr: NDArray | NDField | blosc2.C2Array | blosc2.LazyExpr,
+    bins: int | Sequence = 10,
+    range: tuple | None = None,
+    density: bool = False,
+    **kwargs: dict,
+) -> tuple[np.ndarray | NDArray, np.ndarray]:
+    """
+    Compute the histogram of the values of an array or expression.
+
+    The histogram of every chunk is computed (in parallel, if `nworkers` is passed) and
+    all of them are added up, so the binned values are never materialized.  Chunks
+    whose values are all the same (e.g. zeroed chunks) are binned without being
+    decompressed.
+
+    Parameters
+    ----------
+    ndarr: :ref:`NDArray` or :ref:`NDField` or :ref:`C2Array` or :ref:`LazyExpr`
+        The input array or expression.  It is flattened.
+    bins: int or sequence of scalars, optional
+        The number of equal-width bins in the range, or the (monotonically increasing) bin
+        edges, including the rightmost one.  Unlike NumPy, bin estimators (strings) are
+        not supported.
+    range: tuple of two floats, optional
+        The lower and upper range of the bins.  By default, it is the minimum and maximum
+        of the values, which takes an extra pass over the data.  Values outside the range
+        are ignored.
+    density: bool, optional
+        If True, return the value of the probability density function at the bins,
+        normalized so that the integral over the range is 1.
+    kwargs: dict, optional
+        Additional keyword arguments that are supported by the :func:`empty` constructor.
+        If given, the histogram values are returned as an :ref:`NDArray`.
+
+    Returns
+    -------
+    hist, bin_edges: tuple of np.ndarray or :ref:`NDArray`, and np.ndarray
+        The values of the histogram and the bin edges (of length ``len(hist) + 1``).
+
+    References
+    ----------
+    `np.histogram <https://numpy.org/doc/stable/reference/generated/numpy.histogram.html>`_
+
+    Examples
+    --------
+    >>> import blosc2
+    >>> import numpy as np
+    >>> a = blosc2.asarray(np.array([[1, 2, 1], [1, 3, 4]]))
+    >>> hist, bin_edges = blosc2.histogram(a, bins=3)
+    >>> hist
+    array([3, 1, 2])
+    >>> bin_edges
+    array([1., 2., 3., 4.])
+    >>> blosc2.histogram(a * 2, bins=[0, 5, 10])[0]
+    array([4, 2])
+    """
+    return ndarr.histogram(bins=bins, range=range, density=density, **kwargs)
+
+
+def bincount(
+    ndarr: NDArray | NDField | blosc2.C2Array | blosc2.LazyExpr,
+    minlength: int = 0,
+    **kwargs: dict,
+) -> np.ndarray | NDArray:
+    """
+    Count the number of occurrences of each value in an array (or expression) of non-negative ints.
+
+    The occurrences in every chunk are counted (in parallel, if `nworkers` is passed) and
+    all of them are added up.  Chunks whose values are all the same (e.g. zeroed chunks)
+    are counted without being decompressed.
+
+    Parameters
+    ----------
+    ndarr: :ref:`NDArray` or :ref:`NDField` or :ref:`C2Array` or :ref:`LazyExpr`
+        The input array or expression.  Unlike NumPy, it does not need to be
+        1-dimensional, as it is flattened.
+    minlength: int, optional
+        A minimum number of bins for the output array.
+    kwargs: dict, optional
+        Additional keyword arguments that are supported by the :func:`empty` constructor.
+
+    Returns
+    -------
+    out: np.ndarray or :ref:`NDArray`
+        The number of occurrences of every value, from 0 to the maximum one (or
+        ``minlength - 1``).
+
+    References
+    ----------
+    `np.bincount <https://numpy.org/doc/stable/reference/generated/numpy.bincount.html>`_
+
+    Examples
+    --------
+    >>> import blosc2
+    >>> import numpy as np
+    >>> a = blosc2.asarray(np.array([[0, 1, 1], [3, 2, 1]]))
+    >>> blosc2.bincount(a)
+    array([1, 3, 1, 1])
+    >>> blosc2.bincount(a + 1, minlength=7)
+    array([0, 1, 3, 1, 1, 0, 0])
+    """
+    return ndarr.bincount(minlength=minlength, **kwargs)
+
+
 def any(
     ndarr: NDArray | NDField | blosc2.C2Array | blosc2.LazyExpr,
     axis: int | tuple[int] | None = None,
@@ -552,6 +892,317 @@ def all(
     return ndarr.all(axis=axis, keepdims=keepdims, **kwargs)
 
 
+def aggregate(
+    ndarr: NDArray | NDField | blosc2.C2Array | blosc2.LazyExpr,
+    ops: Sequence[str],
+    axis: int | tuple[int] | None = None,
+    dtype: np.dtype = None,
+    keepdims: bool = False,
+    ddof: int = 0,
+    **kwargs: dict,
+) -> dict:
+    """
+    Compute several reductions along the specified axis in a single pass.
+
+    The input is decompressed (and, for expressions, evaluated) only once per chunk,
+    and every requested reduction is fed from that same chunk.
+
+    Parameters
+    ----------
+    ndarr: :ref:`NDArray` or :ref:`NDField` or :ref:`C2Array` or :ref:`LazyExpr`
+        The input array or expression.
+    ops: sequence of str
+        The reductions to compute. Supported values are "sum", "prod", "mean", "std",
+        "var", "min", "max", "any" and "all".
+    axis: int or tuple of ints, optional
+        Axis or axes along which the reductions are performed. By default, `axis=None`
+        reduces the flattened array.
+    dtype: np.dtype, optional
+        The type used for the "sum", "prod", "mean", "std" and "var" reductions.
+        It is ignored by the rest.
+    keepdims: bool, optional
+        If set to True, the reduced axes are left in the result as
+        dimensions with size one.
+    ddof: int, optional
+        Means Delta Degrees of Freedom for the "std" and "var" reductions.
+        By default, ddof is zero.
+    kwargs: dict, optional
+        Additional keyword arguments that are supported by the :func:`empty` constructor.
+
+    Returns
+    -------
+    out: dict
+        A dictionary mapping each reduction name to its result (an np.ndarray,
+        :ref:`NDArray` or scalar).
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> import blosc2
+    >>> array = np.array([[1, 2, 3], [4, 5, 6]])
+    >>> nd_array = blosc2.asarray(array)
+    >>> stats = blosc2.aggregate(nd_array, ["min", "max", "sum"], axis=0)
+    >>> print(stats["min"], stats["max"], stats["sum"])
+    [1 2 3] [4 5 6] [5 7 9]
+    """
+    return ndarr.aggregate(ops, axis=axis, dtype=dtype, keepdims=keepdims, ddof=ddof, **kwargs)
+
+
+def describe(
+    ndarr: NDArray | NDField | blosc2.C2Array | blosc2.LazyExpr,
+    axis: int | tuple[int] | None = None,
+    **kwargs: dict,
+) -> dict:
+    """
+    Return summary statistics (count, mean, std, min and max) along the specified axis.
+
+    The statistics are computed in a single pass via :func:`aggregate <blosc2.aggregate>`,
+    whose documentation describes the parameters.
+
+    Returns
+    -------
+    out: dict
+        A dictionary with the "count", "mean", "std", "min" and "max" entries.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> import blosc2
+    >>> nd_array = blosc2.asarray(np.arange(10))
+    >>> stats = blosc2.describe(nd_array)
+    >>> print(stats["count"], stats["mean"], stats["min"], stats["max"])
+    10 4.5 0 9
+    """
+    return ndarr.describe(axis=axis, **kwargs)
+
+
+def cumsum(
+    ndarr: NDArray | NDField | blosc2.C2Array | blosc2.LazyExpr,
+    axis: int | None = None,
+    dtype: np.dtype = None,
+    **kwargs: dict,
+) -> NDArray:
+    """
+    Return the cumulative sum of the elements along a given axis.
+
+    The chunks are traversed along the axis, carrying the last sums of every chunk into
+    the next one, and the result is written straight into a new NDArray.  Only a chunk
+    (and its boundary values) is kept in memory at any time.
+
+    Parameters
+    ----------
+    ndarr: :ref:`NDArray` or :ref:`NDField` or :ref:`C2Array` or :ref:`LazyExpr`
+        The input array or expression.
+    axis: int, optional
+        Axis along which the cumulative sum is computed.  By default, `axis=None` computes
+        it over the flattened array (in C order), and the result is 1-dimensional.
+    dtype: np.dtype, optional
+        The type of the result and of the accumulator.  By default, it is the dtype of the
+        input, except for integers with less precision than the default platform integer,
+        where the latter is used (as in NumPy).
+    kwargs: dict, optional
+        Additional keyword arguments that are supported by the :func:`empty` constructor.
+        By default, the result has the same chunks and blocks as the input when `axis`
+        is given.
+
+    Returns
+    -------
+    cumsum_along_axis: :ref:`NDArray`
+        The cumulative sums.  It has the same shape as the input, unless `axis=None`.
+
+    References
+    ----------
+    `np.cumsum <https://numpy.org/doc/stable/reference/generated/numpy.cumsum.html>`_
+
+    Examples
+    --------
+    >>> import blosc2
+    >>> import numpy as np
+    >>> a = blosc2.asarray(np.array([[1, 2, 3], [4, 5, 6]]))
+    >>> blosc2.cumsum(a)[:]
+    array([ 1,  3,  6, 10, 15, 21])
+    >>> blosc2.cumsum(a, axis=0)[:]
+    array([[1, 2, 3],
+           [5, 7, 9]])
+    """
+    return ndarr.cumsum(axis=axis, dtype=dtype, **kwargs)
+
+
+def cumprod(
+    ndarr: NDArray | NDField | blosc2.C2Array | blosc2.LazyExpr,
+    axis: int | None = None,
+    dtype: np.dtype = None,
+    **kwargs: dict,
+) -> NDArray:
+    """
+    Return the cumulative product of the elements along a given axis.
+
+    The parameters are documented in the :func:`cumsum <blosc2.cumsum>`.
+
+    Returns
+    -------
+    cumprod_along_axis: :ref:`NDArray`
+        The cumulative products.
+
+    References
+    ----------
+    `np.cumprod <https://numpy.org/doc/stable/reference/generated/numpy.cumprod.html>`_
+
+    Examples
+    --------
+    >>> import blosc2
+    >>> import numpy as np
+    >>> a = blosc2.asarray(np.array([[1, 2, 3], [4, 5, 6]]))
+    >>> blosc2.cumprod(a, axis=1)[:]
+    array([[  1,   2,   6],
+           [  4,  20, 120]])
+    """
+    return ndarr.cumprod(axis=axis, dtype=dtype, **kwargs)
+
+
+def cummax(
+    ndarr: NDArray | NDField | blosc2.C2Array | blosc2.LazyExpr,
+    axis: int | None = None,
+    **kwargs: dict,
+) -> NDArray:
+    """
+    Return the cumulative maximum of the elements along a given axis.
+
+    This is the same as ``np.maximum.accumulate()``, so NaNs are propagated.  The rest of
+    parameters are documented in the :func:`cumsum <blosc2.cumsum>`.
+
+    Returns
+    -------
+    cummax_along_axis: :ref:`NDArray`
+        The running maximums, with the same dtype as the input.
+
+    Examples
+    --------
+    >>> import blosc2
+    >>> import numpy as np
+    >>> a = blosc2.asarray(np.array([3, 1, 4, 1, 5, 9, 2, 6]))
+    >>> blosc2.cummax(a)[:]
+    array([3, 3, 4, 4, 5, 9, 9, 9])
+    """
+    return ndarr.cummax(axis=axis, **kwargs)
+
+
+def cummin(
+    ndarr: NDArray | NDField | blosc2.C2Array | blosc2.LazyExpr,
+    axis: int | None = None,
+    **kwargs: dict,
+) -> NDArray:
+    """
+    Return the cumulative minimum of the elements along a given axis.
+
+    This is the same as ``np.minimum.accumulate()``, so NaNs are propagated.  The rest of
+    parameters are documented in the :func:`cumsum <blosc2.cumsum>`.
+
+    Returns
+    -------
+    cummin_along_axis: :ref:`NDArray`
+        The running minimums, with the same dtype as the input.
+
+    Examples
+    --------
+    >>> import blosc2
+    >>> import numpy as np
+    >>> a = blosc2.asarray(np.array([3, 1, 4, 1, 5, 9, 2, 6]))
+    >>> blosc2.cummin(a)[:]
+    array([3, 1, 1, 1, 1, 1, 1, 1])
+    """
+    return ndarr.cummin(axis=axis, **kwargs)
+
+
+def sort(
+    ndarr: NDArray | NDField | blosc2.C2Array | blosc2.LazyExpr,
+    order: str | list[str] | None = None,
+    nworkers: int = 1,
+    **kwargs: dict,
+) -> NDArray:
+    """
+    Return a sorted copy of a 1-dimensional array (or expression).
+
+    This is an external merge sort, so the input does not need to fit in memory: runs of
+    chunks (of up to ``blosc2.sort_dflts["max_bytes"]`` bytes) are sorted in memory
+    and stored compressed, and then all the runs are merged, a chunk at a time, straight
+    into a new :ref:`NDArray`.  The sort is stable.
+
+    Parameters
+    ----------
+    ndarr: :ref:`NDArray` or :ref:`NDField` or :ref:`C2Array` or :ref:`LazyExpr`
+        The 1-dimensional array or expression to sort.
+    order: str or list of str, optional
+        For arrays with a structured dtype, the field(s) to compare first.  The remaining
+        fields are compared next, in the order of the dtype (as in NumPy).
+    nworkers: int, optional
+        The number of threads sorting the runs in parallel.  Default is 1.
+    kwargs: dict, optional
+        Additional keyword arguments that are supported by the :func:`empty` constructor.
+        If an `urlpath` is passed, the runs are stored in a temporary directory next to
+        it, instead of in memory.  By default, the result has the same chunks and blocks
+        as the input.
+
+    Returns
+    -------
+    out: :ref:`NDArray`
+        The sorted array.
+
+    References
+    ----------
+    `np.sort <https://numpy.org/doc/stable/reference/generated/numpy.sort.html>`_
+
+    Examples
+    --------
+    >>> import blosc2
+    >>> import numpy as np
+    >>> a = blosc2.asarray(np.array([3, 1, 4, 1, 5, 9, 2, 6]))
+    >>> blosc2.sort(a)[:]
+    array([1, 1, 2, 3, 4, 5, 6, 9])
+    >>> dtype = np.dtype([("name", "U5"), ("age", np.int32)])
+    >>> people = blosc2.asarray(np.array([("Ann", 42), ("Bob", 17), ("Cid", 42)], dtype=dtype))
+    >>> blosc2.sort(people, order="age")[:]["name"]
+    array(['Bob', 'Ann', 'Cid'], dtype='<U5')
+    """
+    if not isinstance(ndarr, blosc2.LazyExpr):
+        ndarr = blosc2.LazyExpr(new_op=(ndarr, None, None))
+    return ndarr.sort(order=order, nworkers=nworkers, **kwargs)
+
+
+def argsort(
+    ndarr: NDArray | NDField | blosc2.C2Array | blosc2.LazyExpr,
+    order: str | list[str] | None = None,
+    nworkers: int = 1,
+    **kwargs: dict,
+) -> NDArray:
+    """
+    Return the indices that would sort a 1-dimensional array (or expression).
+
+    The parameters are documented in the :func:`sort <blosc2.sort>`.  Like the sort, this
+    works out of core and is stable.
+
+    Returns
+    -------
+    out: :ref:`NDArray`
+        The int64 indices that sort the input.
+
+    References
+    ----------
+    `np.argsort <https://numpy.org/doc/stable/reference/generated/numpy.argsort.html>`_
+
+    Examples
+    --------
+    >>> import blosc2
+    >>> import numpy as np
+    >>> a = blosc2.asarray(np.array([3, 1, 4, 1, 5, 9, 2, 6]))
+    >>> blosc2.argsort(a)[:]
+    array([1, 3, 6, 0, 2, 4, 7, 5])
+    """
+    if not isinstance(ndarr, blosc2.LazyExpr):
+        ndarr = blosc2.LazyExpr(new_op=(ndarr, None, None))
+    return ndarr.argsort(order=order, nworkers=nworkers, **kwargs)
+
+
 class Operand:
     """Base class for all operands in expressions."""
 
@@ -740,6 +1391,31 @@ class Operand:
         expr = blosc2.LazyExpr(new_op=(self, None, None))
         return expr.max(axis=axis, keepdims=keepdims, **kwargs)
 
+    @is_documented_by(argmax)
+    def argmax(self, axis=None, keepdims=False, **kwargs):
+        expr = blosc2.LazyExpr(new_op=(self, None, None))
+        return expr.argmax(axis=axis, keepdims=keepdims, **kwargs)
+
+    @is_documented_by(argmin)
+    def argmin(self, axis=None, keepdims=False, **kwargs):
+        expr = blosc2.LazyExpr(new_op=(self, None, None))
+        return expr.argmin(axis=axis, keepdims=keepdims, **kwargs)
+
+    @is_documented_by(topk)
+    def topk(self, k, axis=None, largest=True, **kwargs):
+        expr = blosc2.LazyExpr(new_op=(self, None, None))
+        return expr.topk(k, axis=axis, largest=largest, **kwargs)
+
+    @is_documented_by(histogram)
+    def histogram(self, bins=10, range=None, density=False, **kwargs):
+        expr = blosc2.LazyExpr(new_op=(self, None, None))
+        return expr.histogram(bins=bins, range=range, density=density, **kwargs)
+
+    @is_documented_by(bincount)
+    def bincount(self, minlength=0, **kwargs):
+        expr = blosc2.LazyExpr(new_op=(self, None, None))
+        return expr.bincount(minlength=minlength, **kwargs)
+
     @is_documented_by(any)
     def any(self, axis=None, keepdims=False, **kwargs):
         expr = blosc2.LazyExpr(new_op=(self, None, None))
@@ -750,6 +1426,36 @@ class Operand:
         expr = blosc2.LazyExpr(new_op=(self, None, None))
         return expr.all(axis=axis, keepdims=keepdims, **kwargs)
 
+    @is_documented_by(aggregate)
+    def aggregate(self, ops, axis=None, dtype=None, keepdims=False, ddof=0, **kwargs):
+        expr = blosc2.LazyExpr(new_op=(self, None, None))
+        return expr.aggregate(ops, axis=axis, dtype=dtype, keepdims=keepdims, ddof=ddof, **kwargs)
+
+    @is_documented_by(describe)
+    def describe(self, axis=None, **kwargs):
+        expr = blosc2.LazyExpr(new_op=(self, None, None))
+        return expr.describe(axis=axis, **kwargs)
+
+    @is_documented_by(cumsum)
+    def cumsum(self, axis=None, dtype=None, **kwargs):
+        expr = blosc2.LazyExpr(new_op=(self, None, None))
+        return expr.cumsum(axis=axis, dtype=dtype, **kwargs)
+
+    @is_documented_by(cumprod)
+    def cumprod(self, axis=None, dtype=None, **kwargs):
+        expr = blosc2.LazyExpr(new_op=(self, None, None))
+        return expr.cumprod(axis=axis, dtype=dtype, **kwargs)
+
+    @is_documented_by(cummax)
+    def cummax(self, axis=None, **kwargs):
+        expr = blosc2.LazyExpr(new_op=(self, None, None))
+        return expr.cummax(axis=axis, **kwargs)
+
+    @is_documented_by(cummin)
+    def cummin(self, axis=None, **kwargs):
+        expr = blosc2.LazyExpr(new_op=(self, None, None))
+        return expr.cummin(axis=axis, **kwargs)
+
 
 class NDArray(blosc2_ext.NDArray, Operand):
     def __init__(self, **kwargs):
@@ -1023,9 +1729,10 @@ class NDArray(blosc2_ext.NDArray, Operand):
         Parameters
         ----------
         key: int, slice, sequence of slices, LazyExpr or str
-            The slice(s) to be retrieved. Note that step parameter is not yet honored
-            in slices. If a LazyExpr is provided, the expression is expected to be of boolean
-            type, and the result will be the values of this array where the expression is True.
+            The slice(s) to be retrieved. Slices with a step only read the blocks
+            containing selected items. If a LazyExpr is provided, the expression is expected to be
+            of boolean type, and the result will be the values of this array where the expression
+            is True.
             If the key is a string, it will be converted to a LazyExpr, and will search for the
             operands in the fields of this structured array.
 
@@ -1053,11 +1760,13 @@ class NDArray(blosc2_ext.NDArray, Operand):
             # Massage the key to a tuple and go the fast path
             key_ = (slice(key, key + 1), *(slice(None),) * (self.ndim - 1))
             start, stop, step = get_ndarray_start_stop(self.ndim, key_, self.shape)
+            mask = (False,) * self.ndim
             shape = tuple(sp - st for st, sp in zip(start, stop, strict=True))
         elif isinstance(key, tuple) and (
             builtins.sum(isinstance(k, builtins.slice) for k in key) == self.ndim
         ):
             # This can be processed in a fast way already
+            key_, mask = key, (False,) * self.ndim
             start, stop, step = get_ndarray_start_stop(self.ndim, key, self.shape)
             shape = tuple(sp - st for st, sp in zip(start, stop, strict=True))
         else:
@@ -1070,19 +1779,26 @@ class NDArray(blosc2_ext.NDArray, Operand):
                     raise ValueError("The array is not structured (its dtype does not have fields)")
                 expr = blosc2.LazyExpr._new_expr(key, self.fields, guess=False)
                 return expr.where(self)
+            coords = key if isinstance(key, tuple) else (key,)
+            if coords and builtins.all(
+                isinstance(c, np.ndarray | NDArray) and c.dtype.kind in "iu" for c in coords
+            ):
+                # Integer arrays (e.g. from LazyExpr.nonzero())
+                return get_coords_items(self, coords)
             key_, mask = process_key(key, self.shape)
             start, stop, step = get_ndarray_start_stop(self.ndim, key_, self.shape)
             shape = np.array([sp - st for st, sp in zip(start, stop, strict=True)])
             shape = tuple(shape[[not m for m in mask]])
 
+        if step != (1,) * self.ndim:
+            # Only read the blocks with selected items
+            start, step, count = get_ndarray_start_step_count(key_, self.shape)
+            nparr = get_strided_slice_numpy(self, start, step, count)
+            return nparr[tuple(0 if m else slice(None) for m in mask)]
+
         # Create the array to store the result
         arr = np.empty(shape, dtype=self.dtype)
         nparr = super().get_slice_numpy(arr, (start, stop))
-        if step != (1,) * self.ndim:
-            if len(step) == 1:
-                return nparr[:: step[0]]
-            slice_ = tuple(slice(None, None, st) for st in step)
-            return nparr[slice_]
 
         if self._keep_last_read:
             self._last_read.clear()
@@ -1139,7 +1855,9 @@ class NDArray(blosc2_ext.NDArray, Operand):
         elif isinstance(value, NDArray):
             value = value[...]
 
-        return super().set_slice(key, value)
+        result = super().set_slice(key, value)
+        self.schunk._written(get_intersecting_nchunks(start, stop, self.shape, self.chunks))
+        return result
 
     def get_chunk(self, nchunk: int) -> bytes:
         """Shortcut to :meth:`SChunk.get_chunk <blosc2.schunk.SChunk.get_chunk>`. This can be accessed
@@ -1288,6 +2006,7 @@ class NDArray(blosc2_ext.NDArray, Operand):
         Shape of the NDArray: (1000, 1000)
         Data type of the NDArray: int32
         """
+        self.schunk.flush_tracking()
         return super().to_cframe()
 
     def copy(self, dtype: np.dtype = None, **kwargs: dict) -> NDArray:
@@ -1346,7 +2065,16 @@ class NDArray(blosc2_ext.NDArray, Operand):
             kwargs["meta"] = meta_dict
         kwargs = _check_ndarray_kwargs(**kwargs)
 
-        return super().copy(dtype, **kwargs)
+        out = super().copy(dtype, **kwargs)
+        # The tracking of writes (copied along with vlmeta) is per chunk, and the chunks of
+        # the copy can be different
+        if "_stamps" in out.schunk.vlmeta:
+            del out.schunk.vlmeta["_stamps"]
+        if self.schunk.zonemap is not None:
+            out.schunk.remove_zonemap()
+            if out.dtype.kind in "biuf":
+                out.create_zonemap()
+        return out
 
     def resize(self, newshape: tuple | list) -> None:
         """Change the shape of the array by growing or shrinking one or more dimensions.
@@ -1382,7 +2110,36 @@ class NDArray(blosc2_ext.NDArray, Operand):
         (50, 10)
         """
         blosc2_ext.check_access_mode(self.schunk.urlpath, self.schunk.mode)
+        oldshape = self.shape
         super().resize(newshape)
+        nchunks = self.schunk.nchunks
+        if tuple(oldshape[1:]) == tuple(self.shape[1:]):
+            # Only the chunks after the old (or new) last row of chunks are affected
+            _, row = get_chunks_idx(self.shape[1:], self.chunks[1:])
+            _, old_nchunks = get_chunks_idx(oldshape, self.chunks)
+            self.schunk._written(range(builtins.max(builtins.min(old_nchunks, nchunks) - row, 0), nchunks))
+        else:
+            # Chunks are laid out again
+            self.schunk._written(range(nchunks))
+
+    def create_zonemap(self) -> None:
+        """Create the zone map of the array, i.e. the minimum, maximum and number of NaNs of
+        the items in every chunk.
+
+        This is a shortcut to :meth:`SChunk.create_zonemap <blosc2.schunk.SChunk.create_zonemap>`
+        using the dtype of the array.  The zone map is kept up to date on every write, and it
+        allows filters like ``a[a > 10]`` to skip the chunks that cannot match.
+
+        Examples
+        --------
+        >>> import blosc2
+        >>> import numpy as np
+        >>> a = blosc2.asarray(np.arange(100), chunks=(25,), blocks=(5,))
+        >>> a.create_zonemap()
+        >>> a.schunk.zonemap["stats"]
+        [[0, 24, 0], [25, 49, 0], [50, 74, 0], [75, 99, 0]]
+        """
+        self.schunk.create_zonemap(self.dtype)
 
     def slice(self, key: int | slice | Sequence[slice], **kwargs: dict) -> NDArray:
         """Get a (multidimensional) slice as a new :ref:`NDArray`.
@@ -1390,8 +2147,8 @@ class NDArray(blosc2_ext.NDArray, Operand):
         Parameters
         ----------
         key: int, slice or sequence of slices
-            The index for the slices to be retrieved. Note that the step parameter is
-            not yet supported in slices.
+            The index for the slices to be retrieved. Slices with a step only read the
+            blocks containing selected items.
 
         Other Parameters
         ----------------
@@ -1422,21 +2179,57 @@ class NDArray(blosc2_ext.NDArray, Operand):
         kwargs = _check_ndarray_kwargs(**kwargs)
         key, mask = process_key(key, self.shape)
         start, stop, step = get_ndarray_start_stop(self.ndim, key, self.shape)
+        if step != (1,) * self.ndim:
+            # Fill the new array chunk by chunk, reading only the blocks with selected items
+            start, step, count = get_ndarray_start_step_count(key, self.shape)
+            shape = tuple(n for n, m in zip(count, mask, strict=True) if not m)
+            out = empty(shape, dtype=self.dtype, **kwargs)
+            dims = [i for i, m in enumerate(mask) if not m]
+            ranges = [range(0, n, builtins.max(ch, 1)) for n, ch in zip(out.shape, out.chunks, strict=True)]
+            for offsets in itertools.product(*ranges):
+                chunk_slice = tuple(
+                    slice(o, builtins.min(o + ch, n))
+                    for o, ch, n in zip(offsets, out.chunks, out.shape, strict=True)
+                )
+                chunk_start, chunk_count = list(start), [1] * self.ndim
+                for i, sl in zip(dims, chunk_slice, strict=True):
+                    chunk_start[i] = start[i] + step[i] * sl.start
+                    chunk_count[i] = sl.stop - sl.start
+                nparr = get_strided_slice_numpy(self, chunk_start, step, chunk_count)
+                out[chunk_slice] = np.ascontiguousarray(
+                    nparr.reshape([sl.stop - sl.start for sl in chunk_slice])
+                )
+            return out
+
         key = (start, stop)
-        ndslice = super().get_slice(key, mask, **kwargs)
+        return super().get_slice(key, mask, **kwargs)
 
-        # This is memory intensive, but we have not a better way to do it yet
-        # TODO: perhaps add a step param in the get_slice method in the future?
-        if step != (1,) * self.ndim:
-            nparr = ndslice[...]
-            if len(step) == 1:
-                nparr = nparr[:: step[0]]
-            else:
-                slice_ = tuple(slice(None, None, st) for st in step)
-                nparr = nparr[slice_]
-            return asarray(nparr, **kwargs)
+    def groupby(self, key: str) -> blosc2.GroupBy:
+        """Group the items of a structured array by the values of a field.
 
-        return ndslice
+        Parameters
+        ----------
+        key: str
+            The name of the field with the keys of the groups.
+
+        Returns
+        -------
+        out: :class:`GroupBy <blosc2.GroupBy>`
+            An object whose :meth:`agg <blosc2.GroupBy.agg>` method aggregates other fields
+            per group, streaming the chunks of the array.
+
+        Examples
+        --------
+        >>> import blosc2
+        >>> import numpy as np
+        >>> dtype = np.dtype([("user", np.int32), ("bytes", np.int64)])
+        >>> data = np.array([(7, 100), (3, 20), (7, 50), (3, 10), (5, 1)], dtype=dtype)
+        >>> events = blosc2.asarray(data)
+        >>> totals = events.groupby("user").agg({"bytes": "sum"})[:]
+        >>> totals["user"], totals["bytes_sum"]
+        (array([3, 5, 7], dtype=int32), array([ 30,   1, 150]))
+        """
+        return blosc2.GroupBy(self, key)
 
     def squeeze(self) -> None:
         """Remove single-dimensional entries from the shape of the array.
@@ -2878,8 +3671,10 @@ class NDField(Operand):
 
         # Check if the key is in the last read cache
         inmutable_key = make_key_hashable(key)
-        if inmutable_key in self.ndarr._last_read:
-            return self.ndarr._last_read[inmutable_key][self.field]
+        # Use a single lookup, as the cache can be refreshed by other threads evaluating chunks
+        last_read = self.ndarr._last_read.get(inmutable_key)
+        if last_read is not None:
+            return last_read[self.field]
 
         # Do the actual read in the parent NDArray
         nparr = self.ndarr[key]
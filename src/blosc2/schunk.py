@@ -7,6 +7,7 @@
 #######################################################################
 from __future__ import annotations
 
+import ctypes
 import os
 import pathlib
 from collections import namedtuple
@@ -20,6 +21,10 @@ from msgpack import packb, unpackb
 import blosc2
 from blosc2 import SpecialValue, blosc2_ext
 
+# Internal entries of vlmeta for the tracking of writes (see SChunk.flush_tracking), which
+# are hidden when listing it
+_tracking_vlmeta = ("_stamps", "_zonemap")
+
 
 class vlmeta(MutableMapping, blosc2_ext.vlmeta):
     def __init__(self, schunk, urlpath, mode, mmap_mode, initial_mapping_size):
@@ -48,18 +53,22 @@ class vlmeta(MutableMapping, blosc2_ext.vlmeta):
         super().del_vlmeta(name)
 
     def __len__(self):
-        return super().nvlmetalayers()
+        return sum(1 for _ in self)
 
     def __iter__(self):
         keys = super().get_names()
-        yield from keys
+        yield from (key for key in keys if key not in _tracking_vlmeta)
 
     def getall(self):
         """
         Return all the variable length metalayers as a dictionary
 
         """
-        return super().to_dict()
+        return {
+            key: value
+            for key, value in super().to_dict().items()
+            if (key.decode() if isinstance(key, bytes) else key) not in _tracking_vlmeta
+        }
 
 
 class Meta(Mapping):
@@ -139,7 +148,102 @@ class Meta(Mapping):
         return blosc2_ext.meta__len__(self.schunk)
 
 
+# For the write stamps of the chunks (see SChunk._chunk_stamps)
+_stamps_rng = np.random.default_rng()
+
+
+def _new_stamps(n):
+    return _stamps_rng.integers(1, 2**63, size=n, dtype=np.int64).tolist()
+
+
+def _follow_chunks(items, nchunks, inserted=None, deleted=None):
+    """Make the per-chunk `items` follow the `inserted`, `deleted` or added/removed chunks.
+
+    The items for new chunks are set to None, and their indices are returned.
+    """
+    if deleted is not None:
+        del items[deleted]
+    if inserted is not None:
+        items.insert(inserted, None)
+    added = set(range(len(items), nchunks))
+    del items[nchunks:]
+    items.extend([None] * len(added))
+    if inserted is not None:
+        added.add(inserted)
+    return added
+
+
+def _pack_zonemap(zonemap):
+    """Encode the zone map kept in memory for vlmeta (as binary, which is much faster)."""
+    dtype, stats = zonemap["dtype"], zonemap["stats"]
+    # A NaN minimum (only for floats) stands for all the items being NaN
+    mins = [np.nan if stat[0] is None else stat[0] for stat in stats]
+    maxs = [np.nan if stat[1] is None else stat[1] for stat in stats]
+    return {
+        "dtype": dtype.str,
+        "mins": np.array(mins, dtype=dtype).tobytes(),
+        "maxs": np.array(maxs, dtype=dtype).tobytes(),
+        "nans": np.array([stat[2] for stat in stats], dtype=np.int64).tobytes(),
+    }
+
+
+def _unpack_zonemap(zonemap):
+    """Decode the zone map in vlmeta (see _pack_zonemap)."""
+    dtype = np.dtype(zonemap["dtype"])
+    mins = np.frombuffer(zonemap["mins"], dtype=dtype).tolist()
+    maxs = np.frombuffer(zonemap["maxs"], dtype=dtype).tolist()
+    nans = np.frombuffer(zonemap["nans"], dtype=np.int64).tolist()
+    stats = [
+        [None, None, n] if min_ != min_ else [min_, max_, n]  # noqa: PLR0124
+        for min_, max_, n in zip(mins, maxs, nans, strict=True)
+    ]
+    return {"dtype": dtype, "stats": stats}
+
+
+def _check_native_dtypes(input_dtype, output_dtype):
+    output_dtype = input_dtype if output_dtype is None else output_dtype
+    if np.dtype(input_dtype).itemsize != np.dtype(output_dtype).itemsize:
+        raise ValueError("`dtype_input` and `dtype_output` must have the same size")
+
+
+def _native_address(func) -> int | None:
+    """Return the address of `func` if it is a native function, or None otherwise.
+
+    Native functions are numba ``cfunc`` objects, ctypes function pointers or plain
+    addresses (as ints).
+    """
+    if isinstance(func, int):
+        return func
+    if isinstance(func, ctypes._CFuncPtr):
+        return ctypes.cast(func, ctypes.c_void_p).value
+    address = getattr(func, "address", None)
+    return address if isinstance(address, int) else None
+
+
+def _is_python_callback(func) -> bool:
+    """Whether `func` is a ctypes function pointer calling back into a Python function.
+
+    These need the GIL, so (like Python filters) they cannot be run by several threads.
+    """
+    objects = getattr(func, "_objects", None)
+    if not isinstance(objects, dict):
+        return False
+    return any(type(obj).__name__ == "CThunkObject" or _is_python_callback(obj) for obj in objects.values())
+
+
 class SChunk(blosc2_ext.SChunk):
+    # Incremented on every write of the data, so that results computed from it can be discarded
+    _version = 0
+    # The tracking of writes (the write stamps of the chunks and the zone map) kept in memory
+    # (see _load_tracking), and whether it is newer than the copy in vlmeta.  Every write path
+    # calls _written(), which updates it in memory and only marks the copy in vlmeta as
+    # outdated on the first write after a flush, as rewriting it on every write would take
+    # O(nchunks).  The copy is only written back by flush_tracking() (called explicitly, or
+    # before serializing), and an outdated one is never trusted, so not flushing (or a process
+    # dying) just means that everything is computed again by the next reader.
+    _tracking = None
+    _tracking_dirty = False
+
     def __init__(  # noqa: C901
         self,
         chunksize: int | None = None,
@@ -425,7 +529,9 @@ class SChunk(blosc2_ext.SChunk):
         1
         """
         blosc2_ext.check_access_mode(self.urlpath, self.mode)
-        return super().append_data(data)
+        nchunks = super().append_data(data)
+        self._written([nchunks - 1])
+        return nchunks
 
     def fill_special(
         self,
@@ -487,6 +593,7 @@ class SChunk(blosc2_ext.SChunk):
         nchunks = super().fill_special(nitems, special_value.value, value)
         if nchunks < 0:
             raise RuntimeError("Unable to fill with special values")
+        self._written(range(nchunks))
         return nchunks
 
     def decompress_chunk(self, nchunk: int, dst: object = None) -> str | bytes:
@@ -607,7 +714,9 @@ class SChunk(blosc2_ext.SChunk):
         2
         """
         blosc2_ext.check_access_mode(self.urlpath, self.mode)
-        return super().delete_chunk(nchunk)
+        nchunks = super().delete_chunk(nchunk)
+        self._written(deleted=nchunk)
+        return nchunks
 
     def insert_chunk(self, nchunk: int, chunk: bytes) -> int:
         """Insert an already compressed chunk into the SChunk.
@@ -646,7 +755,9 @@ class SChunk(blosc2_ext.SChunk):
         3
         """
         blosc2_ext.check_access_mode(self.urlpath, self.mode)
-        return super().insert_chunk(nchunk, chunk)
+        nchunks = super().insert_chunk(nchunk, chunk)
+        self._written([nchunk], inserted=nchunk)
+        return nchunks
 
     def insert_data(self, nchunk: int, data: object, copy: bool) -> int:
         """Insert the data in the specified position in the SChunk.
@@ -687,7 +798,9 @@ class SChunk(blosc2_ext.SChunk):
         3
         """
         blosc2_ext.check_access_mode(self.urlpath, self.mode)
-        return super().insert_data(nchunk, data, copy)
+        nchunks = super().insert_data(nchunk, data, copy)
+        self._written([nchunk], inserted=nchunk)
+        return nchunks
 
     def update_chunk(self, nchunk: int, chunk: bytes) -> int:
         """Update an existing chunk in the SChunk.
@@ -729,7 +842,9 @@ class SChunk(blosc2_ext.SChunk):
         Number of chunks after update: 5
         """
         blosc2_ext.check_access_mode(self.urlpath, self.mode)
-        return super().update_chunk(nchunk, chunk)
+        nchunks = super().update_chunk(nchunk, chunk)
+        self._written([nchunk])
+        return nchunks
 
     def update_data(self, nchunk: int, data: object, copy: bool) -> int:
         """Update the chunk in the specified position with the given data.
@@ -771,7 +886,266 @@ class SChunk(blosc2_ext.SChunk):
         Number of chunks after update: 4
         """
         blosc2_ext.check_access_mode(self.urlpath, self.mode)
-        return super().update_data(nchunk, data, copy)
+        nchunks = super().update_data(nchunk, data, copy)
+        self._written([nchunk])
+        return nchunks
+
+    def update_special(
+        self, nchunk: int, special_value: blosc2.SpecialValue, value: bytes | int | float | None = None
+    ) -> int:
+        """Replace the chunk in the specified position with a special chunk.
+
+        A special chunk only stores a header (plus the value, for ``SpecialValue.VALUE``),
+        so this is much faster than compressing a chunk full of repeated values.  It holds
+        as many items as the chunk it replaces (which may be fewer than :attr:`chunkshape`
+        for the last one).
+
+        Parameters
+        ----------
+        nchunk: int
+            The index of the chunk to be updated.
+        special_value: SpecialValue
+            The special value for the chunk (any other than ``SpecialValue.NOT_SPECIAL``).
+        value: bytes, int, float or np.generic, optional
+            The value to repeat in the chunk. Only needed (and used) when
+            :paramref:`special_value` is ``SpecialValue.VALUE``. Its size in bytes must
+            match the typesize.
+
+        Returns
+        -------
+        out: int
+            The number of chunks in the SChunk.
+
+        Raises
+        ------
+        TypeError
+            If :paramref:`special_value` is not an allowed SpecialValue.
+        ValueError
+            If :paramref:`value` is missing or its size does not match the typesize.
+
+        Examples
+        --------
+        >>> import blosc2
+        >>> import numpy as np
+        >>> data = np.arange(400, dtype=np.int32)
+        >>> schunk = blosc2.SChunk(chunksize=400, data=data, cparams=blosc2.CParams(typesize=4))
+        >>> nchunks = schunk.update_special(1, blosc2.SpecialValue.VALUE, np.int32(7))
+        >>> np.frombuffer(schunk.decompress_chunk(1), dtype=np.int32)[:4]
+        array([7, 7, 7, 7], dtype=int32)
+        """
+        blosc2_ext.check_access_mode(self.urlpath, self.mode)
+        if not isinstance(special_value, SpecialValue) or special_value == SpecialValue.NOT_SPECIAL:
+            raise TypeError("special_value must be a SpecialValue instance other than NOT_SPECIAL")
+        if special_value == SpecialValue.VALUE and value is None:
+            raise ValueError("value cannot be None when special_value is VALUE")
+        nchunks = super().update_special(nchunk, special_value.value, value)
+        self._written([nchunk])
+        return nchunks
+
+    def create_zonemap(self, dtype: np.dtype) -> None:
+        """Create the zone map of the SChunk, i.e. statistics of the items in every chunk.
+
+        The minimum, the maximum and the number of NaNs of the items in each chunk are kept in
+        a hidden ``"_zonemap"`` entry of :attr:`vlmeta` (so they persist along with the data,
+        see :meth:`flush_tracking`), and they are updated for the chunks written on every
+        write from then on.  Filters on lazy expressions (like ``expr.where(a)`` or
+        ``a[a > 10]``) use them for skipping the chunks that cannot match comparisons
+        between operands and scalars.
+
+        Parameters
+        ----------
+        dtype: np.dtype
+            The data type of the items.  Only booleans, integers and floats are supported.
+
+        Examples
+        --------
+        >>> import blosc2
+        >>> import numpy as np
+        >>> data = np.arange(3 * 1000, dtype=np.int64)
+        >>> schunk = blosc2.SChunk(chunksize=1000 * 8, data=data, cparams={"typesize": 8})
+        >>> schunk.create_zonemap(np.int64)
+        >>> schunk.zonemap["stats"]
+        [[0, 999, 0], [1000, 1999, 0], [2000, 2999, 0]]
+        """
+        dtype = np.dtype(dtype)
+        if dtype.kind not in "biuf":
+            raise TypeError("Zone maps are only supported for booleans, integers and floats")
+        if dtype.itemsize != self.typesize:
+            raise ValueError("The itemsize of dtype must be the typesize of the SChunk")
+        stats = [self._chunk_stats(nchunk, dtype) for nchunk in range(self.nchunks)]
+        self._load_tracking()["zonemap"] = {"dtype": dtype, "stats": stats}
+        self._tracking_dirty = True
+        self.flush_tracking()
+
+    def remove_zonemap(self) -> None:
+        """Remove the zone map of the SChunk (if any).
+
+        See Also
+        --------
+        :meth:`create_zonemap`
+        """
+        self._load_tracking()["zonemap"] = None
+        if "_zonemap" in self.vlmeta:
+            del self.vlmeta["_zonemap"]
+
+    @property
+    def zonemap(self) -> dict | None:
+        """The zone map of the SChunk (see :meth:`create_zonemap`), or None if it does not exist.
+
+        This is a dictionary with the ``"dtype"`` of the items, and the ``"stats"`` of each
+        chunk as a ``[min, max, nans]`` list (min and max are None when all the items are NaN).
+        """
+        zonemap = self._load_tracking()["zonemap"]
+        if zonemap is None:
+            return None
+        return {"dtype": zonemap["dtype"].str, "stats": [list(stat) for stat in zonemap["stats"]]}
+
+    def _written(self, nchunks=(), inserted=None, deleted=None):
+        """Keep track of a write to the `nchunks` chunks (plus an `inserted` or `deleted` one).
+
+        Every path writing to the data must call this, so that the version of the data, the
+        write stamps and the zone map (if any) are kept up to date.
+        """
+        self._version += 1
+        rebuilt = set()
+        if self._tracking is None:
+            # The copy in vlmeta comes from before this write (unless rebuilt from the data)
+            rebuilt = self._read_tracking(check=False)
+        tracking = self._tracking
+        if tracking["stamps"] is None and tracking["zonemap"] is None:
+            return
+        self._mark_tracking_dirty()
+        written = {nchunk for nchunk in nchunks if nchunk < self.nchunks}
+        if tracking["stamps"] is not None and "stamps" not in rebuilt:
+            stamps = tracking["stamps"]
+            renewed = sorted(written | _follow_chunks(stamps, self.nchunks, inserted, deleted))
+            for nchunk, stamp in zip(renewed, _new_stamps(len(renewed)), strict=True):
+                stamps[nchunk] = stamp
+        if tracking["zonemap"] is not None and "zonemap" not in rebuilt:
+            dtype, stats = tracking["zonemap"]["dtype"], tracking["zonemap"]["stats"]
+            for nchunk in written | _follow_chunks(stats, self.nchunks, inserted, deleted):
+                stats[nchunk] = self._chunk_stats(nchunk, dtype)
+
+    def _chunk_stats(self, nchunk, dtype):
+        """Compute the ``[min, max, nans]`` statistics of the items in the `nchunk` chunk."""
+        # Padding items (e.g. in NDArray chunks) can only widen the ranges, which is safe
+        items = np.frombuffer(self.decompress_chunk(nchunk), dtype=dtype)
+        nans = int(np.count_nonzero(np.isnan(items))) if dtype.kind == "f" else 0
+        if nans == len(items):
+            return [None, None, nans]
+        return [np.nanmin(items).item(), np.nanmax(items).item(), nans]
+
+    def _load_tracking(self):
+        """Get the tracking of writes, loading it from vlmeta if not done yet.
+
+        This is a dictionary with the write ``"stamps"`` of the chunks (None if they are not
+        kept, see :meth:`_chunk_stamps`) and the ``"zonemap"`` (None if there is none, see
+        :meth:`create_zonemap`).  It is updated in memory on every write, and only written
+        back to vlmeta lazily (see :meth:`flush_tracking`).
+        """
+        if self._tracking is None:
+            self._read_tracking()
+        return self._tracking
+
+    def _read_tracking(self, check=True):
+        """Read the tracking of writes from vlmeta, and return the parts rebuilt from the data.
+
+        If the copy in vlmeta was left outdated (i.e. it was not flushed after writing), or
+        does not match the number of chunks (when `check` is true), all the chunks get new
+        stamps and the zone map is computed again.  This is only kept in memory until the
+        next flush, as other (live) SChunks may still be writing the data.
+        """
+        tracking = {"stamps": None, "zonemap": None}
+        rebuilt = set()
+        stamps = self.vlmeta.get("_stamps")
+        if stamps is not None:
+            if stamps.get("dirty") or (check and len(stamps["stamps"]) != 8 * self.nchunks):
+                tracking["stamps"] = _new_stamps(self.nchunks)
+                rebuilt.add("stamps")
+            else:
+                tracking["stamps"] = np.frombuffer(stamps["stamps"], dtype=np.int64).tolist()
+        zonemap = self.vlmeta.get("_zonemap")
+        if zonemap is not None:
+            if zonemap.get("dirty") or (check and len(zonemap["nans"]) != 8 * self.nchunks):
+                dtype = np.dtype(zonemap["dtype"])
+                stats = [self._chunk_stats(nchunk, dtype) for nchunk in range(self.nchunks)]
+                tracking["zonemap"] = {"dtype": dtype, "stats": stats}
+                rebuilt.add("zonemap")
+            else:
+                tracking["zonemap"] = _unpack_zonemap(zonemap)
+        self._tracking = tracking
+        if rebuilt and (self.urlpath is None or self.mode != "r"):
+            self._tracking_dirty = True
+        return rebuilt
+
+    def _mark_tracking_dirty(self):
+        """Mark the tracking of writes in vlmeta as outdated, until it is flushed."""
+        if self._tracking_dirty:
+            return
+        self._tracking_dirty = True
+        # Writing the whole tracking on every write would be too slow, so just leave a mark
+        # for not trusting it in the meantime
+        if self._tracking["stamps"] is not None:
+            self.vlmeta["_stamps"] = {"dirty": True}
+        if self._tracking["zonemap"] is not None:
+            self.vlmeta["_zonemap"] = {"dtype": self._tracking["zonemap"]["dtype"].str, "dirty": True}
+
+    def flush_tracking(self) -> None:
+        """Write the tracking of writes kept in memory (if newer) back to :attr:`vlmeta`.
+
+        The zone map (see :meth:`create_zonemap`) and the write stamps of the chunks (kept
+        for the operands of lazy expressions saved with ``materialize=True``) are updated
+        in memory on every write, and the copy in :attr:`vlmeta` is just marked as outdated
+        on the first write after a flush.  Call this when done with writing, so that the
+        SChunk does not have to compute them again when opened next time (the stamps are
+        renewed for all the chunks then, so the next :meth:`LazyExpr.refresh` computes the
+        whole outcome).  This is also done before serializing the SChunk.
+
+        Examples
+        --------
+        >>> import blosc2
+        >>> import numpy as np
+        >>> data = np.arange(3 * 1000, dtype=np.int64)
+        >>> schunk = blosc2.SChunk(chunksize=1000 * 8, data=data, cparams={"typesize": 8})
+        >>> schunk.create_zonemap(np.int64)
+        >>> schunk[:1] = np.int64(-1)
+        >>> schunk.vlmeta.get("_zonemap")
+        {'dtype': '<i8', 'dirty': True}
+        >>> schunk.flush_tracking()
+        >>> sorted(schunk.vlmeta.get("_zonemap"))
+        ['dtype', 'maxs', 'mins', 'nans']
+        """
+        if not self._tracking_dirty:
+            return
+        stamps = self._tracking["stamps"]
+        if stamps is not None:
+            self.vlmeta["_stamps"] = {"stamps": np.array(stamps, dtype=np.int64).tobytes()}
+        if self._tracking["zonemap"] is not None:
+            self.vlmeta["_zonemap"] = _pack_zonemap(self._tracking["zonemap"])
+        self._tracking_dirty = False
+
+    def _chunk_stamps(self):
+        """Get the write stamps of the chunks, starting to keep them if not done yet.
+
+        Every write gives new (random) stamps to the chunks written, so a chunk has not
+        changed as long as its stamp is the same.  None is returned if the stamps are not
+        kept and the SChunk is read-only.
+        """
+        tracking = self._load_tracking()
+        if tracking["stamps"] is None:
+            if self.urlpath is not None and self.mode == "r":
+                return None
+            tracking["stamps"] = _new_stamps(self.nchunks)
+            self._tracking_dirty = True
+            self.flush_tracking()
+        return list(tracking["stamps"])
+
+    def _fill_prefilter(self, func, nthreads):
+        try:
+            super()._fill_prefilter(func, nthreads)
+        finally:
+            # All the chunks are (or may have been, on errors) written
+            self._written(range(self.nchunks))
 
     def get_slice(self, start: int = 0, stop: int | None = None, out: object = None) -> str | bytes | None:
         """Get a slice from :paramref:`start` to :paramref:`stop`.
@@ -946,7 +1320,14 @@ class SChunk(blosc2_ext.SChunk):
         if key.step is not None and key.step != 1:
             raise IndexError("`step` must be 1")
         blosc2_ext.check_access_mode(self.urlpath, self.mode)
-        return super().set_slice(start=key.start, stop=key.stop, value=value)
+        super().set_slice(start=key.start, stop=key.stop, value=value)
+        start = key.start or 0
+        stop = key.stop if key.stop is not None else len(self)
+        if start < 0 or stop < 0:
+            nchunks = range(self.nchunks)
+        else:
+            nchunks = range(start // self.chunkshape, -(-stop // self.chunkshape))
+        self._written(nchunks)
 
     def to_cframe(self) -> bytes:
         """Get a bytes object containing the serialized :ref:`SChunk` instance.
@@ -985,6 +1366,7 @@ class SChunk(blosc2_ext.SChunk):
         >>> f"Deserialized slice: {sl}"
         Deserialized slice: [500 501 502 503 504]
         """
+        self.flush_tracking()
         return super().to_cframe()
 
     def iterchunks(self, dtype: np.dtype) -> Iterator[np.ndarray]:
@@ -1097,6 +1479,11 @@ class SChunk(blosc2_ext.SChunk):
         * the output `ndarray` to be filled out
         * the offset inside the `SChunk` instance where the corresponding block begins (see example below).
 
+        As for :meth:`prefilter`, the function can also be a native one with the C signature
+        ``int func(const void *input, void *output, int64_t nitems, int64_t offset)``,
+        which is called without the GIL, so it can run in all the decompression threads
+        (except for ctypes callbacks of Python functions, see :meth:`prefilter`).
+
         Parameters
         ----------
         input_dtype: np.dtype
@@ -1111,7 +1498,8 @@ class SChunk(blosc2_ext.SChunk):
 
         Notes
         -----
-        * `nthreads` must be 1 when decompressing.
+        * `nthreads` must be 1 when decompressing, unless the function is a native one
+          not calling back into Python.
 
         * The :paramref:`input_dtype` itemsize must be the same as the
           :paramref:`output_dtype` itemsize.
@@ -1141,6 +1529,16 @@ class SChunk(blosc2_ext.SChunk):
         """
 
         def initialize(func):
+            address = _native_address(func)
+            if address is not None:
+                _check_native_dtypes(input_dtype, output_dtype)
+                if _is_python_callback(func) and self.dparams.nthreads > 1:
+                    raise AttributeError(
+                        "decompress `nthreads` must be 1 when assigning a postfilter calling back into Python"
+                    )
+                func_name = getattr(func, "__name__", f"native_{address:x}")
+                super(SChunk, self)._set_native_postfilter(func, address, func_name)
+                return func
             super(SChunk, self)._set_postfilter(func, input_dtype, output_dtype)
 
             def exec_func(*args):
@@ -1278,6 +1676,18 @@ class SChunk(blosc2_ext.SChunk):
         * The `ndarray` to be filled,
         * The offset inside the `SChunk` instance where the corresponding block begins (see example below).
 
+        The function can also be a native one (a numba ``cfunc``, a ctypes function pointer
+        or its address as an int) with the C signature
+        ``int func(const void *input, void *output, int64_t nitems, int64_t offset)``,
+        where `nitems` is the number of items in the block, and returning 0 on success.
+        Native functions are called without the GIL, so they can run in parallel in all
+        the compression threads.  This does not hold for ctypes function pointers wrapping
+        a Python function (e.g. ``ctypes.CFUNCTYPE(...)(func)``), which need the GIL, so
+        `nthreads` must be 1 for them as for Python functions (plain addresses of such
+        callbacks cannot be told apart, so do not use them with several threads).  Native
+        functions are removed by their `__name__` (or ``native_<hex address>`` if they
+        have none).
+
         Parameters
         ----------
         input_dtype: np.dtype
@@ -1292,7 +1702,8 @@ class SChunk(blosc2_ext.SChunk):
 
         Notes
         -----
-        * `nthreads` must be 1 when compressing.
+        * `nthreads` must be 1 when compressing, unless the function is a native one
+          not calling back into Python.
 
         * The :paramref:`input_dtype` itemsize must be the same as the
           :paramref:`output_dtype` itemsize.
@@ -1319,9 +1730,33 @@ class SChunk(blosc2_ext.SChunk):
             @schunk.prefilter(input_dtype, output_dtype)
             def prefilter(input, output, offset):
                 output[:] = input - np.pi
+
+            # Or set a native prefilter, which can run in several threads
+            import numba
+
+            schunk.remove_prefilter("prefilter")
+            schunk.cparams = blosc2.CParams(typesize=output_dtype.itemsize, nthreads=4)
+
+
+            @schunk.prefilter(input_dtype, output_dtype)
+            @numba.cfunc("int32(CPointer(int32), CPointer(float32), int64, int64)")
+            def native_prefilter(input, output, nitems, offset):
+                for i in range(nitems):
+                    output[i] = input[i] - np.pi
+                return 0
         """
 
         def initialize(func):
+            address = _native_address(func)
+            if address is not None:
+                _check_native_dtypes(input_dtype, output_dtype)
+                if _is_python_callback(func) and self.cparams.nthreads > 1:
+                    raise AttributeError(
+                        "compress `nthreads` must be 1 when assigning a prefilter calling back into Python"
+                    )
+                func_name = getattr(func, "__name__", f"native_{address:x}")
+                super(SChunk, self)._set_native_prefilter(func, address, func_name)
+                return func
             super(SChunk, self)._set_prefilter(func, input_dtype, output_dtype)
 
             def exec_func(*args):
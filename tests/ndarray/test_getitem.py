@@ -77,3 +77,50 @@ def test_getitem_shapes():
     assert b2a[1:-1, 1].shape == npa[1:-1, 1].shape
     assert b2a[1, :-2].shape == npa[1, :-2].shape
     assert b2a[1:-2, 2:-3].shape == npa[1:-2, 2:-3].shape
+
+
+@pytest.mark.parametrize(
+    ("shape", "chunks", "blocks"),
+    [
+        ([456], [258], [73]),
+        ([77, 134, 13], [31, 13, 5], [7, 8, 3]),
+    ],
+)
+def test_getitem_coords(shape, chunks, blocks):
+    nparray = np.arange(np.prod(shape), dtype=np.float64).reshape(shape)
+    a = blosc2.asarray(nparray, chunks=chunks, blocks=blocks)
+    rng = np.random.default_rng(0)
+    coords = tuple(rng.integers(-s, s, size=50) for s in shape)
+    np.testing.assert_array_equal(a[coords], nparray[coords])
+    # Leading dimensions only, multidimensional and (compressed) NDArray indices
+    np.testing.assert_array_equal(a[coords[0]], nparray[coords[0]])
+    np.testing.assert_array_equal(a[coords[0].reshape(5, 10)], nparray[coords[0].reshape(5, 10)])
+    np.testing.assert_array_equal(a[blosc2.asarray(coords[0])], nparray[coords[0]])
+    np.testing.assert_array_equal(a[coords[0][:0]], nparray[coords[0][:0]])
+    with pytest.raises(IndexError):
+        a[np.array([shape[0]])]
+    with pytest.raises(IndexError):
+        a[(coords[0],) * (len(shape) + 1)]
+
+
+@pytest.mark.parametrize(
+    ("shape", "chunks", "blocks", "slices"),
+    [
+        ([1000], [100], [10], slice(3, None, 7)),
+        ([1000], [128], [32], slice(None, None, 40)),
+        ([1000], [128], [32], slice(-5, 10, -33)),
+        ([77, 134, 13], [31, 13, 5], [7, 8, 3], (slice(None, None, 9), slice(3, 120, 2), 7)),
+        (
+            [77, 134, 13],
+            [31, 13, 5],
+            [7, 8, 3],
+            (slice(70, 2, -8), slice(None, None, 20), slice(None, None, -1)),
+        ),
+        ([40, 50], [16, 20], [4, 5], (3, slice(None, None, 6))),
+        ([40, 50], [16, 20], [4, 5], (slice(50, 60, 3), slice(None, None, 6))),
+    ],
+)
+def test_getitem_steps(shape, chunks, blocks, slices):
+    nparray = np.arange(np.prod(shape), dtype=np.float64).reshape(shape)
+    a = blosc2.asarray(nparray, chunks=chunks, blocks=blocks)
+    np.testing.assert_array_equal(a[slices], nparray[slices])
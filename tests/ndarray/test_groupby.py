@@ -0,0 +1,104 @@
+#######################################################################
+# Copyright (c) 2019-present, Blosc Development Team <blosc@blosc.org>
+# All rights reserved.
+#
+# This source code is licensed under a BSD-style license (found in the
+# LICENSE file in the root directory of this source tree)
+#######################################################################
+
+import numpy as np
+import pytest
+
+import blosc2
+
+
+def make_array(n, key_dtype, chunks):
+    rng = np.random.default_rng(42)
+    dtype = np.dtype([("k", key_dtype), ("x", np.float64), ("y", np.int16)])
+    nparray = np.empty(n, dtype=dtype)
+    if dtype["k"].kind == "U":
+        nparray["k"] = rng.choice(["a", "bb", "ccc", "d"], n)
+    elif dtype["k"].kind == "f":
+        nparray["k"] = rng.integers(0, 7, n) * 0.5
+    else:
+        nparray["k"] = rng.integers(0, 12, n)
+    nparray["x"] = rng.normal(size=n)
+    nparray["y"] = rng.integers(-100, 100, n)
+    return blosc2.asarray(nparray, chunks=chunks), nparray
+
+
+@pytest.mark.parametrize(
+    ("n", "key_dtype", "chunks"),
+    [
+        (1000, np.int32, (100,)),
+        (1037, np.uint8, (64,)),
+        (5000, np.float64, (333,)),
+        (3000, "U3", (256,)),
+        (2000, np.int64, (100,)),
+        (3, np.int32, (2,)),
+    ],
+)
+@pytest.mark.parametrize("nworkers", [1, 3])
+def test_groupby(n, key_dtype, chunks, nworkers):
+    a, nparray = make_array(n, key_dtype, chunks)
+    aggs = {"x": ["count", "sum", "mean", "std", "var", "min", "max"], "y": ["sum", "min", "max", "mean"]}
+    res = a.groupby("k").agg(aggs, nworkers=nworkers)[:]
+    keys = np.unique(nparray["k"])
+    np.testing.assert_array_equal(res["k"], keys)
+    for field, ops in aggs.items():
+        for op in ops:
+            func = len if op == "count" else getattr(np, op)
+            expected = np.array([func(nparray[field][nparray["k"] == k]) for k in keys])
+            assert res[f"{field}_{op}"].dtype == expected.dtype
+            np.testing.assert_allclose(res[f"{field}_{op}"], expected, rtol=1e-10)
+
+
+def test_groupby_wide_keys():
+    # Integer keys spanning more values than a chunk are grouped by sorting
+    nparray = np.zeros(1000, dtype=[("k", np.int64), ("x", np.float32)])
+    nparray["k"] = np.arange(1000) % 7 * 10**12
+    nparray["x"] = np.arange(1000)
+    a = blosc2.asarray(nparray, chunks=(100,))
+    res = a.groupby("k").agg({"x": "sum"})[:]
+    np.testing.assert_array_equal(res["k"], np.arange(7) * 10**12)
+    np.testing.assert_array_equal(res["x_sum"], [np.sum(nparray["x"][i::7]) for i in range(7)])
+
+
+def test_groupby_ddof():
+    a, nparray = make_array(500, np.int32, (64,))
+    res = a.groupby("k").agg({"x": ["std", "var"]}, ddof=1)[:]
+    for i, k in enumerate(res["k"]):
+        x = nparray["x"][nparray["k"] == k]
+        np.testing.assert_allclose(res["x_std"][i], np.std(x, ddof=1))
+        np.testing.assert_allclose(res["x_var"][i], np.var(x, ddof=1))
+
+
+def test_groupby_empty():
+    a = blosc2.asarray(np.empty(0, dtype=[("k", np.int32), ("x", np.float64)]))
+    res = a.groupby("k").agg({"x": ["count", "mean"]})
+    assert res.shape == (0,)
+    assert res.dtype.names == ("k", "x_count", "x_mean")
+
+
+def test_groupby_kwargs():
+    a, nparray = make_array(100, np.int32, (10,))
+    res = a.groupby("k").agg({"y": "max"}, urlpath="test.b2nd", mode="w")
+    assert isinstance(res, blosc2.NDArray)
+    assert res.urlpath == "test.b2nd"
+    keys = np.unique(nparray["k"])
+    # Single aggregations are named like the ones in lists
+    assert res.dtype.names == ("k", "y_max")
+    np.testing.assert_array_equal(res[:]["y_max"], [np.max(nparray["y"][nparray["k"] == k]) for k in keys])
+    blosc2.remove_urlpath("test.b2nd")
+
+
+def test_groupby_errors():
+    a, _ = make_array(100, np.int32, (10,))
+    with pytest.raises(TypeError):
+        blosc2.zeros(10).groupby("k")
+    with pytest.raises(TypeError):
+        a.groupby("nope")
+    with pytest.raises(TypeError):
+        a.groupby("k").agg({"nope": "sum"})
+    with pytest.raises(ValueError):
+        a.groupby("k").agg({"x": "median"})
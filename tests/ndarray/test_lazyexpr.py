@@ -6,11 +6,27 @@
 # LICENSE file in the root directory of this source tree)
 #######################################################################
 
+import concurrent.futures
+import sys
+
 import numexpr as ne
 import numpy as np
 import pytest
 
 import blosc2
+from blosc2.lazyexpr import (
+    ChunkPrefetcher,
+    ExprDAG,
+    _result_cache,
+    fuse_expressions,
+    get_chunk_stamps,
+    get_dirty_slices,
+    get_ne_program,
+    ne_cache_dflts,
+    overlap_dflts,
+    result_cache_dflts,
+    stage_dflts,
+)
 from blosc2.ndarray import get_chunks_idx
 
 NITEMS_SMALL = 1_000
@@ -570,6 +586,295 @@ def test_save():
         blosc2.remove_urlpath(urlpath)
 
 
+def test_save_materialized():
+    shape = (100, 10)
+    na = np.linspace(0, 1, np.prod(shape)).reshape(shape)
+    nb = np.linspace(1, 2, np.prod(shape)).reshape(shape)
+    nc = np.linspace(2, 3, shape[1])
+    a = blosc2.asarray(na, urlpath="a.b2nd", mode="w", chunks=(10, 10), blocks=(5, 10))
+    b = blosc2.asarray(nb, urlpath="b.b2nd", mode="w", chunks=(10, 10), blocks=(5, 10))
+    c = blosc2.asarray(nc, urlpath="c.b2nd", mode="w")
+    expr = a * 2 + b + c
+    expr.save(urlpath="expr.b2nd", materialize=True)
+    with pytest.raises(ValueError):
+        blosc2.lazyexpr("a + 1", {"a": na}).save(urlpath="expr2.b2nd", materialize=True)
+    (a + b).save(urlpath="expr2.b2nd")
+    with pytest.raises(ValueError):
+        blosc2.open("expr2.b2nd").refresh()
+
+    expr = blosc2.open("expr.b2nd")
+    np.testing.assert_allclose(expr.array[:], na * 2 + nb + nc)
+    # Only the chunks depending on changed chunks of the operands are computed again
+    a, b, c = (expr.operands[key] for key in ("o0", "o1", "o2"))
+    a[12:14] = 0
+    na[12:14] = 0
+    old_stamps = expr.array.schunk.vlmeta["_LazyArray"]["materialized"]
+    slices = list(get_dirty_slices(expr.array, expr.operands, old_stamps, get_chunk_stamps(expr.operands)))
+    assert slices == [(slice(10, 20), slice(0, 10))]
+    res = expr.refresh()
+    assert res is expr.array
+    np.testing.assert_allclose(res[:], na * 2 + nb + nc)
+    assert list(get_dirty_slices(res, expr.operands, *[get_chunk_stamps(expr.operands)] * 2)) == []
+
+    # Appended data
+    a.resize((105, 10))
+    b.resize((105, 10))
+    a[100:] = 1
+    b[100:] = 2
+    na = np.concatenate([na, np.ones((5, 10))])
+    nb = np.concatenate([nb, np.full((5, 10), 2)])
+    res = expr.refresh()
+    assert res.shape == expr.shape == (105, 10)
+    np.testing.assert_allclose(res[:], na * 2 + nb + nc)
+    # The changes persist, and broadcast operands are handled too
+    c[3] = 0
+    nc[3] = 0
+    res = blosc2.open("expr.b2nd").refresh()
+    np.testing.assert_allclose(res[:], na * 2 + nb + nc)
+
+    for urlpath in ["a.b2nd", "b.b2nd", "c.b2nd", "expr.b2nd", "expr2.b2nd"]:
+        blosc2.remove_urlpath(urlpath)
+
+
+def test_materialized_stamps(monkeypatch):
+    na = np.arange(1000, dtype=np.float64).reshape(100, 10)
+    a = blosc2.asarray(na, urlpath="a.b2nd", mode="w", chunks=(10, 10))
+    (a + 1).save(urlpath="expr.b2nd", materialize=True)
+    expr = blosc2.open("expr.b2nd")
+    a = expr.operands["o0"]
+    a[25] = 0
+    na[25] = 0
+    # The stamps are written back to vlmeta lazily, in a hidden entry
+    assert a.schunk.vlmeta["_stamps"] == {"dirty": True}
+    assert "_stamps" not in list(a.schunk.vlmeta)
+    assert a.schunk.vlmeta.getall() == {}
+    # Finding out the changed chunks does not read them
+    with monkeypatch.context() as m:
+        for method in ("get_chunk", "decompress_chunk", "get_slice"):
+            m.setattr(blosc2.SChunk, method, lambda *args, **kwargs: pytest.fail("chunk read"))
+        stamps = get_chunk_stamps(expr.operands)
+    old_stamps = expr.array.schunk.vlmeta["_LazyArray"]["materialized"]
+    slices = list(get_dirty_slices(expr.array, expr.operands, old_stamps, stamps))
+    assert slices == [(slice(20, 30), slice(0, 10))]
+    # and flushes them, so that they can be compared in other sessions
+    assert blosc2.open("a.b2nd").schunk._chunk_stamps() == a.schunk._chunk_stamps()
+    np.testing.assert_allclose(expr.refresh()[:], na + 1)
+    # Stamps not flushed are not trusted
+    a[50] = 0
+    na[50] = 0
+    assert not set(blosc2.open("a.b2nd").schunk._chunk_stamps()) & set(a.schunk._chunk_stamps())
+    np.testing.assert_allclose(blosc2.open("expr.b2nd").refresh()[:], na + 1)
+
+    # Read-only operands cannot keep stamps
+    blosc2.asarray(na, urlpath="b.b2nd", mode="w", chunks=(10, 10))
+    b = blosc2.open("b.b2nd", mode="r")
+    with pytest.warns(UserWarning, match="read-only"):
+        (b + 1).save(urlpath="expr2.b2nd", materialize=True)
+    assert "_stamps" not in b.schunk.vlmeta
+
+    for urlpath in ["a.b2nd", "b.b2nd", "expr.b2nd", "expr2.b2nd"]:
+        blosc2.remove_urlpath(urlpath)
+
+
+def test_result_cache(monkeypatch):
+    # The defaults are reachable from the package (blosc2.lazyexpr is a function)
+    assert blosc2.result_cache_dflts is result_cache_dflts
+    monkeypatch.setitem(blosc2.result_cache_dflts, "max_bytes", 3 * 80)
+    cache = _result_cache
+    cache.clear()
+    na = np.arange(100, dtype=np.float64).reshape(10, 10)
+    nb = np.ones((10, 10))
+    a = blosc2.asarray(na, chunks=(5, 10), blocks=(5, 5))
+    b = blosc2.asarray(nb, chunks=(5, 10), blocks=(5, 5))
+    expr = a + b
+    calls = []
+    eval_expr = blosc2.LazyExpr._eval_expr
+    monkeypatch.setattr(
+        blosc2.LazyExpr,
+        "_eval_expr",
+        lambda self, item, kwargs: calls.append(item) or eval_expr(self, item, kwargs),
+    )
+
+    res = expr[2]
+    np.testing.assert_allclose(res, na[2] + nb[2])
+    # Cached results are not shared with the caller
+    res[:] = 0
+    np.testing.assert_allclose(expr[2], na[2] + nb[2])
+    assert expr.sum() == (na + nb).sum()
+    assert expr.sum() == (na + nb).sum()
+    assert len(calls) == 2
+    # Masks are not cached
+    expr[a > 50]
+    expr[a > 50]
+    assert len(calls) == 4
+
+    # Writes to the operands invalidate the results
+    a[2, 0] = -1
+    na[2, 0] = -1
+    np.testing.assert_allclose(expr[2], na[2] + nb[2])
+    assert len(calls) == 5
+    b.schunk.update_data(0, np.zeros((5, 10)), copy=True)
+    nb[:5] = 0
+    np.testing.assert_allclose(expr[2], na[2] + nb[2])
+    assert len(calls) == 6
+    # Writes by block evaluation (which compresses the chunks by itself) too
+    blosc2.lazyexpr("b * 3", {"b": b}, out=a).compute(block_eval=True)
+    na = nb * 3
+    np.testing.assert_allclose(expr[2], na[2] + nb[2])
+    assert len(calls) == 8
+    a.resize((12, 10))
+    b.resize((12, 10))
+    a[10:] = 0
+    b[10:] = 0
+    na = np.concatenate([na, np.zeros((2, 10))])
+    nb = np.concatenate([nb, np.zeros((2, 10))])
+    assert expr.sum() == (na + nb).sum()
+    assert len(calls) == 9
+
+    # The least recently used results are evicted when going over budget
+    cache.clear()
+    for i in range(4):
+        expr[i]
+    assert len(cache.entries) == 3
+    assert cache.nbytes == 3 * 80
+    expr[0]
+    assert len(calls) == 14
+    expr[3]
+    assert len(calls) == 14
+    # Results larger than the budget are not kept
+    expr[:]
+    assert cache.nbytes == 3 * 80
+    cache.clear()
+
+
+@pytest.mark.parametrize("getitem", [True, False])
+def test_zonemap_where(monkeypatch, getitem):
+    shape = (100, 20)
+    na = np.arange(np.prod(shape), dtype=np.float64).reshape(shape)
+    na[40:50] = np.nan
+    nb = np.linspace(-1, 1, np.prod(shape)).reshape(shape)
+    a = blosc2.asarray(na, chunks=(10, 20), blocks=(5, 20))
+    b = blosc2.asarray(nb, chunks=(10, 20), blocks=(5, 20))
+    a.create_zonemap()
+    b.create_zonemap()
+    calls = []
+    ne_evaluate = sys.modules["blosc2.lazyexpr"].ne_evaluate
+    monkeypatch.setattr(
+        sys.modules["blosc2.lazyexpr"],
+        "ne_evaluate",
+        lambda *args, **kwargs: calls.append(args[0]) or ne_evaluate(*args, **kwargs),
+    )
+
+    def check(expr, nexpr, nchunks):
+        calls.clear()
+        res = expr[:] if getitem else expr.compute()
+        np.testing.assert_array_equal(res[:], na[nexpr])
+        assert len(calls) == nchunks
+
+    with np.errstate(invalid="ignore"):
+        # Only the chunks that may satisfy the condition are evaluated
+        check(a[a >= 1900], na >= 1900, 1)
+        check(a[(1900 <= a) & (b > 0)], (na >= 1900) & (nb > 0), 1)  # noqa: SIM300
+        check(a[(a < 20) | (a > 1990)], (na < 20) | (na > 1990), 2)
+        check(a[a == 850], na == 850, 0)
+        check(a[a > 1e6], na > 1e6, 0)
+        check(b[b < -2], nb < -2, 0)
+        # NaNs only satisfy !=
+        check(a[a != 0], na != 0, 10)
+        check(a[a < 900], na < 900, 4)
+        # Other conditions are always evaluated
+        check(a[a * 2 > 3998], na * 2 > 3998, 10)
+        check(a[~(a < 1900)], ~(na < 1900), 10)
+
+        # The zone maps follow the changes in the data
+        a[5, 5] = 1e7
+        na[5, 5] = 1e7
+        check(a[a > 1e6], na > 1e6, 1)
+        a.resize((110, 20))
+        a[100:] = -1
+        b.resize((110, 20))
+        b[100:] = 0
+        na = np.concatenate([na, np.full((10, 20), -1)])
+        nb = np.concatenate([nb, np.zeros((10, 20))])
+        check(a[a < 0], na < 0, 1)
+
+
+def test_zonemap_where_chunks(monkeypatch):
+    # Items grow along the columns, so only some chunks in every slab of rows can match
+    na = np.arange(30 * 40, dtype=np.float64).reshape(30, 40).T
+    a = blosc2.asarray(na, chunks=(10, 10), blocks=(5, 5))
+    a.create_zonemap()
+    calls = []
+    ne_evaluate = sys.modules["blosc2.lazyexpr"].ne_evaluate
+    monkeypatch.setattr(
+        sys.modules["blosc2.lazyexpr"],
+        "ne_evaluate",
+        lambda *args, **kwargs: calls.append(args[0]) or ne_evaluate(*args, **kwargs),
+    )
+
+    expr = a[(a < 40) | (a >= 1160)]
+    nres = na[(na < 40) | (na >= 1160)]
+    # The selected items in the chunks of a slab are put back in C order
+    np.testing.assert_array_equal(expr[:], nres)
+    assert len(calls) == 8
+    np.testing.assert_array_equal(expr.compute()[:], nres)
+    assert len(calls) == 16
+
+
+def test_zonemap_writers():
+    na = np.arange(10_000, dtype=np.float64)
+    a = blosc2.asarray(na, chunks=(5_000,))
+    d = blosc2.zeros(a.shape, dtype=a.dtype, chunks=a.chunks)
+    d.create_zonemap()
+    # Block evaluation compresses the chunks by itself
+    blosc2.lazyexpr("a + 5", {"a": a}, out=d).compute(block_eval=True)
+    np.testing.assert_array_equal(d[d > 100][:], (na + 5)[na + 5 > 100])
+    # A copy with other chunks gets its own zone map
+    c = d.copy(chunks=(2_000,), blocks=(500,))
+    assert c.schunk.zonemap["dtype"] == "<f8"
+    assert len(c.schunk.zonemap["stats"]) == 5
+    np.testing.assert_array_equal(c[c < 1000][:], (na + 5)[na + 5 < 1000])
+
+
+@pytest.mark.parametrize("zonemap", [True, False])
+def test_indices(zonemap):
+    shape = (40, 25)
+    na = np.arange(np.prod(shape)).reshape(shape)
+    nb = np.sin(na)
+    a = blosc2.asarray(na, chunks=(10, 10), blocks=(5, 5))
+    # Operands with other chunks and broadcasting
+    b = blosc2.asarray(nb, chunks=(7, 25))
+    c = blosc2.asarray(nb[0], chunks=(10,))
+    if zonemap:
+        a.create_zonemap()
+    expr = (a > 100) & (a < 700) & (b > c)
+    nexpr = (na > 100) & (na < 700) & (nb > nb[0])
+    np.testing.assert_array_equal(expr.indices(), np.flatnonzero(nexpr))
+    nonzero = expr.nonzero()
+    assert len(nonzero) == 2
+    for coords, ncoords in zip(nonzero, np.nonzero(nexpr), strict=True):
+        np.testing.assert_array_equal(coords, ncoords)
+    # The coordinates can index other arrays
+    np.testing.assert_array_equal(b[nonzero], nb[nexpr])
+    np.testing.assert_array_equal(b[expr][:], nb[nexpr])
+    assert len((a > 1e6).indices()) == 0
+    res = expr.indices(urlpath="a.b2nd", mode="w", cparams={"clevel": 9})
+    assert isinstance(res, blosc2.NDArray)
+    assert res.dtype == np.int64
+    np.testing.assert_array_equal(blosc2.open("a.b2nd")[:], np.flatnonzero(nexpr))
+    blosc2.remove_urlpath("a.b2nd")
+    # The positions are streamed into the output, with chunks smaller than the slabs
+    res = expr.indices(chunks=(16,), blocks=(4,))
+    assert res.shape == (np.count_nonzero(nexpr),)
+    np.testing.assert_array_equal(res[:], np.flatnonzero(nexpr))
+    assert (a > 1e6).indices(chunks=(16,)).shape == (0,)
+
+    with pytest.raises(ValueError):
+        (a + 1).indices()
+    with pytest.raises(ValueError):
+        (a + 1).nonzero()
+
+
 def test_save_unsafe():
     na = np.arange(1000)
     nb = np.arange(1000)
@@ -774,6 +1079,198 @@ def test_broadcasting(broadcast_fixture):
     np.testing.assert_allclose(res, nres)
 
 
+@pytest.mark.parametrize("disk", [True, False])
+@pytest.mark.parametrize("nworkers", [1, 2])
+def test_broadcasting_fast_path(disk, nworkers):
+    shape = (60, 40)
+    na = np.linspace(0, 1, np.prod(shape)).reshape(shape)
+    nrow = np.arange(1, shape[1] + 1, dtype=np.float64)
+    ncol = np.arange(shape[0], dtype=np.float64).reshape(shape[0], 1)
+    urlpath = "a.b2nd" if disk else None
+    a = blosc2.asarray(na, chunks=(15, 40), blocks=(5, 40), urlpath=urlpath, mode="w")
+    row = blosc2.asarray(nrow, chunks=(10,))
+    scalar = blosc2.asarray(np.float64(3))
+    operands = {"a": a, "row": row, "col": ncol, "scalar": scalar}
+    expr = blosc2.lazyexpr("a / row + col * scalar", operands)
+    # The partitions of the result are the ones of the (only) operand with its shape
+    assert expr.shape == shape
+    assert expr.chunks == a.chunks
+    assert expr.blocks == a.blocks
+    nres = na / nrow + ncol * 3
+    res = expr.compute(nworkers=nworkers)
+    assert res.chunks == a.chunks
+    np.testing.assert_allclose(res[:], nres)
+    np.testing.assert_allclose(expr[:], nres)
+    np.testing.assert_allclose(expr[5:50:2, 3:30], nres[5:50:2, 3:30])
+    blosc2.remove_urlpath(urlpath)
+
+
+@pytest.mark.parametrize("nworkers", [1, 3])
+def test_broadcasting_cache(monkeypatch, nworkers):
+    # The parts of the smaller operands are kept within a budget
+    monkeypatch.setitem(blosc2.bcast_dflts, "max_bytes", 2 * 10 * 20 * 8)
+    nbytes = []
+    put = sys.modules["blosc2.lazyexpr"].BroadcastCache.put
+    monkeypatch.setattr(
+        sys.modules["blosc2.lazyexpr"].BroadcastCache,
+        "put",
+        lambda self, key, part: put(self, key, part) or nbytes.append(self.nbytes),
+    )
+    na = np.linspace(0, 1, 8 * 40 * 20).reshape(8, 40, 20)
+    nb = np.arange(40 * 20, dtype=np.float64).reshape(1, 40, 20)
+    a = blosc2.asarray(na, chunks=(2, 10, 20))
+    b = blosc2.asarray(nb, chunks=(1, 10, 20))
+    expr = blosc2.lazyexpr("a + b", {"a": a, "b": b})
+    np.testing.assert_allclose(expr.compute(nworkers=nworkers)[:], na + nb)
+    assert 0 < max(nbytes) <= 2 * 10 * 20 * 8
+
+
+@pytest.mark.parametrize("disk", [True, False])
+@pytest.mark.parametrize("nthreads", [1, 4])
+def test_block_eval(disk, nthreads):
+    shape = (60, 50)
+    na = np.linspace(0, 1, np.prod(shape)).reshape(shape)
+    nb = np.linspace(1, 2, np.prod(shape), dtype=np.float32).reshape(shape)
+    # Use blocks with padding
+    urlpath = "a.b2nd" if disk else None
+    a = blosc2.asarray(na, chunks=(25, 30), blocks=(10, 20), urlpath=urlpath, mode="w")
+    b = blosc2.asarray(nb, chunks=(25, 30), blocks=(10, 20))
+    expr = blosc2.lazyexpr("sin(a) + b * 2", {"a": a, "b": b})
+    nres = np.sin(na) + nb * 2
+    res = expr.compute(block_eval=True, cparams={"nthreads": nthreads})
+    assert res.dtype == nres.dtype
+    assert res.chunks == a.chunks
+    assert res.blocks == a.blocks
+    assert res.schunk.cparams.nthreads == nthreads
+    np.testing.assert_allclose(res[:], nres, rtol=1e-6)
+
+    # With a user-provided output
+    out = blosc2.empty(shape, np.float64, chunks=(25, 30), blocks=(10, 20))
+    expr = blosc2.lazyexpr("a * b", {"a": a, "b": b}, out=out)
+    res = expr.compute(block_eval=True)
+    assert res is out
+    np.testing.assert_allclose(out[:], na * nb, rtol=1e-6)
+
+    # Operands with different partitions are evaluated by chunks
+    c = blosc2.asarray(nb, chunks=(20, 30), blocks=(10, 20))
+    expr = blosc2.lazyexpr("a - c", {"a": a, "c": c})
+    np.testing.assert_allclose(expr.compute(block_eval=True)[:], na - nb, rtol=1e-6)
+    blosc2.remove_urlpath(urlpath)
+
+
+@pytest.mark.parametrize("max_bytes", [None, 0])
+@pytest.mark.parametrize(
+    "item",
+    [
+        (),
+        (slice(3, 55), slice(7, 39)),
+        (slice(None), 17),
+    ],
+)
+def test_different_chunks(max_bytes, item, monkeypatch):
+    if max_bytes is not None:
+        # Force the eviction of every chunk in the working set of the operands
+        monkeypatch.setitem(overlap_dflts, "max_bytes", max_bytes)
+    shape = (60, 40)
+    na = np.linspace(0, 1, np.prod(shape)).reshape(shape)
+    nb = np.linspace(1, 2, np.prod(shape)).reshape(shape)
+    a = blosc2.asarray(na, chunks=(10, 40), blocks=(5, 40))
+    b = blosc2.asarray(nb, chunks=(60, 7), blocks=(20, 7))
+    c = blosc2.asarray(na, chunks=(25, 15), blocks=(5, 5))
+    expr = blosc2.lazyexpr("a + b * c", {"a": a, "b": b, "c": c})
+    nres = na + nb * na
+    res = expr.compute(chunks=(10, 40))
+    np.testing.assert_allclose(res[:], nres)
+    np.testing.assert_allclose(expr[item], nres[item])
+
+    # UDFs are evaluated using the chunks of the first operand
+    def udf(inputs, output, offset):
+        x, y, z = inputs
+        output[:] = x + y * z
+
+    expr = blosc2.lazyudf(udf, (a, b, c), np.float64)
+    np.testing.assert_allclose(expr[item], nres[item])
+
+
+@pytest.mark.parametrize("maxsize", [1, 256])
+def test_ne_program_cache(maxsize, monkeypatch):
+    monkeypatch.setitem(ne_cache_dflts, "maxsize", maxsize)
+    na = np.arange(1000, dtype=np.int32)
+    nb = np.linspace(0, 1, 1000)
+    program = get_ne_program("o0 + o1", {"o0": na, "o1": nb})
+    # Programs are reused for operands with the same dtypes
+    assert get_ne_program("o0 + o1", {"o0": na[:10], "o1": nb[:10]}) is program
+    assert get_ne_program("o0 + o1", {"o0": nb, "o1": na}) is not program
+
+    a = blosc2.asarray(na, chunks=(100,), blocks=(10,))
+    b = blosc2.asarray(nb, chunks=(100,), blocks=(10,))
+    for expr, nres in [
+        (a + b, na + nb),
+        (a * 2, na * 2),
+        ((a + b > 100).where(a, b), np.where(na + nb > 100, na, nb)),
+        (blosc2.lazyexpr("sin(b) - a"), np.sin(nb) - na),
+    ]:
+        np.testing.assert_allclose(expr[:], nres)
+        np.testing.assert_allclose(expr.compute()[:], nres)
+    np.testing.assert_allclose((a + b).sum(), (na + nb).sum())
+    np.testing.assert_allclose((a > 500).where(a, b).sum(), np.where(na > 500, na, nb).sum())
+
+
+def test_ne_program_fallback(monkeypatch):
+    # Without the numexpr internals needed for reusing programs, numexpr.evaluate is used
+    lazyexpr_module = sys.modules["blosc2.lazyexpr"]
+    assert lazyexpr_module._ne_programs
+    monkeypatch.setattr(lazyexpr_module, "_ne_programs", False)
+    monkeypatch.setattr(lazyexpr_module, "get_ne_program", None)
+    monkeypatch.setitem(stage_dflts, "max_inline", 8)
+    na = np.arange(1000, dtype=np.int32)
+    nb = np.linspace(0, 1, 1000)
+    a = blosc2.asarray(na, chunks=(100,), blocks=(10,))
+    b = blosc2.asarray(nb, chunks=(100,), blocks=(10,))
+    expr = (a + b) * (a + b) + blosc2.sin(a + b)
+    nres = (na + nb) * (na + nb) + np.sin(na + nb)
+    np.testing.assert_allclose(expr[:], nres)
+    np.testing.assert_allclose(expr.compute()[:], nres)
+    np.testing.assert_allclose(expr.sum(), nres.sum())
+
+
+def test_expr_dag():
+    dag = ExprDAG("(a + b) * (a + b) + sin(a + b) - 2 * 3 + where(a > 0, a, -1.5)")
+    # Common subexpressions are stored just once, and constants are folded
+    assert sum(node[0] == "name" for node in dag.nodes) == 2
+    assert dag.emit() == ([], "(((((a + b) * (a + b)) + sin((a + b))) - 6) + where((a > 0), a, (-1.5)))")
+    stages, expr = dag.emit(max_inline=4)
+    assert stages == [("_t0", "(a + b)")]
+    assert expr == "((((_t0 * _t0) + sin(_t0)) - 6) + where((a > 0), a, (-1.5)))"
+    # Operands are renamed, and the result can be used as an operand
+    assert fuse_expressions("x - y * 2", {"x": "o1", "y": "o0"}) == "(o1 - (o0 * 2))"
+
+
+@pytest.mark.parametrize("max_inline", [8, 1024])
+def test_composed_exprs(max_inline, monkeypatch):
+    # Force the evaluation of shared subexpressions in stages
+    monkeypatch.setitem(stage_dflts, "max_inline", max_inline)
+    na = np.linspace(0, 1, 1000)
+    nb = np.linspace(1, 2, 1000)
+    a = blosc2.asarray(na, chunks=(100,), blocks=(10,))
+    b = blosc2.asarray(nb, chunks=(100,), blocks=(10,))
+    expr, nres = a + b, na + nb
+    for _ in range(4):
+        expr, nres = expr * expr + blosc2.sin(expr), nres * nres + np.sin(nres)
+    assert expr.operands == {"o0": a, "o1": b}
+    np.testing.assert_allclose(expr[:], nres)
+    np.testing.assert_allclose(expr.compute()[:], nres)
+    np.testing.assert_allclose(expr.sum(), nres.sum())
+
+    # Operands with any names (and precedences) are fused
+    expr2 = blosc2.lazyexpr("y - x", {"x": b, "y": a})
+    np.testing.assert_allclose((a - expr2)[:], na - (na - nb))
+    np.testing.assert_allclose(((a + b) / expr2)[:], (na + nb) / (na - nb))
+    expr3 = blosc2.lazyexpr("o1 * 2", {"o1": b}) + (a + b)
+    assert expr3.operands == {"o1": b, "o2": a}
+    np.testing.assert_allclose(expr3[:], nb * 2 + (na + nb))
+
+
 @pytest.mark.parametrize(
     "operand_mix",
     [
@@ -954,6 +1451,193 @@ def test_fill_disk_operands(chunks, blocks, disk, fill_value):
         blosc2.remove_urlpath("c.b2nd")
 
 
+@pytest.mark.parametrize("nworkers", [1, 2, 5])
+@pytest.mark.parametrize("disk", [True, False])
+def test_compute_nworkers(nworkers, disk):
+    shape = (100, 100)
+    chunks = (15, 100)
+    blocks = (5, 100)
+    na = np.linspace(0, 1, np.prod(shape)).reshape(shape)
+    nb = np.linspace(1, 2, np.prod(shape)).reshape(shape)
+    apath = "a.b2nd" if disk else None
+    bpath = "b.b2nd" if disk else None
+    a = blosc2.asarray(na, urlpath=apath, mode="w", chunks=chunks, blocks=blocks)
+    b = blosc2.asarray(nb, urlpath=bpath, mode="w", chunks=chunks, blocks=blocks)
+
+    expr = blosc2.sin(a) * b + 1
+    nres = np.sin(na) * nb + 1
+    out = expr.compute(nworkers=nworkers)
+    assert out.chunks == chunks
+    np.testing.assert_allclose(out[:], nres)
+
+    # where() with two operands is supported in the parallel path too
+    expr = (a < 0.5).where(a, b)
+    out = expr.compute(nworkers=nworkers)
+    np.testing.assert_allclose(out[:], np.where(na < 0.5, na, nb))
+
+    if disk:
+        blosc2.remove_urlpath(apath)
+        blosc2.remove_urlpath(bpath)
+
+
+@pytest.mark.parametrize("nworkers", [1, 2])
+@pytest.mark.parametrize("disk", [True, False])
+def test_compute_many(nworkers, disk):
+    shape = (100, 100)
+    chunks = (15, 100)
+    blocks = (5, 100)
+    na = np.linspace(0, 1, np.prod(shape)).reshape(shape)
+    nb = np.linspace(1, 2, np.prod(shape)).reshape(shape)
+    nc = np.linspace(2, 3, shape[1])
+    apath = "a.b2nd" if disk else None
+    bpath = "b.b2nd" if disk else None
+    a = blosc2.asarray(na, urlpath=apath, mode="w", chunks=chunks, blocks=blocks)
+    b = blosc2.asarray(nb, urlpath=bpath, mode="w", chunks=chunks, blocks=blocks)
+    # Operands with other partitions or smaller shapes are supported too
+    c = blosc2.asarray(nc)
+    d = blosc2.asarray(nb, chunks=(20, 20), blocks=(10, 10))
+
+    def udf(inputs, output, offset):
+        output[:] = inputs[0] * 2
+
+    exprs = [
+        a + b,
+        blosc2.sin(a) * c,
+        blosc2.lazyexpr("x - y", {"x": b, "y": a}),
+        a < d,
+        (a < 0.5).where(a, b),
+        blosc2.lazyudf(udf, (a,), np.float64),
+    ]
+    nres = [na + nb, np.sin(na) * nc, nb - na, na < nb, np.where(na < 0.5, na, nb), na * 2]
+    outs = blosc2.compute_many(exprs, nworkers=nworkers, cparams={"clevel": 1})
+    assert len(outs) == len(exprs)
+    for out, res in zip(outs, nres, strict=True):
+        assert isinstance(out, blosc2.NDArray)
+        assert out.dtype == res.dtype
+        assert out.cparams.clevel == 1
+        np.testing.assert_allclose(out[:], res)
+    assert outs[0].chunks == chunks
+
+    with pytest.raises(ValueError):
+        blosc2.compute_many(exprs, urlpath="out.b2nd")
+    with pytest.raises(ValueError, match="dtype"):
+        blosc2.compute_many(exprs, dtype=np.float32)
+
+    if disk:
+        blosc2.remove_urlpath(apath)
+        blosc2.remove_urlpath(bpath)
+
+
+def test_concurrent_disk_evaluations():
+    shape = (200, 100)
+    chunks = (10, 100)
+    na = np.linspace(0, 1, np.prod(shape)).reshape(shape)
+    nb = np.linspace(1, 2, np.prod(shape)).reshape(shape)
+    a = blosc2.asarray(na, urlpath="a.b2nd", mode="w", chunks=chunks)
+    b = blosc2.asarray(nb, urlpath="b.b2nd", mode="w", chunks=chunks)
+    exprs = [(a + b, na + nb), (a * b, na * nb), (a - b, na - nb), (b / a.sum(), nb / na.sum())]
+
+    def evaluate(i):
+        expr, nres = exprs[i % len(exprs)]
+        np.testing.assert_allclose(expr.compute()[:], nres)
+        np.testing.assert_allclose(expr.sum(), nres.sum())
+
+    # Evaluations in different threads must not interfere with each other
+    with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+        for future in [executor.submit(evaluate, i) for i in range(16)]:
+            future.result()
+
+    blosc2.remove_urlpath("a.b2nd")
+    blosc2.remove_urlpath("b.b2nd")
+
+
+@pytest.mark.parametrize(("depth", "max_bytes"), [(1, None), (4, None), (8, 1)])
+def test_chunk_prefetcher(depth, max_bytes):
+    shape = (100, 10)
+    na = np.arange(np.prod(shape)).reshape(shape)
+    a = blosc2.asarray(na, urlpath="a.b2nd", mode="w", chunks=(10, 10))
+    chunks_idx, nchunks = get_chunks_idx(a.shape, a.chunks)
+    info = (False, True, False, chunks_idx)
+    prefetcher = ChunkPrefetcher([a, a], info, depth=depth, max_bytes=max_bytes)
+    if max_bytes is not None:
+        # At least one chunk is always prefetched
+        assert prefetcher.depth == 1
+    for i, (nchunk, chunks) in enumerate(prefetcher):
+        assert nchunk == i
+        np.testing.assert_array_equal(chunks[0], na[i * 10 : (i + 1) * 10])
+        np.testing.assert_array_equal(chunks[1], chunks[0])
+    assert i == nchunks - 1
+
+    # Stopping early releases the chunks in flight
+    with ChunkPrefetcher([a], info, depth=depth) as prefetcher:
+        nchunk, _ = next(prefetcher)
+        assert nchunk == 0
+    assert len(prefetcher._pending) == 0
+    with pytest.raises(StopIteration):
+        next(prefetcher)
+
+    blosc2.remove_urlpath("a.b2nd")
+
+
+@pytest.mark.parametrize("disk", [True, False])
+def test_special_chunks(disk):
+    shape, chunks, blocks = (100, 60), (50, 30), (10, 30)
+    urlpath = "a.b2nd" if disk else None
+    # One operand made of VALUE chunks and another with NaN, zero and regular chunks
+    a = blosc2.full(shape, 3.0, chunks=chunks, blocks=blocks, urlpath=urlpath, mode="w")
+    b = blosc2.zeros(shape, dtype=np.float64, chunks=chunks, blocks=blocks)
+    b[50:, 30:] = np.linspace(0, 1, 50 * 30).reshape(50, 30)
+    b.schunk.update_special(0, blosc2.SpecialValue.NAN)
+    b.schunk.update_special(1, blosc2.SpecialValue.VALUE, np.float64(2))
+    na, nb = a[:], b[:]
+    assert np.isnan(nb[:50, :30]).all()
+    assert (nb[:50, 30:] == 2).all()
+
+    expr = a * 2 + b
+    res = expr.compute()
+    np.testing.assert_allclose(res[:], na * 2 + nb)
+    np.testing.assert_allclose(expr[:], na * 2 + nb)
+    # Output chunks coming from special chunks only are special too
+    specials = [info.special for info in res.iterchunks_info()]
+    assert specials[:3] == [blosc2.SpecialValue.NAN, blosc2.SpecialValue.VALUE, blosc2.SpecialValue.VALUE]
+    assert specials[3] == blosc2.SpecialValue.NOT_SPECIAL
+    res = (a - 3).compute()
+    assert all(info.special == blosc2.SpecialValue.ZERO for info in res.iterchunks_info())
+    np.testing.assert_allclose(expr.sum(axis=0), (na * 2 + nb).sum(axis=0))
+
+    # udfs still get full chunks
+    def udf(inputs, output, offset):
+        output[:] = inputs[0][::-1] + inputs[1]
+
+    expr = blosc2.lazyudf(udf, (a, b), a.dtype, chunks=chunks, blocks=blocks)
+    np.testing.assert_allclose(expr.compute()[:], na + nb)
+
+    blosc2.remove_urlpath(urlpath)
+
+
+@pytest.mark.parametrize("dtype", [np.float32, np.complex128, np.int16])
+def test_constant_chunks(dtype):
+    shape, chunks, blocks = (100, 60), (50, 30), (10, 30)
+    na = np.ones(shape, dtype=dtype)
+    na[50:] = np.arange(50 * 60).reshape(50, 60)
+    a = blosc2.asarray(na, chunks=chunks, blocks=blocks)
+    # A mask that is constant in all chunks but the third one
+    res = (a == 1).compute()
+    np.testing.assert_array_equal(res[:], na == 1)
+    specials = [info.special for info in res.iterchunks_info()]
+    assert specials == [
+        blosc2.SpecialValue.VALUE,
+        blosc2.SpecialValue.VALUE,
+        blosc2.SpecialValue.NOT_SPECIAL,
+        blosc2.SpecialValue.ZERO,
+    ]
+    # Constant (but non-zero) results are stored as repeated values
+    res = (a * 2).compute()
+    np.testing.assert_array_equal(res[:], na * 2)
+    specials = [info.special for info in res.iterchunks_info()]
+    assert specials == [blosc2.SpecialValue.VALUE] * 2 + [blosc2.SpecialValue.NOT_SPECIAL] * 2
+
+
 @pytest.mark.parametrize(
     ("expression", "expected_operands"),
     [
@@ -360,3 +360,42 @@ def test_offset(shape, chunks, blocks, slices, chunked_eval, eval_mode):
     else:
         res = expr[slices]
     np.testing.assert_allclose(res, out[slices])
+
+
+@pytest.mark.parametrize(
+    "item",
+    [
+        (slice(10, 20), slice(45, 50)),
+        (3, slice(None, None, 7)),
+        (slice(-13, None, 3), 49),
+        (..., 7),
+        (slice(5, 5),),
+        slice(33, 34),
+        7,
+    ],
+)
+def test_getitem_slice_pushdown(item):
+    shape, chunks, blocks = (40, 50), (15, 20), (5, 10)
+    x = np.arange(np.prod(shape), dtype=np.float64).reshape(shape)
+    bx = blosc2.asarray(x, chunks=chunks, blocks=blocks)
+    calls = []
+
+    def udf(inputs_tuple, output, offset):
+        calls.append(offset)
+        udf1p(inputs_tuple, output, offset)
+
+    expr = blosc2.lazyudf(udf, (bx,), bx.dtype, chunks=chunks, blocks=blocks)
+    res = expr[item]
+    np.testing.assert_allclose(res, (x + 1)[item])
+    # Only the chunks intersecting with the slice are evaluated
+    region = np.zeros(shape, dtype=bool)
+    region[item] = True
+    nchunks = sum(
+        region[i : i + chunks[0], j : j + chunks[1]].any()
+        for i in range(0, shape[0], chunks[0])
+        for j in range(0, shape[1], chunks[1])
+    )
+    assert len(calls) == nchunks
+    # The offsets still refer to the whole array
+    for offset in calls:
+        assert all(o % c == 0 for o, c in zip(offset, chunks, strict=True))
@@ -352,3 +352,248 @@ def test_save_version4(disk, fill_value, reduce_op, axis):
         blosc2.remove_urlpath("a1.b2nd")
         blosc2.remove_urlpath("b.b2nd")
         blosc2.remove_urlpath("out.b2nd")
+
+
+@pytest.mark.parametrize("reduce_op", ["std", "var"])
+@pytest.mark.parametrize("axis", [0, 1, (0, 1), None])
+@pytest.mark.parametrize("ddof", [0, 1])
+@pytest.mark.parametrize("dtype", [np.float32, np.float64, np.int32, np.complex128])
+def test_std_var_single_pass(reduce_op, axis, ddof, dtype):
+    shape = (60, 70)
+    rng = np.random.default_rng(42)
+    # A large offset makes a naive sum of squares lose all the precision
+    na = (1e6 + rng.standard_normal(shape)).astype(dtype)
+    if dtype == np.complex128:
+        na = na + 1j * rng.standard_normal(shape)
+    a = blosc2.asarray(na, chunks=(25, 30), blocks=(10, 10))
+    res = getattr(a, reduce_op)(axis=axis, ddof=ddof)
+    nres = getattr(na, reduce_op)(axis=axis, ddof=ddof)
+    assert np.asarray(res).dtype == np.asarray(nres).dtype
+    # Partial statistics are accumulated in double precision, so compare with that
+    na = na.astype(np.result_type(na.dtype, np.float64))
+    nres = getattr(na, reduce_op)(axis=axis, ddof=ddof)
+    rtol = 1e-5 if dtype == np.float32 else 1e-8
+    np.testing.assert_allclose(res, nres, rtol=rtol)
+    # The same for an expression, with keepdims
+    res = getattr(a * 2, reduce_op)(axis=axis, ddof=ddof, keepdims=True)
+    nres = getattr(na * 2, reduce_op)(axis=axis, ddof=ddof, keepdims=True)
+    np.testing.assert_allclose(res, nres, rtol=rtol)
+
+
+@pytest.mark.parametrize("axis", [0, 1, None])
+@pytest.mark.parametrize("keepdims", [True, False])
+def test_aggregate(array_fixture, axis, keepdims):
+    a1, a2, a3, _, na1, na2, na3, _ = array_fixture
+    if axis == 1 and na1.ndim < 2:
+        return
+    ops = ["sum", "prod", "mean", "std", "var", "min", "max", "any", "all"]
+    # Operands with different chunks force the slow path
+    expr = a1 + a2 - a3 * 2
+    nres = na1 + na2 - na3 * 2
+    res = expr.aggregate(ops, axis=axis, keepdims=keepdims)
+    assert list(res) == ops
+    tol = 1e-12 if a1.dtype == "float64" else 1e-5
+    for op in ops:
+        np.testing.assert_allclose(
+            res[op], getattr(nres, op)(axis=axis, keepdims=keepdims), rtol=tol, atol=tol
+        )
+    # The same, but using the fast path and the functional interface
+    res = blosc2.aggregate(a1 * 2, ["max", "var", "sum"], axis=axis, keepdims=keepdims, ddof=1)
+    np.testing.assert_allclose(res["max"], (na1 * 2).max(axis=axis, keepdims=keepdims))
+    np.testing.assert_allclose(res["var"], (na1 * 2).var(axis=axis, keepdims=keepdims, ddof=1), rtol=tol)
+    np.testing.assert_allclose(res["sum"], (na1 * 2).sum(axis=axis, keepdims=keepdims), rtol=tol)
+
+
+def test_aggregate_errors():
+    a = blosc2.asarray(np.arange(10))
+    with pytest.raises(ValueError):
+        a.aggregate(["sum", "median"])
+    with pytest.raises(ValueError):
+        a.aggregate([])
+    with pytest.raises(ValueError):
+        blosc2.zeros((0,)).aggregate(["mean"])
+
+
+@pytest.mark.parametrize("axis", [0, None])
+def test_describe(axis):
+    na = np.linspace(-1, 1, 1000).reshape(10, 100)
+    a = blosc2.asarray(na, chunks=(5, 30))
+    res = blosc2.describe(a + 1, axis=axis)
+    assert list(res) == ["count", "mean", "std", "min", "max"]
+    assert res["count"] == (na.size if axis is None else na.shape[axis])
+    for op in ("mean", "std", "min", "max"):
+        np.testing.assert_allclose(res[op], getattr(na + 1, op)(axis=axis))
+    # Storage arguments are honored
+    res = a.describe(axis=0, urlpath=None, cparams={"clevel": 1})
+    assert isinstance(res["mean"], blosc2.NDArray)
+
+
+@pytest.mark.parametrize("reduce_op", ["sum", "prod", "min", "max", "any", "all", "mean", "std"])
+@pytest.mark.parametrize("axis", [0, (0, 1), None])
+@pytest.mark.parametrize("disk", [True, False])
+def test_reduce_nworkers(reduce_op, axis, disk):
+    shape = (100, 90)
+    rng = np.random.default_rng(1)
+    # Values close to 1, so that prod does not overflow
+    na = (1 + rng.standard_normal(shape) / 100).astype(np.float32)
+    urlpath = "a.b2nd" if disk else None
+    a = blosc2.asarray(na, chunks=(20, 30), blocks=(10, 10), urlpath=urlpath, mode="w")
+    expr = a * 0.5 + 0.5
+    nres = getattr(na * 0.5 + 0.5, reduce_op)(axis=axis)
+    res = getattr(expr, reduce_op)(axis=axis)
+    np.testing.assert_allclose(res, nres, rtol=1e-5)
+    for nworkers in (2, 3, 8):
+        # Partials are combined in the same order, so results are bit-for-bit identical
+        res2 = getattr(expr, reduce_op)(axis=axis, nworkers=nworkers)
+        np.testing.assert_array_equal(res2, res)
+    # Slices and operands with different chunks take the slow path
+    b = blosc2.asarray(na, chunks=(30, 20), blocks=(10, 10))
+    expr = a * b
+    res = getattr(expr, reduce_op)(axis=axis, item=(slice(10, 95), slice(None)))
+    res2 = getattr(expr, reduce_op)(axis=axis, item=(slice(10, 95), slice(None)), nworkers=4)
+    np.testing.assert_array_equal(res2, res)
+    nres = getattr((na * na)[10:95], reduce_op)(axis=axis)
+    np.testing.assert_allclose(res, nres, rtol=1e-5)
+    blosc2.remove_urlpath(urlpath)
+
+
+def topk_ref(x, k, axis, largest):
+    if axis is None:
+        x, axis = x.reshape(-1), 0
+    x = np.moveaxis(x, axis, -1)
+    pos = np.broadcast_to(np.arange(x.shape[-1]), x.shape)
+    # Stable selection (lowest positions first), with NaNs as the largest values
+    order = np.lexsort((-pos, x), axis=-1)[..., ::-1] if largest else np.lexsort((pos, x), axis=-1)
+    order = order[..., :k]
+    return np.moveaxis(np.take_along_axis(x, order, -1), -1, axis), np.moveaxis(order, -1, axis)
+
+
+@pytest.mark.parametrize(
+    ("shape", "chunks", "blocks"),
+    [
+        ((1000,), (100,), (10,)),
+        ((37, 53), (10, 20), (5, 5)),
+        ((20, 30, 8), (7, 11, 8), (7, 11, 8)),
+    ],
+)
+@pytest.mark.parametrize("dtype", [np.float64, np.int32, np.bool_])
+@pytest.mark.parametrize("nworkers", [1, 3])
+def test_positional(shape, chunks, blocks, dtype, nworkers):
+    rng = np.random.default_rng(1)
+    # Plenty of ties, and some NaNs
+    na = rng.integers(0, 50, size=shape).astype(dtype)
+    if dtype == np.float64:
+        na.ravel()[rng.integers(0, na.size, 5)] = np.nan
+    a = blosc2.asarray(na, chunks=chunks, blocks=blocks)
+    for axis in [None, *range(len(shape)), -1]:
+        for func in ("argmax", "argmin"):
+            for keepdims in (False, True):
+                res = getattr(a, func)(axis=axis, keepdims=keepdims, nworkers=nworkers)
+                nres = getattr(np, func)(na, axis=axis, keepdims=keepdims)
+                np.testing.assert_array_equal(res, nres)
+                assert np.shape(res) == np.shape(nres)
+        for k in (1, 3, 100):
+            for largest in (True, False):
+                values, indices = blosc2.topk(a, k, axis=axis, largest=largest, nworkers=nworkers)
+                nvalues, nindices = topk_ref(na, k, axis, largest)
+                np.testing.assert_array_equal(values, nvalues)
+                np.testing.assert_array_equal(indices, nindices)
+
+
+def test_positional_expr():
+    rng = np.random.default_rng(2)
+    na = rng.normal(size=(50, 60))
+    nb = rng.normal(size=(50, 60))
+    a = blosc2.asarray(na, chunks=(10, 13), blocks=(5, 13))
+    b = blosc2.asarray(nb, chunks=(20, 20), blocks=(5, 5))
+    assert (a + b).argmax() == np.argmax(na + nb)
+    # As in NumPy, full reductions give scalars
+    assert isinstance((a + b).argmax(), np.integer)
+    assert isinstance(blosc2.asarray(na[0]).argmin(axis=0), np.integer)
+    np.testing.assert_array_equal(blosc2.argmin(a * b, axis=0), np.argmin(na * nb, axis=0))
+    # Positions are relative to the item
+    item = (slice(5, 30), slice(7, 40))
+    assert (a + b).argmax(item=item) == np.argmax((na + nb)[item])
+    np.testing.assert_array_equal(
+        (a + b).topk(4, axis=1, item=item)[1], topk_ref((na + nb)[item], 4, 1, True)[1]
+    )
+    res = a.argmax(axis=0, cparams={"clevel": 1})
+    assert isinstance(res, blosc2.NDArray)
+    np.testing.assert_array_equal(res[:], np.argmax(na, axis=0))
+    values, indices = a.topk(3, cparams={"clevel": 1})
+    assert isinstance(values, blosc2.NDArray)
+    assert isinstance(indices, blosc2.NDArray)
+
+    with pytest.raises(ValueError):
+        a.argmax(axis=(0, 1))
+    with pytest.raises(ValueError):
+        a.topk(0)
+    with pytest.raises(np.exceptions.AxisError):
+        a.argmin(axis=2)
+    with pytest.raises(ValueError):
+        blosc2.zeros((0, 3)).argmax()
+    values, indices = blosc2.zeros((0, 3)).topk(2)
+    assert values.shape == indices.shape == (0,)
+
+
+@pytest.mark.parametrize(
+    ("shape", "chunks", "blocks"),
+    [
+        ((1000,), (100,), (10,)),
+        ((37, 53), (10, 20), (5, 5)),
+        ((20, 30, 8), (7, 11, 8), (7, 11, 4)),
+    ],
+)
+@pytest.mark.parametrize("dtype", [np.float32, np.int64])
+@pytest.mark.parametrize("nworkers", [1, 3])
+def test_histogram(shape, chunks, blocks, dtype, nworkers):
+    rng = np.random.default_rng(3)
+    na = (rng.integers(0, 20, size=shape) * 1.37).astype(dtype)
+    a = blosc2.asarray(na, chunks=chunks, blocks=blocks)
+    for bins, range_ in [(10, None), (7, (2, 15)), ([0, 1, 5, 30], None), (3, (5, 5))]:
+        for density in (False, True):
+            hist, bin_edges = blosc2.histogram(a, bins, range_, density=density, nworkers=nworkers)
+            nhist, nbin_edges = np.histogram(na, bins, range_, density=density)
+            np.testing.assert_allclose(hist, nhist)
+            assert hist.dtype == nhist.dtype
+            np.testing.assert_array_equal(bin_edges, nbin_edges)
+            assert bin_edges.dtype == nbin_edges.dtype
+    if dtype == np.int64:
+        for minlength in (0, 30):
+            res = a.bincount(minlength=minlength, nworkers=nworkers)
+            np.testing.assert_array_equal(res, np.bincount(na.ravel(), minlength=minlength))
+
+
+def test_histogram_special():
+    # Zeroed chunks are counted without being decompressed
+    a = blosc2.zeros((1000, 100), dtype=np.int64, chunks=(100, 100))
+    a[500:510] = 7
+    na = a[:]
+    np.testing.assert_array_equal(a.bincount(), np.bincount(na.ravel()))
+    hist, bin_edges = blosc2.histogram(a + 1, 3)
+    np.testing.assert_array_equal(hist, np.histogram(na + 1, 3)[0])
+    np.testing.assert_array_equal(bin_edges, np.histogram(na + 1, 3)[1])
+
+    hist, bin_edges = blosc2.histogram(blosc2.zeros(0), 3)
+    np.testing.assert_array_equal(hist, np.histogram(np.zeros(0), 3)[0])
+    np.testing.assert_array_equal(bin_edges, np.histogram(np.zeros(0), 3)[1])
+    np.testing.assert_array_equal(blosc2.bincount(blosc2.zeros(0, dtype=np.int64)), [])
+
+
+def test_histogram_expr():
+    rng = np.random.default_rng(4)
+    na = rng.normal(size=(200, 300))
+    a = blosc2.asarray(na)
+    np.testing.assert_array_equal(blosc2.histogram(a * 2 + 1, 20)[0], np.histogram(na * 2 + 1, 20)[0])
+    item = (slice(10, 50), slice(3, 200))
+    np.testing.assert_array_equal(a.histogram(20, item=item)[0], np.histogram(na[item], 20)[0])
+    hist, _ = a.histogram(5, cparams={"clevel": 1})
+    assert isinstance(hist, blosc2.NDArray)
+    np.testing.assert_array_equal(hist[:], np.histogram(na, 5)[0])
+
+    with pytest.raises(TypeError):
+        a.histogram("auto")
+    with pytest.raises(ValueError):
+        blosc2.asarray(np.array([1.0, np.nan])).histogram()
+    with pytest.raises(ValueError):
+        blosc2.asarray(np.array([-1, 2])).bincount()
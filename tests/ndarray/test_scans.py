@@ -0,0 +1,82 @@
+#######################################################################
+# Copyright (c) 2019-present, Blosc Development Team <blosc@blosc.org>
+# All rights reserved.
+#
+# This source code is licensed under a BSD-style license (found in the
+# LICENSE file in the root directory of this source tree)
+#######################################################################
+
+import numpy as np
+import pytest
+
+import blosc2
+
+SCANS = {
+    "cumsum": np.cumsum,
+    "cumprod": np.cumprod,
+    "cummax": np.maximum.accumulate,
+    "cummin": np.minimum.accumulate,
+}
+
+
+@pytest.mark.parametrize(
+    ("shape", "chunks", "blocks"),
+    [
+        ((1000,), (100,), (10,)),
+        ((37, 53), (10, 20), (5, 5)),
+        ((20, 30, 8), (7, 11, 8), (7, 11, 4)),
+        ((0, 3), (2, 3), (1, 3)),
+    ],
+)
+@pytest.mark.parametrize("dtype", [np.float64, np.int32, np.uint8, np.bool_])
+@pytest.mark.parametrize("op", SCANS.keys())
+def test_scans(shape, chunks, blocks, dtype, op):
+    rng = np.random.default_rng(0)
+    na = rng.integers(0, 3, size=shape).astype(dtype)
+    if dtype == np.float64 and na.size > 0:
+        na.ravel()[rng.integers(0, na.size, 3)] = np.nan
+    a = blosc2.asarray(na, chunks=chunks, blocks=blocks)
+    for axis in [None, *range(len(shape)), -1]:
+        res = getattr(a, op)(axis=axis)
+        nres = SCANS[op](na.ravel(), axis=0) if axis is None else SCANS[op](na, axis=axis)
+        assert isinstance(res, blosc2.NDArray)
+        assert res.dtype == nres.dtype
+        assert res.shape == nres.shape
+        np.testing.assert_array_equal(res[:], nres)
+
+
+def test_scans_expr():
+    rng = np.random.default_rng(1)
+    na = rng.normal(size=(50, 60))
+    nb = rng.normal(size=(50, 60))
+    a = blosc2.asarray(na, chunks=(10, 13), blocks=(5, 13))
+    b = blosc2.asarray(nb, chunks=(20, 20), blocks=(5, 5))
+    np.testing.assert_allclose(blosc2.cumsum(a + b, axis=1)[:], np.cumsum(na + nb, axis=1))
+    np.testing.assert_allclose((a * b).cumsum()[:], np.cumsum(na * nb))
+    np.testing.assert_array_equal(blosc2.cummax(a - b, axis=0)[:], np.maximum.accumulate(na - nb, axis=0))
+    # Broadcasting operands
+    nc = rng.normal(size=60)
+    c = blosc2.asarray(nc)
+    np.testing.assert_allclose((a + c).cumsum(axis=0)[:], np.cumsum(na + nc, axis=0))
+
+    res = a.cumsum(axis=0, dtype=np.float32, chunks=(25, 30))
+    assert res.dtype == np.float32
+    assert res.chunks == (25, 30)
+    np.testing.assert_allclose(res[:], np.cumsum(na, axis=0, dtype=np.float32), atol=1e-4)
+    # The flattened result only writes whole chunks, whatever their size
+    res = a.cumsum(chunks=(7,))
+    np.testing.assert_allclose(res[:], np.cumsum(na))
+
+    with pytest.raises(ValueError):
+        a.cumsum(axis=(0, 1))
+    with pytest.raises(np.exceptions.AxisError):
+        a.cummin(axis=2)
+
+
+def test_scans_urlpath():
+    urlpath = "scan.b2nd"
+    a = blosc2.asarray(np.arange(100, dtype=np.int64).reshape(10, 10), chunks=(3, 4))
+    res = a.cumsum(axis=1, urlpath=urlpath, mode="w")
+    np.testing.assert_array_equal(blosc2.open(urlpath)[:], np.cumsum(a[:], axis=1))
+    assert res.urlpath == urlpath
+    blosc2.remove_urlpath(urlpath)
@@ -54,3 +54,24 @@ def test_slice_chunks_blocks(shape, chunks, blocks, chunks2, blocks2, slices, dt
     b = a.slice(slices, chunks=chunks2, blocks=blocks2)
     np_slice = a[slices]
     np.testing.assert_almost_equal(b[...], np_slice)
+
+
+@pytest.mark.parametrize(
+    ("shape", "chunks", "blocks", "slices", "chunks2"),
+    [
+        ([1000], [100], [10], slice(3, None, 7), None),
+        ([1000], [128], [32], slice(-5, 10, -33), [4]),
+        ([77, 134, 13], [31, 13, 5], [7, 8, 3], (slice(None, None, 9), slice(3, 120, 2), 7), [3, 10]),
+        ([77, 134, 13], [31, 13, 5], [7, 8, 3], (slice(70, 2, -8), 5, slice(None, None, -2)), None),
+        ([40, 50], [16, 20], [4, 5], (slice(50, 60, 3), slice(None, None, 6)), None),
+    ],
+)
+def test_slice_steps(shape, chunks, blocks, slices, chunks2):
+    nparray = np.arange(np.prod(shape), dtype=np.int32).reshape(shape)
+    a = blosc2.asarray(nparray, chunks=chunks, blocks=blocks)
+    b = a.slice(slices, chunks=chunks2)
+    np_slice = nparray[slices]
+    assert b.shape == np_slice.shape
+    if chunks2 is not None:
+        assert b.chunks == tuple(chunks2)
+    np.testing.assert_array_equal(b[...], np_slice)
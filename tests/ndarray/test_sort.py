@@ -0,0 +1,87 @@
+#######################################################################
+# Copyright (c) 2019-present, Blosc Development Team <blosc@blosc.org>
+# All rights reserved.
+#
+# This source code is licensed under a BSD-style license (found in the
+# LICENSE file in the root directory of this source tree)
+#######################################################################
+
+import numpy as np
+import pytest
+
+import blosc2
+from blosc2.lazyexpr import sort_dflts
+
+
+@pytest.fixture(params=[2**28, 800, 3000])
+def max_bytes(request, monkeypatch):
+    # Small values force the runs to be merged
+    monkeypatch.setitem(sort_dflts, "max_bytes", request.param)
+    return request.param
+
+
+@pytest.mark.parametrize(
+    ("n", "chunks", "blocks"),
+    [
+        (1000, (100,), (10,)),
+        (1037, (64,), (16,)),
+        (5, (2,), (1,)),
+        (0, (10,), (5,)),
+    ],
+)
+@pytest.mark.parametrize("dtype", [np.float64, np.int16, np.uint8])
+@pytest.mark.parametrize("nworkers", [1, 3])
+def test_sort(max_bytes, n, chunks, blocks, dtype, nworkers):
+    rng = np.random.default_rng(0)
+    na = rng.integers(0, 30, n).astype(dtype)
+    if dtype == np.float64 and n > 0:
+        na[rng.integers(0, n, 5)] = np.nan
+    a = blosc2.asarray(na, chunks=chunks, blocks=blocks)
+    res = blosc2.sort(a, nworkers=nworkers)
+    assert res.dtype == na.dtype
+    assert res.chunks == a.chunks
+    np.testing.assert_array_equal(res[:], np.sort(na))
+    res = blosc2.argsort(a, nworkers=nworkers)
+    assert res.dtype == np.int64
+    np.testing.assert_array_equal(res[:], np.argsort(na, kind="stable"))
+
+
+@pytest.mark.parametrize("order", [None, "a", "b", ["b", "a"]])
+def test_sort_structured(max_bytes, order):
+    rng = np.random.default_rng(1)
+    na = np.empty(1037, dtype=[("a", "i4"), ("b", "f4")])
+    na["a"] = rng.integers(0, 5, len(na))
+    na["b"] = rng.integers(0, 4, len(na))
+    a = blosc2.asarray(na, chunks=(64,), blocks=(16,))
+    np.testing.assert_array_equal(blosc2.sort(a, order=order)[:], np.sort(na, order=order))
+    np.testing.assert_array_equal(
+        blosc2.argsort(a, order=order)[:], np.argsort(na, order=order, kind="stable")
+    )
+
+
+def test_sort_expr(max_bytes):
+    rng = np.random.default_rng(2)
+    na = rng.normal(size=10000)
+    nb = rng.normal(size=10000)
+    a = blosc2.asarray(na, chunks=(300,))
+    b = blosc2.asarray(nb, chunks=(128,), blocks=(32,))
+    np.testing.assert_array_equal(blosc2.sort(a + b)[:], np.sort(na + nb))
+    np.testing.assert_array_equal((a * 2 - b).argsort()[:], np.argsort(na * 2 - nb, kind="stable"))
+    res = blosc2.sort(a, chunks=(1000,))
+    assert res.chunks == (1000,)
+    np.testing.assert_array_equal(res[:], np.sort(na))
+
+    with pytest.raises(ValueError):
+        blosc2.sort(blosc2.zeros((3, 3)))
+    with pytest.raises(ValueError):
+        blosc2.sort(a, order="a")
+
+
+def test_sort_urlpath(max_bytes):
+    urlpath = "sorted.b2nd"
+    na = np.random.default_rng(3).normal(size=5000)
+    a = blosc2.asarray(na, chunks=(100,))
+    res = blosc2.argsort(a, urlpath=urlpath, mode="w")
+    assert res.urlpath == urlpath
+    np.testing.assert_array_equal(blosc2.open(urlpath)[:], np.argsort(na, kind="stable"))
+    blosc2.remove_urlpath(urlpath)
@@ -6,6 +6,8 @@
 # LICENSE file in the root directory of this source tree)
 #######################################################################
 
+import ctypes
+
 import numpy as np
 import pytest
 
@@ -87,3 +89,59 @@ def test_postfilters(
         assert np.array_equal(data, res)
 
     blosc2.remove_urlpath(urlpath)
+
+
+def test_native_postfilter():
+    chunk_len = 2_000
+    data = np.arange(chunk_len * 3, dtype=np.float64)
+    schunk = blosc2.SChunk(chunksize=chunk_len * 8, data=data, dparams=blosc2.DParams(nthreads=1))
+
+    def postf(input, output, nitems, offset):
+        input = np.frombuffer((ctypes.c_double * nitems).from_address(input), dtype=np.float64)
+        output = np.frombuffer((ctypes.c_double * nitems).from_address(output), dtype=np.float64)
+        output[:] = -input
+        return 0
+
+    native_postf = ctypes.CFUNCTYPE(
+        ctypes.c_int, ctypes.c_void_p, ctypes.c_void_p, ctypes.c_int64, ctypes.c_int64
+    )(postf)
+    schunk.postfilter(np.float64)(native_postf)
+    res = np.empty_like(data)
+    schunk.get_slice(out=res)
+    np.testing.assert_array_equal(res, -data)
+    func_name = next(name for name, func in blosc2.postfilter_funcs.items() if func is native_postf)
+    schunk.remove_postfilter(func_name)
+    schunk.get_slice(out=res)
+    np.testing.assert_array_equal(res, data)
+
+
+@pytest.mark.parametrize("nthreads", [1, 4])
+def test_native_postfilter_numba(nthreads):
+    numba = pytest.importorskip("numba")
+    chunk_len = 2_000
+    data = np.arange(chunk_len * 3, dtype=np.float64)
+    cparams = blosc2.CParams(typesize=8, blocksize=1_600)
+    # Functions not calling back into Python do not need the GIL, so they can use several threads
+    dparams = blosc2.DParams(nthreads=nthreads)
+    schunk = blosc2.SChunk(chunksize=chunk_len * 8, data=data, cparams=cparams, dparams=dparams)
+
+    @schunk.postfilter(np.float64)
+    @numba.cfunc("int32(CPointer(float64), CPointer(float64), int64, int64)")
+    def postf(input, output, nitems, offset):
+        for i in range(nitems):
+            output[i] = input[i] + offset
+        return 0
+
+    res = np.frombuffer(schunk.get_slice(), dtype=np.float64)
+    # The offset is the one of the block
+    np.testing.assert_array_equal(res, data + data // 200 * 200)
+
+
+def test_native_postfilter_errors():
+    schunk = blosc2.SChunk(chunksize=800, dparams=blosc2.DParams(nthreads=2))
+    native_postf = ctypes.CFUNCTYPE(
+        ctypes.c_int, ctypes.c_void_p, ctypes.c_void_p, ctypes.c_int64, ctypes.c_int64
+    )(lambda input, output, nitems, offset: 0)
+    # ctypes callbacks of Python functions need the GIL, so they need a single thread
+    with pytest.raises(AttributeError):
+        schunk.postfilter(np.float64)(native_postf)
@@ -6,6 +6,7 @@
 # LICENSE file in the root directory of this source tree)
 #######################################################################
 
+import ctypes
 from dataclasses import asdict, replace
 
 import numpy as np
@@ -208,3 +209,77 @@ def test_prefilters(contiguous, urlpath, cparams, dparams, nchunks, func, data_d
         assert np.array_equal(new_data, res)
 
     blosc2.remove_urlpath(urlpath)
+
+
+# The signature of native filters
+NATIVE_FILTER = ctypes.CFUNCTYPE(
+    ctypes.c_int, ctypes.c_void_p, ctypes.c_void_p, ctypes.c_int64, ctypes.c_int64
+)
+
+
+def test_native_prefilter():
+    chunk_len = 2_000
+    nchunks = 5
+    data = np.arange(chunk_len * nchunks, dtype=np.int32)
+    cparams = blosc2.CParams(typesize=4, nthreads=1, blocksize=800)
+    schunk = blosc2.SChunk(chunksize=chunk_len * 4, cparams=cparams)
+
+    def pref(input, output, nitems, offset):
+        input = np.frombuffer((ctypes.c_int32 * nitems).from_address(input), dtype=np.int32)
+        output = np.frombuffer((ctypes.c_float * nitems).from_address(output), dtype=np.float32)
+        output[:] = input + offset
+        return 0
+
+    native_pref = NATIVE_FILTER(pref)
+    assert schunk.prefilter(np.int32, np.float32)(native_pref) is native_pref
+    for i in range(nchunks):
+        schunk.append_data(data[i * chunk_len : (i + 1) * chunk_len])
+    res = np.frombuffer(schunk.get_slice(), dtype=np.float32)
+    # The offset is the one of the block
+    np.testing.assert_array_equal(res, data + data // 200 * 200)
+
+    func_name = next(name for name, func in blosc2.prefilter_funcs.items() if func is native_pref)
+    schunk.remove_prefilter(func_name)
+    schunk[:chunk_len] = data[:chunk_len]
+    np.testing.assert_array_equal(
+        np.frombuffer(schunk.get_slice(0, chunk_len), dtype=np.int32), data[:chunk_len]
+    )
+
+
+@pytest.mark.parametrize("nthreads", [1, 4])
+def test_native_prefilter_numba(nthreads):
+    numba = pytest.importorskip("numba")
+    chunk_len = 2_000
+    data = np.arange(chunk_len * 3, dtype=np.float64)
+    # Functions not calling back into Python do not need the GIL, so they can use several threads
+    cparams = blosc2.CParams(typesize=8, nthreads=nthreads, blocksize=1_600)
+    schunk = blosc2.SChunk(chunksize=chunk_len * 8, cparams=cparams)
+
+    @schunk.prefilter(np.float64)
+    @numba.cfunc("int32(CPointer(float64), CPointer(float64), int64, int64)")
+    def pref(input, output, nitems, offset):
+        for i in range(nitems):
+            output[i] = input[i] * 2
+        return 0
+
+    schunk[: data.size] = data
+    res = np.frombuffer(schunk.get_slice(), dtype=np.float64)
+    np.testing.assert_array_equal(res, data * 2)
+
+
+def test_native_prefilter_errors():
+    schunk = blosc2.SChunk(chunksize=800, cparams=blosc2.CParams(typesize=4, nthreads=2))
+    native_pref = NATIVE_FILTER(lambda input, output, nitems, offset: 0)
+    with pytest.raises(ValueError):
+        schunk.prefilter(np.int32, np.float64)(native_pref)
+    # ctypes callbacks of Python functions need the GIL, so they need a single thread too
+    with pytest.raises(AttributeError):
+        schunk.prefilter(np.int32)(native_pref)
+    with pytest.raises(AttributeError):
+        schunk.prefilter(np.int32)(ctypes.cast(native_pref, NATIVE_FILTER))
+    # Python prefilters still need a single thread
+    with pytest.raises(AttributeError):
+
+        @schunk.prefilter(np.int32)
+        def pref(input, output, offset):
+            output[:] = input
@@ -147,11 +147,14 @@ def test_schunk_fill_special(contiguous, urlpath, cparams, nitems, special_value
 
     chunk_len = 200 * 1000
     schunk = blosc2.SChunk(chunksize=chunk_len * 4, **kwargs)
+    version = schunk._version
     if special_value in [blosc2.SpecialValue.ZERO, blosc2.SpecialValue.NAN, blosc2.SpecialValue.UNINIT]:
         schunk.fill_special(nitems, special_value)
     else:
         schunk.fill_special(nitems, special_value, expected_value)
     assert len(schunk) == nitems
+    # Cached results of expressions on the filled data are outdated
+    assert schunk._version > version
 
     if special_value != blosc2.SpecialValue.UNINIT:
         dtype = np.int32
@@ -109,3 +109,55 @@ def test_update(contiguous, urlpath, nchunks, nupdates, copy, create_chunk, gil)
     for i in range(nchunks):
         schunk.decompress_chunk(i)
     blosc2.remove_urlpath(urlpath)
+
+
+@pytest.mark.parametrize("urlpath", [None, "b2frame"])
+@pytest.mark.parametrize(
+    ("special_value", "value", "expected"),
+    [
+        (blosc2.SpecialValue.ZERO, None, 0),
+        (blosc2.SpecialValue.NAN, None, np.nan),
+        (blosc2.SpecialValue.VALUE, np.float32(3.5), 3.5),
+        (blosc2.SpecialValue.VALUE, 2.5, 2.5),
+        (blosc2.SpecialValue.VALUE, np.float32(1.5).tobytes(), 1.5),
+    ],
+)
+def test_update_special(urlpath, special_value, value, expected):
+    blosc2.remove_urlpath(urlpath)
+    nitems = 1000
+    schunk = blosc2.SChunk(chunksize=nitems * 4, urlpath=urlpath, cparams={"typesize": 4})
+    for i in range(3):
+        schunk.append_data(np.arange(nitems, dtype=np.float32) * i)
+    schunk.update_special(1, special_value, value)
+    assert schunk.nchunks == 3
+    info = list(schunk.iterchunks_info())
+    assert info[1].special == special_value
+    assert info[1].cratio > 10
+    dest = np.frombuffer(schunk.decompress_chunk(1), dtype=np.float32)
+    np.testing.assert_array_equal(dest, np.full(nitems, expected, dtype=np.float32))
+    # The rest of chunks remain unchanged
+    dest = np.frombuffer(schunk.decompress_chunk(2), dtype=np.float32)
+    np.testing.assert_array_equal(dest, np.arange(nitems, dtype=np.float32) * 2)
+
+    with pytest.raises(TypeError):
+        schunk.update_special(0, blosc2.SpecialValue.NOT_SPECIAL)
+    with pytest.raises(ValueError):
+        schunk.update_special(0, blosc2.SpecialValue.VALUE)
+    with pytest.raises(ValueError):
+        schunk.update_special(0, blosc2.SpecialValue.VALUE, np.int16(1))
+    blosc2.remove_urlpath(urlpath)
+
+
+@pytest.mark.parametrize("urlpath", [None, "b2frame"])
+@pytest.mark.parametrize("special_value", [blosc2.SpecialValue.ZERO, blosc2.SpecialValue.VALUE])
+def test_update_special_partial(urlpath, special_value):
+    blosc2.remove_urlpath(urlpath)
+    data = np.arange(250, dtype=np.int32)
+    schunk = blosc2.SChunk(chunksize=400, data=data, urlpath=urlpath, cparams={"typesize": 4})
+    assert schunk.nchunks == 3
+    # The last chunk is partial, and it keeps its size
+    schunk.update_special(2, special_value, np.int32(7))
+    assert schunk.nbytes == data.nbytes
+    data[200:] = 7 if special_value == blosc2.SpecialValue.VALUE else 0
+    np.testing.assert_array_equal(np.frombuffer(schunk[:], dtype=np.int32), data)
+    blosc2.remove_urlpath(urlpath)
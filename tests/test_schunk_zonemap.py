@@ -0,0 +1,118 @@
+#######################################################################
+# Copyright (c) 2019-present, Blosc Development Team <blosc@blosc.org>
+# All rights reserved.
+#
+# This source code is licensed under a BSD-style license (found in the
+# LICENSE file in the root directory of this source tree)
+#######################################################################
+
+import numpy as np
+import pytest
+
+import blosc2
+
+
+def check_stats(schunk, dtype):
+    chunkshape = schunk.chunkshape
+    data = np.frombuffer(schunk[:], dtype=dtype)
+    stats = []
+    for i in range(0, len(data), chunkshape):
+        items = data[i : i + chunkshape]
+        nans = int(np.isnan(items).sum()) if items.dtype.kind == "f" else 0
+        if nans == len(items):
+            stats.append([None, None, nans])
+        else:
+            stats.append([np.nanmin(items).item(), np.nanmax(items).item(), nans])
+    assert schunk.zonemap["stats"] == stats
+
+
+@pytest.mark.parametrize("urlpath", [None, "b2frame"])
+@pytest.mark.parametrize("dtype", [np.int32, np.float64])
+def test_schunk_zonemap(urlpath, dtype):
+    blosc2.remove_urlpath(urlpath)
+    nitems = 1000
+    data = np.arange(4 * nitems, dtype=dtype)
+    schunk = blosc2.SChunk(
+        chunksize=nitems * data.itemsize,
+        data=data,
+        urlpath=urlpath,
+        cparams={"typesize": data.itemsize},
+    )
+    assert schunk.zonemap is None
+    schunk.create_zonemap(dtype)
+    assert schunk.zonemap["dtype"] == np.dtype(dtype).str
+    check_stats(schunk, dtype)
+
+    # The stats are kept up to date on every write
+    schunk.update_data(1, np.full(nitems, -3, dtype=dtype), copy=True)
+    check_stats(schunk, dtype)
+    schunk.append_data(np.full(nitems // 2, 7, dtype=dtype))
+    check_stats(schunk, dtype)
+    schunk.insert_data(0, np.arange(nitems, 2 * nitems, dtype=dtype), copy=True)
+    check_stats(schunk, dtype)
+    schunk.delete_chunk(2)
+    check_stats(schunk, dtype)
+    schunk[1500:1510] = np.full(10, 10_000, dtype=dtype)
+    check_stats(schunk, dtype)
+    schunk.update_special(0, blosc2.SpecialValue.ZERO)
+    check_stats(schunk, dtype)
+    if np.dtype(dtype).kind == "f":
+        schunk.update_data(1, np.full(nitems, np.nan, dtype=dtype), copy=True)
+        schunk[2000:2010] = np.full(10, np.nan, dtype=dtype)
+        check_stats(schunk, dtype)
+
+    # The zone map persists along with the data
+    if urlpath is not None:
+        schunk = blosc2.open(urlpath)
+        check_stats(schunk, dtype)
+    schunk.remove_zonemap()
+    assert schunk.zonemap is None
+    schunk.update_data(0, np.ones(nitems, dtype=dtype), copy=True)
+    assert schunk.zonemap is None
+
+    with pytest.raises(TypeError):
+        schunk.create_zonemap(np.dtype("S4") if np.dtype(dtype).itemsize == 4 else np.complex64)
+    with pytest.raises(ValueError):
+        schunk.create_zonemap(np.int16)
+    blosc2.remove_urlpath(urlpath)
+
+
+@pytest.mark.parametrize("urlpath", [None, "b2frame"])
+def test_schunk_zonemap_lazy(monkeypatch, urlpath):
+    blosc2.remove_urlpath(urlpath)
+    nitems = 100
+    schunk = blosc2.SChunk(chunksize=nitems * 8, urlpath=urlpath, cparams={"typesize": 8})
+    schunk.create_zonemap(np.int64)
+    assert schunk.zonemap["stats"] == []
+    schunk.fill_special(10 * nitems, blosc2.SpecialValue.VALUE, 3)
+    check_stats(schunk, np.int64)
+
+    # Only the statistics of the chunks written are computed again
+    decompressed = []
+    decompress_chunk = blosc2.SChunk.decompress_chunk
+    monkeypatch.setattr(
+        blosc2.SChunk,
+        "decompress_chunk",
+        lambda self, nchunk, dst=None: decompressed.append(nchunk) or decompress_chunk(self, nchunk, dst),
+    )
+    for _ in range(3):
+        schunk.update_data(4, np.arange(nitems, dtype=np.int64), copy=True)
+    assert decompressed == [4, 4, 4]
+    # and they are not written to vlmeta on every write, but when flushed
+    assert schunk.vlmeta["_zonemap"] == {"dtype": "<i8", "dirty": True}
+    monkeypatch.undo()
+    schunk.flush_tracking()
+    if urlpath is not None:
+        schunk = blosc2.open(urlpath)
+    assert schunk.vlmeta["_zonemap"].keys() == {"dtype", "mins", "maxs", "nans"}
+    assert list(schunk.vlmeta) == []
+    check_stats(schunk, np.int64)
+
+    # A zone map left outdated (i.e. not flushed after writing) is computed again
+    schunk.vlmeta["_zonemap"] = {"dtype": "<i8", "dirty": True}
+    if urlpath is not None:
+        schunk = blosc2.open(urlpath)
+    else:
+        schunk._tracking = None
+    check_stats(schunk, np.int64)
+    blosc2.remove_urlpath(urlpath)